@@ -14,20 +14,29 @@ from dotenv import load_dotenv
 
 from func.find1557 import find1557
 from func.youtube_summary import check_youtube_link
-from util.db import close_db_pool, ensure_schema_ready, upsert_guild, upsert_user
+from util.db import (
+    close_db_pool,
+    ensure_schema_ready,
+    upsert_guild,
+    upsert_user,
+    upsert_users,
+)
 from util.env_utils import getenv_clean, sanitize_environment
+from util.health_counters import BotHealthCounters
 from util.logging_utils import configure_logging, user_error_message
+from util.message.cache import MessageCache
+from util.message.warmup import (
+    RecentMessageLoadStats,
+    kst_day_start,
+    warm_up_channel_history,
+)
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-MessagePart = dict[str, str | None]
-StoredMessage = dict[str, Any]
-UserMessages = dict[int, dict[str, list[StoredMessage]]]
 PartyList = dict[int, list[discord.CategoryChannel]]
 REQUIRED_COGS = frozenset({"cogs.status_api"})
-MAX_CACHED_MESSAGES_PER_AUTHOR = 100
 
 # Client 설정, 변수
 intents = discord.Intents.default()
@@ -36,8 +45,10 @@ intents.members = True
 intents.voice_states = True
 DISCORD_CLIENT = commands.Bot(command_prefix="/", intents=intents)
 DISCORD_CLIENT.remove_command("help")
-DISCORD_CLIENT.USER_MESSAGES: UserMessages = {}  # 길드별 -> 유저별 -> 메시지 리스트
+DISCORD_CLIENT.USER_MESSAGES = MessageCache()  # 길드별 -> 유저별 최근 메시지
 DISCORD_CLIENT.PARTY_LIST: PartyList = {}
+DISCORD_CLIENT.RECENT_MESSAGE_LOAD = None  # 시작 시 최근 메시지 적재 진행률
+DISCORD_CLIENT.HEALTH_COUNTERS = BotHealthCounters()  # /health용 길드·멤버 카운터
 _startup_completed = False
 
 # 환경 변수를 .env 파일에서 로딩
@@ -55,22 +66,23 @@ class RequiredCogLoadError(RuntimeError):
     """Raised when a startup-critical Cog cannot be loaded."""
 
 
-def append_cached_message(
-    guild_map: dict[str, list[StoredMessage]],
+def cache_message(
+    message: discord.Message,
     author_key: str,
-    message: StoredMessage,
     *,
-    limit: int = MAX_CACHED_MESSAGES_PER_AUTHOR,
+    text: str,
+    image_urls: tuple[str, ...],
 ) -> None:
-    """Append a message while keeping each author's in-memory history bounded."""
-    messages = guild_map.setdefault(author_key, [])
-    if not isinstance(messages, list):
-        messages = []
-        guild_map[author_key] = messages
-
-    messages.append(message)
-    if limit > 0 and len(messages) > limit:
-        del messages[:-limit]
+    """길드 메시지를 DISCORD_CLIENT.USER_MESSAGES 캐시에 넣는다."""
+    DISCORD_CLIENT.USER_MESSAGES.add(
+        message.guild.id,
+        author=author_key,
+        role="assistant" if message.author == DISCORD_CLIENT.user else "user",
+        text=text,
+        timestamp=message.created_at.timestamp(),
+        channel_id=getattr(getattr(message, "channel", None), "id", None),
+        image_urls=image_urls,
+    )
 
 
 async def check_youtube_link_safely(message: discord.Message) -> None:
@@ -261,6 +273,7 @@ async def update_db_info() -> None:
     try:
         await ensure_schema_ready()
 
+        members: list[tuple[int, str]] = []
         for guild in DISCORD_CLIENT.guilds:
             await upsert_guild(guild.id, guild.name)
 
@@ -268,12 +281,13 @@ async def update_db_info() -> None:
             if not guild.chunked:
                 await guild.chunk()
 
-            # 멤버 정보 업데이트
-            print(f"[{guild.name}] 멤버 {len(guild.members)}명 정보 업데이트...")
-            for member in guild.members:
-                # 유저의 닉네임(display_name) 사용
-                name = member.display_name
-                await upsert_user(member.id, name)
+            # 유저의 닉네임(display_name) 사용
+            print(f"[{guild.name}] 멤버 {len(guild.members)}명 정보 수집...")
+            members.extend((member.id, member.display_name) for member in guild.members)
+
+        # 전체 길드 멤버를 모아 변경된 행만 일괄 반영
+        written = await upsert_users(members)
+        print(f"멤버 {len(members)}명 중 {written}명 정보 갱신")
 
         print("---------------- DB 정보 업데이트 완료 ----------------\n")
     except Exception:
@@ -288,6 +302,9 @@ async def on_ready() -> None:
     """
     global _startup_completed
 
+    # 재연결 시 놓친 입퇴장 이벤트가 있을 수 있어 준비될 때마다 다시 맞춘다
+    DISCORD_CLIENT.HEALTH_COUNTERS.sync_guilds(DISCORD_CLIENT.guilds)
+
     if not _startup_completed:
         # 파티 목록 등 기타 초기화
         await load_variable()
@@ -325,12 +342,28 @@ async def on_member_join(member: discord.Member) -> None:
     """
     새로운 멤버 입장 시 DB 업데이트
     """
+    DISCORD_CLIENT.HEALTH_COUNTERS.member_joined(member.guild.id)
     try:
         await upsert_user(member.id, member.display_name)
     except Exception:
         logger.exception("[on_member_join 오류]")
 
 
+@DISCORD_CLIENT.event
+async def on_member_remove(member: discord.Member) -> None:
+    DISCORD_CLIENT.HEALTH_COUNTERS.member_left(member.guild.id)
+
+
+@DISCORD_CLIENT.event
+async def on_guild_join(guild: discord.Guild) -> None:
+    DISCORD_CLIENT.HEALTH_COUNTERS.guild_joined(guild)
+
+
+@DISCORD_CLIENT.event
+async def on_guild_remove(guild: discord.Guild) -> None:
+    DISCORD_CLIENT.HEALTH_COUNTERS.guild_left(guild.id)
+
+
 @DISCORD_CLIENT.event
 async def on_member_update(before: discord.Member, after: discord.Member) -> None:
     """
@@ -348,9 +381,6 @@ async def on_message(message: discord.Message) -> None:
     """
     일반 메시지 처리
     """
-    #! 현재 시간(서울 시간대 적용)으로 타임스탬프 생성
-    timestamp = message.created_at.astimezone(SEOUL_TZ).strftime("%Y-%m-%d %H:%M:%S")
-
     image_url = None
     # 이미지 첨부 확인
     if message.attachments:
@@ -378,60 +408,15 @@ async def on_message(message: discord.Message) -> None:
         # 길드 외(DM)는 길드별 로그에 포함하지 않음
         await DISCORD_CLIENT.process_commands(message)
         return
-    guild_id = message.guild.id
-    if guild_id not in DISCORD_CLIENT.USER_MESSAGES:
-        DISCORD_CLIENT.USER_MESSAGES[guild_id] = {}
-    guild_map = DISCORD_CLIENT.USER_MESSAGES[guild_id]
+    cache_message(
+        message,
+        author_key,
+        text=message.content or "",
+        image_urls=(image_url,) if image_url else (),
+    )
     #! 봇 메시지는 이하 명령 무시 / 단순 채팅 저장만
     if message.author == DISCORD_CLIENT.user:
-        append_cached_message(
-            guild_map,
-            author_key,
-            {
-                "author": author_key,
-                "role": "assistant",
-                "content": [
-                    {"type": "input_text", "text": message.content},
-                    {
-                        "type": "input_image",
-                        "image_url": image_url,
-                    },
-                ],
-                "time": timestamp,
-            },
-        )
         return  # client 스스로가 보낸 메세지는 무시
-    else:
-        if image_url:
-            append_cached_message(
-                guild_map,
-                author_key,
-                {
-                    "author": author_key,
-                    "role": "user",
-                    "content": [
-                        {"type": "input_text", "text": message.content},
-                        {
-                            "type": "input_image",
-                            "image_url": image_url,
-                        },
-                    ],
-                    "time": timestamp,
-                },
-            )
-        else:
-            append_cached_message(
-                guild_map,
-                author_key,
-                {
-                    "author": author_key,
-                    "role": "user",
-                    "content": [
-                        {"type": "input_text", "text": message.content},
-                    ],
-                    "time": timestamp,
-                },
-            )
 
     #! 유튜브 링크 처리
     await check_youtube_link_safely(message)
@@ -481,9 +466,43 @@ async def ping(ctx: commands.Context) -> None:
     await ctx.send(f"퐁! Latency is {DISCORD_CLIENT.latency}")
 
 
+def _history_author_key(message: discord.Message) -> str:
+    # 작성자 키(닉 우선)
+    if isinstance(message.author, discord.Member):
+        return message.author.nick or message.author.name
+    return message.author.name
+
+
+def _is_image_attachment(att: discord.Attachment) -> bool:
+    try:
+        if getattr(att, "content_type", None):
+            return str(att.content_type).lower().startswith("image/")
+    except Exception:
+        logger.debug("attachment content_type check failed", exc_info=True)
+    name = (getattr(att, "filename", "") or "").lower()
+    return name.endswith((".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp"))
+
+
+def cache_history_message(message: discord.Message) -> None:
+    """channel.history로 읽은 메시지를 캐시에 넣는다."""
+    image_urls: list[str] = []
+    for att in getattr(message, "attachments", []):
+        if _is_image_attachment(att):
+            url = getattr(att, "url", None) or getattr(att, "proxy_url", None)
+            if url:
+                image_urls.append(url)
+
+    cache_message(
+        message,
+        _history_author_key(message),
+        text=(message.content or "").strip(),
+        image_urls=tuple(image_urls),
+    )
+
+
 async def load_recent_messages(guild_id: int | None = None) -> None:
     print("------------------- 메시지 로드 -------------------")
-    today = datetime.now(SEOUL_TZ).date()
+    since = kst_day_start(datetime.now(SEOUL_TZ))
 
     # 길드별 순회 (특정 길드만 요청 시 해당 길드만)
     guilds = (
@@ -491,96 +510,39 @@ async def load_recent_messages(guild_id: int | None = None) -> None:
         if guild_id is not None
         else list(DISCORD_CLIENT.guilds)
     )
-    for guild in guilds:
-        # 길드 맵 준비
-        if guild.id not in DISCORD_CLIENT.USER_MESSAGES:
-            DISCORD_CLIENT.USER_MESSAGES[guild.id] = {}
-
-        # 해당 길드의 텍스트 채널 전체 순회 (필요시 특정 채널만 보려면 필터링)
-        for channel in guild.text_channels:
-            try:
-                async for message in channel.history(limit=100):
-                    # 날짜 필터(오늘)
-                    message_kst = message.created_at.astimezone(SEOUL_TZ)
-                    message_timestamp = message_kst.strftime("%Y-%m-%d %H:%M:%S")
-                    if message_kst.date() != today:
-                        continue
-
-                    # 작성자 키(닉 우선)
-                    if isinstance(message.author, discord.Member):
-                        author_key = message.author.nick or message.author.name
-                    else:
-                        author_key = message.author.name
-
-                    guild_map = DISCORD_CLIENT.USER_MESSAGES[guild.id]
-                    # content 파츠 구성
-                    parts: list[MessagePart] = []
-                    text = (message.content or "").strip()
-                    if text:
-                        parts.append({"type": "input_text", "text": text})
-
-                    def _is_image(att: discord.Attachment) -> bool:
-                        try:
-                            if getattr(att, "content_type", None):
-                                return (
-                                    str(att.content_type).lower().startswith("image/")
-                                )
-                        except Exception:
-                            logger.debug("attachment content_type check failed", exc_info=True)
-                        name = (getattr(att, "filename", "") or "").lower()
-                        return name.endswith(
-                            (".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp")
-                        )
-
-                    for att in getattr(message, "attachments", []):
-                        if _is_image(att):
-                            url = getattr(att, "url", None) or getattr(
-                                att, "proxy_url", None
-                            )
-                            if url:
-                                parts.append({"type": "input_image", "image_url": url})
-
-                    role = (
-                        "assistant" if message.author == DISCORD_CLIENT.user else "user"
-                    )
-                    append_cached_message(
-                        guild_map,
-                        author_key,
-                        {
-                            "author": author_key,
-                            "role": role,
-                            "content": (
-                                parts if parts else [{"type": "input_text", "text": ""}]
-                            ),
-                            "time": message_timestamp,
-                        },
-                    )
-            except Exception:
-                # 채널 접근 권한 없음 등은 무시
-                logger.debug(
-                    "recent message load skipped channel: guild=%s channel=%s",
-                    guild.id,
-                    getattr(channel, "id", None),
-                    exc_info=True,
-                )
-                continue
+    loaded: dict[int, list[discord.Message]] = {guild.id: [] for guild in guilds}
 
-        # 작성자별 오래된→최신 정렬
-        for author in DISCORD_CLIENT.USER_MESSAGES[guild.id].keys():
-            DISCORD_CLIENT.USER_MESSAGES[guild.id][author] = list(
-                reversed(DISCORD_CLIENT.USER_MESSAGES[guild.id][author])
-            )
+    def _collect(channel: discord.TextChannel, messages: list[discord.Message]) -> None:
+        loaded[channel.guild.id].extend(messages)
+
+    # 진행률을 /health에서 볼 수 있도록 적재 전에 먼저 공개하고 제자리에서 갱신한다
+    stats = RecentMessageLoadStats()
+    DISCORD_CLIENT.RECENT_MESSAGE_LOAD = stats
+
+    # 모든 길드의 텍스트 채널을 제한된 동시성으로 읽는다
+    await warm_up_channel_history(
+        [channel for guild in guilds for channel in guild.text_channels],
+        since=since,
+        handle_messages=_collect,
+        stats=stats,
+    )
+
+    for guild in guilds:
+        # 채널을 합쳐 오래된→최신 순으로 넣어야 작성자별 상한이 최신 메시지를 남긴다
+        for message in sorted(loaded[guild.id], key=lambda m: m.created_at):
+            cache_history_message(message)
 
-        message_count = sum(
-            len(messages) for messages in DISCORD_CLIENT.USER_MESSAGES[guild.id].values()
-        )
         logger.debug(
             "recent messages loaded: guild_id=%s authors=%s messages=%s",
             guild.id,
-            len(DISCORD_CLIENT.USER_MESSAGES[guild.id]),
-            message_count,
+            len(DISCORD_CLIENT.USER_MESSAGES.authors(guild.id)),
+            DISCORD_CLIENT.USER_MESSAGES.guild_message_count(guild.id),
         )
 
+    print(
+        f"채널 {stats.channels_total}개에서 메시지 {stats.messages}개 로드 "
+        f"({stats.duration_s:.2f}초)"
+    )
     print("---------------------------------------------------\n")
 
 
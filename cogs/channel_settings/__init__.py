@@ -4,6 +4,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from util.earthquake.alert_cache import invalidate_earthquake_alert_cache
 from util.earthquake.state import delete_earthquake_alert_state
 from util.guild.channel_settings import get_settings_for_guild, set_channel
 
@@ -90,6 +91,7 @@ class ChannelSettings(commands.Cog):
         guild_id = int(interaction.guild_id)
         await set_channel(guild_id, purpose.value, channel.id if channel else None)
         if purpose.value == "earthquake_alert":
+            invalidate_earthquake_alert_cache(guild_id)
             await delete_earthquake_alert_state(guild_id)
 
         action = "해제" if channel is None else "설정"
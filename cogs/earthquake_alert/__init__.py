@@ -4,6 +4,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
+from util.earthquake.alert_cache import invalidate_earthquake_alert_cache
 from util.earthquake.alerts import EARTHQUAKE_ALERT_CHANNEL_TYPE
 from util.earthquake.state import delete_earthquake_alert_state
 from util.guild.channel_settings import set_channel
@@ -57,6 +58,7 @@ class EarthquakeAlertCommands(commands.Cog):
         guild_id = int(interaction.guild_id)
         if not status:
             await set_channel(guild_id, EARTHQUAKE_ALERT_CHANNEL_TYPE, None)
+            invalidate_earthquake_alert_cache(guild_id)
             await delete_earthquake_alert_state(guild_id)
             await interaction.response.send_message(
                 "일본 지진 알림을 해제했습니다.",
@@ -78,6 +80,7 @@ class EarthquakeAlertCommands(commands.Cog):
             EARTHQUAKE_ALERT_CHANNEL_TYPE,
             channel_id,
         )
+        invalidate_earthquake_alert_cache(guild_id)
         await delete_earthquake_alert_state(guild_id)
         await interaction.followup.send(
             "일본 지진 알림을 설정했습니다.\n"
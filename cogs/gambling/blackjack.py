@@ -9,7 +9,7 @@ import discord
 
 from common.discord_ui import SafeView
 from .constants import BET_AMOUNT_REQUIRED, SEOUL_TZ
-from .services import BalanceService
+from .services import BalanceService, BalanceUpdate
 
 
 SUITS = ["♠", "♥", "♦", "♣"]
@@ -247,15 +247,12 @@ class BlackjackView(SafeView):
                 "지금은 더블다운을 할 수 없습니다.", ephemeral=True
             )
             return
-        # 추가 베팅 가능 여부 확인
-        current = await self.balance.get_balance(self.guild_id, self.user_id)
-        if current < self.base_bet:
+        # 추가 베팅 차감 및 한 장만 받고 바로 스탠드
+        if not (await self._reserve_bet(self.base_bet)).applied:
             await interaction.response.send_message(
                 "❌ 잔액이 부족하여 더블다운을 할 수 없습니다.", ephemeral=True
             )
             return
-        # 추가 베팅 차감 및 한 장만 받고 바로 스탠드
-        await self._reserve_bet(self.base_bet)
         self.current_bet += self.base_bet
         self.can_double = False
         self.player.append(self._draw())
@@ -274,8 +271,7 @@ class BlackjackView(SafeView):
             )
             return
         # 동일 배팅금액으로 남은 덱으로 새 라운드 시작
-        current = await self.balance.get_balance(self.guild_id, self.user_id)
-        if current < self.base_bet:
+        if not (await self._reserve_bet(self.base_bet)).applied:
             await interaction.response.send_message(
                 "❌ 잔액 부족으로 다시 시작할 수 없습니다.", ephemeral=True
             )
@@ -295,7 +291,6 @@ class BlackjackView(SafeView):
         self.current_bet = self.base_bet
         self.can_double = True
 
-        await self._reserve_bet(self.current_bet)
         self._initial_deal()
 
         # 버튼들 상태 복구
@@ -318,18 +313,21 @@ class BlackjackView(SafeView):
         self.player.append(self._draw())
         self.dealer.append(self._draw())
 
-    async def start(self) -> None:
-        await self._reserve_bet(self.current_bet)
-        self._initial_deal()
+    async def start(self) -> BalanceUpdate:
+        """첫 배팅을 차감하고 카드를 나눈다. 차감하지 못하면 현재 잔액만 돌려준다."""
+        bet = await self._reserve_bet(self.current_bet)
+        if bet.applied:
+            self._initial_deal()
+        return bet
 
     def _draw(self) -> Card:
         if not self.deck:
             self.deck = build_deck(self.num_decks)
         return self.deck.pop()
 
-    async def _reserve_bet(self, amount: int) -> None:
-        current = await self.balance.get_balance(self.guild_id, self.user_id)
-        await self.balance.set_balance(self.guild_id, self.user_id, current - amount)
+    async def _reserve_bet(self, amount: int) -> BalanceUpdate:
+        """잔액 확인과 차감을 한 번에 처리한다. 잔액이 부족하면 applied가 False다."""
+        return await self.balance.decrement_balance(self.guild_id, self.user_id, amount)
 
     async def _dealer_play(self) -> None:
         # 딜러는 17 이상이 되기 전까지 카드를 받는다 (Soft 17에서는 정지)
@@ -363,8 +361,8 @@ class BlackjackView(SafeView):
         await self.balance.add_blackjack_result(self.guild_id, self.user_id, record)
 
         # 정산 반영
-        current = await self.balance.get_balance(self.guild_id, self.user_id)
-        await self.balance.set_balance(self.guild_id, self.user_id, current + prize)
+        if prize:
+            await self.balance.increment_balance(self.guild_id, self.user_id, prize)
 
         await interaction.response.edit_message(
             embed=await self._build_embed(
@@ -514,12 +512,6 @@ async def run_blackjack(
     if bet_amount <= 0:
         await interaction.response.send_message(BET_AMOUNT_REQUIRED, ephemeral=True)
         return
-    current = await balance.get_balance(guild_id, user_id)
-    if current < bet_amount:
-        await interaction.response.send_message(
-            f"❌ 잔액 부족 (현재 {current:,}원)", ephemeral=True
-        )
-        return
 
     view = BlackjackView(
         balance=balance,
@@ -528,7 +520,12 @@ async def run_blackjack(
         bet_amount=bet_amount,
         num_decks=1,
     )
-    await view.start()
+    bet = await view.start()
+    if not bet.applied:
+        await interaction.response.send_message(
+            f"❌ 잔액 부족 (현재 {bet.balance:,}원)", ephemeral=True
+        )
+        return
 
     await interaction.response.send_message(
         embed=await view._build_embed(reveal_dealer=False), view=view
@@ -81,8 +81,7 @@ class WeeklyLotteryView(SafeView):
         if prize > 0:
             button.label = f"🎉 {prize:,}원!"
             button.style = discord.ButtonStyle.success
-            current = self._balance.get_balance(self.guild_id, str(user_id))
-            self._balance.set_balance(self.guild_id, str(user_id), current + prize)
+            await self._balance.increment_balance(self.guild_id, str(user_id), prize)
             await interaction.response.send_message(
                 f"🎉 축하합니다! {prize:,}원을 획득했습니다!", ephemeral=True
             )
@@ -19,21 +19,19 @@ async def show_ranking(
         return
 
     guild_id = str(guild.id)
-    balances = await balance.get_guild_balances(guild_id)
+    balances = await balance.get_guild_balances(guild_id, limit=limit)
     if not balances:
         await interaction.response.send_message(
             "💤 아직 잔액 데이터가 없습니다. /돈줘 로 시작해보세요!", ephemeral=True
         )
         return
 
-    sorted_entries = sorted(
-        balances.items(), key=lambda kv: kv[1].get("balance", 0), reverse=True
-    )
     requester_id = str(interaction.user.id)
+    standing = await balance.get_balance_rank(guild_id, requester_id)
 
     lines = []
-    requester_rank = None
-    for idx, (user_id, info) in enumerate(sorted_entries, start=1):
+    requester_rank = standing.rank
+    for idx, (user_id, info) in enumerate(balances.items(), start=1):
         balance_value = info.get("balance", 0)
         member = guild.get_member(int(user_id)) if user_id.isdigit() else None
         display_name = member.display_name if member else f"<@{user_id}>"
@@ -45,13 +43,13 @@ async def show_ranking(
 
     embed = discord.Embed(
         title="💎 길드 자산 순위",
-        description="\n".join(lines[:limit]),
+        description="\n".join(lines),
         color=0x1ABC9C,
     )
     footer = (
-        f"총 {len(sorted_entries)}명 | 내 순위: {requester_rank}위"
+        f"총 {standing.total}명 | 내 순위: {requester_rank}위"
         if requester_rank
-        else f"총 {len(sorted_entries)}명 | 순위 정보 없음"
+        else f"총 {standing.total}명 | 순위 정보 없음"
     )
     embed.set_footer(text=footer)
 
@@ -1,11 +1,33 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Dict, Tuple
 from datetime import datetime
-from util.db import execute_query, fetch_one, fetch_all
+from util.db import db_transaction, execute_query, fetch_one, fetch_all
 from .constants import SEOUL_TZ
 
 
+@dataclass(frozen=True, slots=True)
+class BalanceUpdate:
+    """applied가 False면 잔액이 부족해 아무것도 바뀌지 않았고 balance는 현재 잔액이다."""
+
+    applied: bool
+    balance: int
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceRank:
+    rank: int | None
+    total: int
+
+
+@dataclass(frozen=True, slots=True)
+class TransferResult:
+    applied: bool
+    sender_balance: int
+    receiver_balance: int
+
+
 class BalanceService:
     """MySQL based balance/stats storage helper."""
 
@@ -26,6 +48,87 @@ class BalanceService:
         """
         await execute_query(query, (int(guild_id), int(user_id), amount))
 
+    async def increment_balance(self, guild_id: str, user_id: str, amount: int) -> int:
+        """잔액에 amount를 더하고 바뀐 잔액을 돌려준다. 행이 없으면 만든다."""
+        async with db_transaction() as tx:
+            await tx.execute(
+                """
+                INSERT INTO gambling_balances (guild_id, user_id, balance) VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE balance = balance + VALUES(balance)
+                """,
+                (int(guild_id), int(user_id), amount),
+            )
+            row = await tx.fetch_one(
+                "SELECT balance FROM gambling_balances WHERE guild_id = %s AND user_id = %s",
+                (int(guild_id), int(user_id)),
+            )
+        return row["balance"] if row else amount
+
+    async def decrement_balance(
+        self,
+        guild_id: str,
+        user_id: str,
+        amount: int,
+        *,
+        floor: int = 0,
+    ) -> BalanceUpdate:
+        """차감 후 잔액이 floor 이상일 때만 amount를 뺀다. 확인과 차감은 한 UPDATE로 처리한다."""
+        async with db_transaction() as tx:
+            await tx.execute(
+                """
+                UPDATE gambling_balances SET balance = balance - %s
+                WHERE guild_id = %s AND user_id = %s AND balance - %s >= %s
+                """,
+                (amount, int(guild_id), int(user_id), amount, floor),
+            )
+            applied = tx.rowcount == 1
+            row = await tx.fetch_one(
+                "SELECT balance FROM gambling_balances WHERE guild_id = %s AND user_id = %s",
+                (int(guild_id), int(user_id)),
+            )
+        return BalanceUpdate(applied, row["balance"] if row else 0)
+
+    async def transfer_balance(
+        self,
+        guild_id: str,
+        sender_id: str,
+        receiver_id: str,
+        amount: int,
+        *,
+        floor: int = 0,
+    ) -> TransferResult:
+        """보낸 사람 잔액이 floor 아래로 내려가지 않을 때만 한 트랜잭션에서 옮긴다."""
+        sender, receiver = int(sender_id), int(receiver_id)
+        async with db_transaction() as tx:
+            # 맞송금이 교착되지 않도록 두 행을 항상 user_id 순서로 잠근다
+            rows = await tx.fetch_all(
+                """
+                SELECT user_id, balance FROM gambling_balances
+                WHERE guild_id = %s AND user_id IN (%s, %s)
+                ORDER BY user_id FOR UPDATE
+                """,
+                (int(guild_id), sender, receiver),
+            )
+            balances = {int(row["user_id"]): row["balance"] for row in rows}
+            sender_balance = balances.get(sender, 0)
+            receiver_balance = balances.get(receiver, 0)
+            if sender_balance - amount < floor:
+                return TransferResult(False, sender_balance, receiver_balance)
+
+            await tx.execute(
+                "UPDATE gambling_balances SET balance = balance - %s "
+                "WHERE guild_id = %s AND user_id = %s",
+                (amount, int(guild_id), sender),
+            )
+            await tx.execute(
+                """
+                INSERT INTO gambling_balances (guild_id, user_id, balance) VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE balance = balance + VALUES(balance)
+                """,
+                (int(guild_id), receiver, amount),
+            )
+        return TransferResult(True, sender_balance - amount, receiver_balance + amount)
+
     async def add_result(self, guild_id: str, user_id: str, is_win: bool) -> None:
         col = "wins" if is_win else "losses"
         query = f"""
@@ -64,13 +167,23 @@ class BalanceService:
         today = datetime.now(SEOUL_TZ).date().isoformat()
         return last != today
 
-    async def get_guild_balances(self, guild_id: str) -> Dict[str, dict]:
-        # Needed for ranking
-        query = "SELECT * FROM gambling_balances WHERE guild_id = %s"
-        rows = await fetch_all(query, (int(guild_id),))
+    async def get_guild_balances(
+        self, guild_id: str, *, limit: int | None = None
+    ) -> Dict[str, dict]:
+        """잔액 내림차순으로 정렬된 길드 잔액. limit을 주면 상위 limit명만 읽는다."""
+        query = (
+            "SELECT user_id, balance, wins, losses, bj_wins, bj_losses, bj_pushes "
+            "FROM gambling_balances WHERE guild_id = %s "
+            "ORDER BY balance DESC, user_id"
+        )
+        args: tuple = (int(guild_id),)
+        if limit is not None:
+            query += " LIMIT %s"
+            args += (int(limit),)
+        rows = await fetch_all(query, args)
         result = {}
         for row in rows:
-            uid = row["user_id"]
+            uid = str(row["user_id"])
             result[uid] = {
                 "balance": row["balance"],
                 "wins": row["wins"],
@@ -81,6 +194,28 @@ class BalanceService:
             }
         return result
 
+    async def get_balance_rank(self, guild_id: str, user_id: str) -> BalanceRank:
+        """내 잔액보다 많은 사람 수를 세어 순위를 구한다. 행이 없으면 rank는 None."""
+        row = await fetch_one(
+            """
+            SELECT
+                (SELECT balance FROM gambling_balances
+                 WHERE guild_id = %s AND user_id = %s) AS balance,
+                (SELECT COUNT(*) FROM gambling_balances WHERE guild_id = %s) AS total
+            """,
+            (int(guild_id), int(user_id), int(guild_id)),
+        )
+        total = int(row["total"]) if row else 0
+        if not row or row["balance"] is None:
+            return BalanceRank(None, total)
+
+        higher = await fetch_one(
+            "SELECT COUNT(*) AS higher FROM gambling_balances "
+            "WHERE guild_id = %s AND balance > %s",
+            (int(guild_id), row["balance"]),
+        )
+        return BalanceRank(int(higher["higher"]) + 1 if higher else 1, total)
+
     # ----- Blackjack specific API -----
     async def add_blackjack_result(
         self, guild_id: str, user_id: str, outcome: str
@@ -83,7 +83,7 @@ class SlotMachineView(SafeView):
             return
         self._busy = True
         try:
-            embed, _ = self._spin(interaction)
+            embed, _ = await self._spin(interaction)
             # 버튼은 유지하여 같은 임베드에서 계속 플레이 가능
             if interaction.response.is_done():
                 await interaction.followup.edit_message(message_id=self.message.id, embed=embed, view=self)  # type: ignore[arg-type]
@@ -93,12 +93,14 @@ class SlotMachineView(SafeView):
         finally:
             self._busy = False
 
-    def _spin(self, interaction: discord.Interaction) -> tuple[discord.Embed, bool]:
-        current = self.balance.get_balance(self.guild_id, self.user_id)
-        if current < self.bet_amount:
+    async def _spin(self, interaction: discord.Interaction) -> tuple[discord.Embed, bool]:
+        bet = await self.balance.decrement_balance(
+            self.guild_id, self.user_id, self.bet_amount
+        )
+        if not bet.applied:
             embed = _build_insufficient_embed(
                 interaction=interaction,
-                current_balance=current,
+                current_balance=bet.balance,
                 bet_amount=self.bet_amount,
             )
             return embed, True
@@ -108,11 +110,14 @@ class SlotMachineView(SafeView):
         symbol = spins[0] if is_win else None
         multiplier = MULTIPLIER_MAP.get(symbol, 0) if symbol else 0
         prize = self.bet_amount * multiplier if is_win else 0
-        final_balance = current - self.bet_amount + prize
+        final_balance = bet.balance
+        if prize:
+            final_balance = await self.balance.increment_balance(
+                self.guild_id, self.user_id, prize
+            )
 
-        self.balance.set_balance(self.guild_id, self.user_id, final_balance)
-        self.balance.add_result(self.guild_id, self.user_id, is_win)
-        wins, losses, rate = self.balance.get_stats(self.guild_id, self.user_id)
+        await self.balance.add_result(self.guild_id, self.user_id, is_win)
+        wins, losses, rate = await self.balance.get_stats(self.guild_id, self.user_id)
 
         embed = _build_result_embed(
             interaction=interaction,
@@ -142,7 +147,7 @@ async def run_slot_machine(
         await interaction.response.send_message(BET_AMOUNT_REQUIRED, ephemeral=True)
         return
 
-    current = balance.get_balance(guild_id, user_id)
+    current = await balance.get_balance(guild_id, user_id)
     if current < bet_amount:
         await interaction.response.send_message(
             f"❌ 잔액 부족 (현재 {current:,}원)", ephemeral=True
@@ -68,8 +68,7 @@ class SprinkleView(SafeView):
             amount = self.parts.pop()
             self.claimed_users.add(user_id)
 
-            current = self._balance.get_balance(self.guild_id, user_id)
-            self._balance.set_balance(self.guild_id, user_id, current + amount)
+            await self._balance.increment_balance(self.guild_id, user_id, amount)
 
             await interaction.response.send_message(
                 f"✅ {interaction.user.mention} 님이 {amount:,}원을 수령했습니다!",
@@ -89,9 +88,8 @@ class SprinkleView(SafeView):
     async def on_timeout(self) -> None:
         remaining = sum(self.parts)
         if remaining > 0:
-            sender_bal = self._balance.get_balance(self.guild_id, str(self.sender.id))
-            self._balance.set_balance(
-                self.guild_id, str(self.sender.id), sender_bal + remaining
+            await self._balance.increment_balance(
+                self.guild_id, str(self.sender.id), remaining
             )
         for child in self.children:
             if isinstance(child, discord.ui.Button):
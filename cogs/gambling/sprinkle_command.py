@@ -39,15 +39,13 @@ async def run_sprinkle(
         )
         return
 
-    sender_balance = balance.get_balance(guild_id, sender_id)
-    if sender_balance < total_amount:
+    withdrawal = await balance.decrement_balance(guild_id, sender_id, total_amount)
+    if not withdrawal.applied:
         await interaction.response.send_message(
-            f"❌ 잔액 부족 (현재 {sender_balance:,}원)", ephemeral=True
+            f"❌ 잔액 부족 (현재 {withdrawal.balance:,}원)", ephemeral=True
         )
         return
 
-    balance.set_balance(guild_id, sender_id, sender_balance - total_amount)
-
     parts = _split_amount_randomly(total_amount, people)
     embed = build_sprinkle_embed(interaction.user, total_amount, people)
     view = SprinkleView(
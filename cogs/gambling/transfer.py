@@ -32,17 +32,13 @@ async def execute_transfer(
         )
         return
 
-    sender_balance = await balance.get_balance(guild_id, sender_id)
-    if sender_balance < amount:
+    result = await balance.transfer_balance(guild_id, sender_id, receiver_id, amount)
+    if not result.applied:
         await interaction.response.send_message(
-            f"❌ 잔액 부족 (현재 {sender_balance:,}원)", ephemeral=True
+            f"❌ 잔액 부족 (현재 {result.sender_balance:,}원)", ephemeral=True
         )
         return
 
-    receiver_balance = await balance.get_balance(guild_id, receiver_id)
-    await balance.set_balance(guild_id, sender_id, sender_balance - amount)
-    await balance.set_balance(guild_id, receiver_id, receiver_balance + amount)
-
     embed = discord.Embed(
         title="💸 송금 완료",
         description=f"{interaction.user.mention} → {target_member.mention}",
@@ -50,10 +46,10 @@ async def execute_transfer(
     )
     embed.add_field(name="송금 금액", value=f"{amount:,}원", inline=False)
     embed.add_field(
-        name="보낸 사람 잔액", value=f"{sender_balance - amount:,}원", inline=True
+        name="보낸 사람 잔액", value=f"{result.sender_balance:,}원", inline=True
     )
     embed.add_field(
-        name="받은 사람 잔액", value=f"{receiver_balance + amount:,}원", inline=True
+        name="받은 사람 잔액", value=f"{result.receiver_balance:,}원", inline=True
     )
 
     await interaction.response.send_message(embed=embed)
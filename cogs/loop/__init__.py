@@ -12,17 +12,24 @@ from bot import (
     load_recent_messages,
 )
 from util.codex_resets.loop_runner import run_codex_reset_notification_loop
+from util.earthquake.map_image import (
+    close_earthquake_map_cache,
+    prewarm_japan_map_tiles,
+)
 from util.earthquake.stream import run_jma_eew_stream
+from util.earthquake.translation import load_earthquake_translation_cache
 from util.loop.daily_refresh_runner import run_daily_refreshes
 from util.env_utils import getenv_clean
+from util.health_counters import get_health_counters
 from util.loop.task_lifecycle import cancel_loop_tasks, start_loop_tasks
 from util.maplestory.notice_loop_runner import run_maplestory_notice_loop
 from util.loop.presence_status import build_presence_activity_name
 from util.loop.weekly_1557_reporter import run_weekly_1557_report
-from util.youtube.community_polling import poll_youtube_community_posts
+from util.youtube.community_polling import poll_youtube_channel_community_posts
 from util.youtube.feed_fallback import (
     YouTubeFeedFallbackState,
-    poll_youtube_feed_fallback,
+    create_youtube_feed_session,
+    poll_youtube_channel_feed_fallback,
 )
 from util.youtube.notification_sender import (
     send_youtube_live_notification,
@@ -44,17 +51,25 @@ from util.youtube.loop_runner import (
     run_youtube_community_posts,
     run_youtube_notification_candidates,
 )
-from util.youtube.video_status import fetch_youtube_video_status
+from util.youtube.video_status import (
+    fetch_youtube_video_status,
+    fetch_youtube_video_statuses,
+)
 from util.youtube.websub_notification import (
-    handle_youtube_websub_notification,
+    handle_youtube_websub_entry,
 )
+from util.youtube.websub_queue import YouTubeWebSubQueue
 from util.youtube.websub_renewal import run_youtube_websub_renewal
 from util.youtube.websub_subscription import (
     build_configured_youtube_websub_callback_url,
     ensure_youtube_websub_subscription,
     unsubscribe_youtube_websub_subscription,
 )
-from util.youtube.video_candidate_runner import process_youtube_video_candidate
+from util.youtube.video_candidate_runner import (
+    YouTubeVideoCandidateResult,
+    process_youtube_video_candidate,
+    resolve_youtube_video_candidate,
+)
 
 
 YOUTUBE_PENDING_CHECK_INTERVAL_SECONDS = 300
@@ -71,6 +86,7 @@ LOOP_TASK_NAMES = (
     "maplestory_notice_check",
     "codex_reset_notification_check",
     "jma_eew_stream",
+    "earthquake_map_prewarm",
     "youtube_websub_renewal",
 )
 logger = logging.getLogger(__name__)
@@ -83,7 +99,10 @@ class LoopTasks(commands.Cog):
         self._youtube = build("youtube", "v3", developerKey=api_key)
         self._legacy_youtube_setting_removed = False
         self._youtube_feed_fallback = YouTubeFeedFallbackState()
+        self._youtube_feed_session: aiohttp.ClientSession | None = None
+        self._youtube_websub_queue = YouTubeWebSubQueue(self._handle_youtube_websub_entry)
         start_loop_tasks(self, LOOP_TASK_NAMES)
+        get_health_counters(bot).register_loop_tasks(self, LOOP_TASK_NAMES)
         print("LoopTasks Cog : init 완료!")
 
     @commands.Cog.listener()
@@ -91,8 +110,14 @@ class LoopTasks(commands.Cog):
         """봇이 준비되었을 때 호출됩니다."""
         print("DISCORD_CLIENT -> LoopTasks Cog : on ready!")
 
-    def cog_unload(self):
+    async def cog_unload(self):
         cancel_loop_tasks(self, LOOP_TASK_NAMES)
+        self._youtube_websub_queue.cancel()
+        get_health_counters(self.bot).unregister_loop_tasks(LOOP_TASK_NAMES)
+        if self._youtube_feed_session is not None:
+            await self._youtube_feed_session.close()
+            self._youtube_feed_session = None
+        await close_earthquake_map_cache()
 
     @tasks.loop(seconds=60)
     async def presence_update_task(self):
@@ -162,6 +187,9 @@ class LoopTasks(commands.Cog):
     async def _fetch_youtube_video_status(self, video_id: str):
         return await fetch_youtube_video_status(self._youtube, video_id)
 
+    async def _fetch_youtube_video_statuses(self, video_ids):
+        return await fetch_youtube_video_statuses(self._youtube, video_ids)
+
     def _get_notified_video_ids(self, subscription: YouTubeSubscription) -> set[str]:
         return notified_id_set(subscription.notified_video_ids)
 
@@ -171,16 +199,22 @@ class LoopTasks(commands.Cog):
     ) -> set[str]:
         return notified_id_set(subscription.notified_upload_video_ids)
 
-    async def _poll_youtube_feed_fallback(
+    def _get_youtube_feed_session(self) -> aiohttp.ClientSession:
+        if self._youtube_feed_session is None or self._youtube_feed_session.closed:
+            self._youtube_feed_session = create_youtube_feed_session()
+        return self._youtube_feed_session
+
+    async def _poll_youtube_channel_feed_fallback(
         self,
-        subscription: YouTubeSubscription,
+        subscriptions: list[YouTubeSubscription],
         session: aiohttp.ClientSession,
-    ) -> YouTubeSubscription | None:
-        return await poll_youtube_feed_fallback(
-            self._process_youtube_video_candidate,
+    ) -> list[YouTubeSubscription]:
+        return await poll_youtube_channel_feed_fallback(
+            self._resolve_youtube_video_candidate,
             self._youtube_feed_fallback,
-            subscription,
+            subscriptions,
             session,
+            fetch_video_statuses=self._fetch_youtube_video_statuses,
             interval_seconds=YOUTUBE_FEED_FALLBACK_INTERVAL_SECONDS,
             max_entries=YOUTUBE_FEED_FALLBACK_MAX_ENTRIES,
         )
@@ -231,19 +265,45 @@ class LoopTasks(commands.Cog):
         self,
         subscription: YouTubeSubscription,
         video_id: str,
+        *,
+        known_statuses=None,
     ) -> str:
-        return await process_youtube_video_candidate(self, subscription, video_id)
+        return await process_youtube_video_candidate(
+            self,
+            subscription,
+            video_id,
+            known_statuses=known_statuses,
+        )
 
-    async def _poll_youtube_community_posts(
+    async def _resolve_youtube_video_candidate(
         self,
         subscription: YouTubeSubscription,
-    ) -> YouTubeSubscription:
-        return await poll_youtube_community_posts(self.bot, subscription)
+        video_id: str,
+        *,
+        known_statuses=None,
+    ) -> YouTubeVideoCandidateResult:
+        return await resolve_youtube_video_candidate(
+            self,
+            subscription,
+            video_id,
+            known_statuses=known_statuses,
+        )
+
+    async def _poll_youtube_channel_community_posts(
+        self,
+        subscriptions: list[YouTubeSubscription],
+    ) -> list[YouTubeSubscription]:
+        return await poll_youtube_channel_community_posts(self.bot, subscriptions)
+
+    def enqueue_youtube_websub_notification(self, atom_xml: str) -> dict:
+        """WebSub 본문을 큐에 넣고 바로 돌아온다. 실제 처리는 워커가 맡는다."""
+        return self._youtube_websub_queue.enqueue(atom_xml)
 
-    async def handle_youtube_websub_notification(self, atom_xml: str) -> dict:
-        return await handle_youtube_websub_notification(
-            atom_xml,
+    async def _handle_youtube_websub_entry(self, entry) -> None:
+        await handle_youtube_websub_entry(
+            entry,
             process_video_candidate=self._process_youtube_video_candidate,
+            fetch_video_statuses=self._fetch_youtube_video_statuses,
         )
 
     def _should_check_pending_youtube_video(self, pending_entry: dict) -> bool:
@@ -294,6 +354,15 @@ class LoopTasks(commands.Cog):
         except Exception:
             logger.exception("일본 JMA EEW 스트림 오류")
 
+    @tasks.loop(hours=6)
+    async def earthquake_map_prewarm(self):
+        """속보가 없을 때 일본 주변 지진 지도 타일을 미리 받아 둡니다."""
+        try:
+            loaded = await prewarm_japan_map_tiles()
+            logger.info("지진 지도 타일 미리 받기 완료: %s개", loaded)
+        except Exception:
+            logger.exception("지진 지도 타일 미리 받기 오류")
+
     @tasks.loop(hours=12)
     async def youtube_websub_renewal(self):
         """YouTube WebSub 구독을 주기적으로 갱신합니다."""
@@ -326,6 +395,12 @@ class LoopTasks(commands.Cog):
     async def before_jma_eew_stream(self):
         print("-------------일본 JMA EEW 스트림 대기중...---------------")
         await self.bot.wait_until_ready()
+        await load_earthquake_translation_cache()
+
+    @earthquake_map_prewarm.before_loop
+    async def before_earthquake_map_prewarm(self):
+        print("-------------지진 지도 타일 미리 받기 대기중...---------------")
+        await self.bot.wait_until_ready()
 
     @youtube_websub_renewal.before_loop
     async def before_youtube_websub_renewal(self):
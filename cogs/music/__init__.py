@@ -42,6 +42,7 @@ from util.music.embeds import (
     UNKNOWN,
     make_default_music_embed,
     make_playing_music_embed,
+    music_embed_fingerprint,
 )
 from util.music.queue import (
     QueuedTrack,
@@ -88,6 +89,21 @@ from util.music.playback import (
     prepare_music_player,
     prepare_replay_source,
 )
+from util.music.panel_refresh import (
+    PANEL_BATCH_GAP_SECONDS,
+    PANEL_MAX_EDITS_PER_TICK,
+    PANEL_REFRESH_IDLE_SECONDS,
+    PANEL_REFRESH_PLAYING_SECONDS,
+    PanelRefreshScheduler,
+    has_active_listeners,
+    resolve_panel_refresh_interval,
+)
+from util.music.prefetch import (
+    MusicPrefetch,
+    plan_music_prefetch,
+    prepare_queued_track_player,
+    take_music_prefetch,
+)
 from util.music.playback_actions import (
     UrlPlayActionResult,
     begin_play_url_now_playback_action,
@@ -105,10 +121,13 @@ from util.music.playback_actions import (
 )
 from util.music.source import (
     YTDL_EXECUTOR,
+    ResolvedAudioStream,
     YTDLSource,
     _detect_ffmpeg_executable,
+    extract_queue_metadata_cached,
     ffmpeg_options,
-    info_ytdl,
+    is_stream_url_fresh,
+    resolve_audio_stream,
     search_ytdl,
 )
 from util.music.views import (
@@ -152,11 +171,20 @@ class MusicCog(commands.Cog):
         # 부팅시 1회 정리 수행 여부
         self._purged_guilds: set[int] = set()
         self._favorite_cache: dict[int, list[MusicFavorite]] = {}
+        # 모든 길드의 재생 패널 갱신을 하나의 태스크에서 처리
+        self._panel_scheduler = PanelRefreshScheduler()
+        self._panel_refresh_task: asyncio.Task | None = None
+        self._panel_refresh_wakeup = asyncio.Event()
 
     # === 패널 ID 저장/로드 유틸 ===
     async def cog_load(self):
         self._panel_ids = await self._load_panel_ids()
 
+    async def cog_unload(self):
+        if self._panel_refresh_task and not self._panel_refresh_task.done():
+            self._panel_refresh_task.cancel()
+        self._panel_refresh_task = None
+
     async def _load_panel_ids(self) -> dict[str, int]:
         try:
             return await load_music_panel_ids()
@@ -280,7 +308,7 @@ class MusicCog(commands.Cog):
         try:
             await fill_queue_track_metadata(
                 track,
-                lambda url: info_ytdl.extract_info(url, download=False),
+                extract_queue_metadata_cached,
                 executor=YTDL_EXECUTOR,
             )
         except (RuntimeError, TypeError, ValueError, KeyError):
@@ -469,6 +497,7 @@ class MusicCog(commands.Cog):
         if not search_pick_result.should_play_now:
             if search_pick_result.queued_track is not None:
                 self._spawn_bg(self._fill_queue_meta(search_pick_result.queued_track))
+            self._schedule_prefetch(interaction.guild.id)
             await self._send_auto_delete(
                 interaction,
                 search_pick_result.user_message,
@@ -585,6 +614,7 @@ class MusicCog(commands.Cog):
         await self._restart_updater(guild_id)
         embed = self._make_playing_embed(player, guild_id)
         await self._edit_msg(state=state, embed=embed, view=state.control_view)
+        self._schedule_prefetch(guild_id)
 
     async def _resolve_music_channel(
         self, guild: discord.Guild
@@ -635,8 +665,10 @@ class MusicCog(commands.Cog):
                 if state.control_channel and state.control_channel.guild:
                     gid = str(state.control_channel.guild.id)
                     await self._set_panel_id(gid, state.control_msg.id)
+                self._mark_panel_sent(state, embed)
                 return
             await state.control_msg.edit(embed=embed, view=view)
+            self._mark_panel_sent(state, embed)
         except discord.HTTPException as e:
             if getattr(e, "code", None) == 10008:  # Unknown Message
                 logger.info("음악 패널 메시지가 사라져 새로 생성합니다.")
@@ -646,45 +678,138 @@ class MusicCog(commands.Cog):
                 if state.control_channel and state.control_channel.guild:
                     gid = str(state.control_channel.guild.id)
                     await self._set_panel_id(gid, state.control_msg.id)
+                self._mark_panel_sent(state, embed)
             else:
                 logger.warning("패널 업데이트 실패", exc_info=True)
 
-    # ?완
-    # ! 노래 재생 상황 업데이트 루프
-    async def _updater_loop(self, guild_id: int):
-        state = self._get_state(guild_id)
+    def _mark_panel_sent(self, state: GuildMusicState, embed: Embed) -> None:
+        guild = getattr(state.control_channel, "guild", None)
+        if guild is None:
+            return
+        self._panel_scheduler.mark_sent(
+            guild.id,
+            music_embed_fingerprint(embed),
+            now=time.time(),
+        )
+
+    # ! 노래 재생 상황 업데이트 (모든 길드 공용 스케줄러)
+    def _ensure_panel_refresh_loop(self) -> None:
+        if self._panel_refresh_task is None or self._panel_refresh_task.done():
+            self._panel_refresh_task = self._spawn_bg(self._panel_refresh_loop())
+        self._panel_refresh_wakeup.set()
+
+    async def _panel_refresh_loop(self) -> None:
+        dbg("_panel_refresh_loop: start")
         try:
-            dbg("_updater_loop: start")
-            while state.player:
-                voice_client = state.control_msg.guild.voice_client
-                # ! voice_client 연결 끊김
-                if not voice_client:
-                    dbg("_updater_loop: voice_client disconnected")
-                    await self._force_stop(guild_id)
-                    return
-                # ! 봇만 남아있음 → 종료 호출
-                if voice_client and len(voice_client.channel.members) == 1:
-                    dbg("_updater_loop: bot alone in channel, stopping")
-                    await self._force_stop(guild_id)
-                    return
-                # ! 일시정지 대기
-                if voice_client.is_paused():
-                    dbg("_updater_loop: paused")
-                    await asyncio.sleep(1)
-                    continue
-                # ! 재생시간 계산
-                elapsed = int(time.time() - state.start_ts)
-                total = state.player.data.get("duration", 0)
-                dbg(f"_updater_loop: elapsed={elapsed} total={total}")
-                # ! 메시지 수정(임베드, 뷰)
-                embed = self._make_playing_embed(
-                    state.player, guild_id, min(elapsed, total) if total else elapsed
+            while True:
+                due_guilds = self._panel_scheduler.pop_due(
+                    now=time.time(),
+                    limit=PANEL_MAX_EDITS_PER_TICK,
                 )
-                await self._edit_msg(state, embed, state.control_view)
-                await asyncio.sleep(5)
+                if due_guilds:
+                    # 길드마다 패널 채널(=레이트리밋 버킷)이 다르므로 한 배치를 동시에 보낸다.
+                    results = await asyncio.gather(
+                        *(self._refresh_guild_panel(guild_id) for guild_id in due_guilds),
+                        return_exceptions=True,
+                    )
+                    for guild_id, result in zip(due_guilds, results):
+                        self._reschedule_panel_refresh(guild_id, result)
+                    await asyncio.sleep(PANEL_BATCH_GAP_SECONDS)
+                    continue
+
+                wait_seconds = self._panel_scheduler.next_wakeup(now=time.time())
+                self._panel_refresh_wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._panel_refresh_wakeup.wait(),
+                        timeout=wait_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    pass
         finally:
-            dbg("_updater_loop: end")
-            state.updater_task = None
+            dbg("_panel_refresh_loop: end")
+
+    def _reschedule_panel_refresh(self, guild_id: int, result: Any) -> None:
+        if isinstance(result, BaseException):
+            logger.warning(
+                "음악 패널 주기 갱신 실패: guild_id=%s",
+                guild_id,
+                exc_info=(type(result), result, result.__traceback__),
+            )
+            result = PANEL_REFRESH_IDLE_SECONDS
+        if result is None or not self._get_state(guild_id).panel_refresh_active:
+            self._panel_scheduler.unschedule(guild_id)
+            return
+        self._panel_scheduler.schedule(guild_id, now=time.time(), delay=result)
+
+    async def _refresh_guild_panel(self, guild_id: int) -> float | None:
+        """한 길드의 재생 패널을 갱신하고 다음 갱신까지의 간격을 돌려준다."""
+        state = self._get_state(guild_id)
+        if not state.panel_refresh_active or not state.player or not state.control_msg:
+            return None
+        voice_client = state.control_msg.guild.voice_client
+        # ! voice_client 연결 끊김
+        if not voice_client:
+            dbg("_refresh_guild_panel: voice_client disconnected")
+            await self._force_stop(guild_id)
+            return None
+        members = voice_client.channel.members
+        # ! 봇만 남아있음 → 종료 호출
+        if len(members) == 1:
+            dbg("_refresh_guild_panel: bot alone in channel, stopping")
+            await self._force_stop(guild_id)
+            return None
+        is_paused = voice_client.is_paused()
+        interval = resolve_panel_refresh_interval(
+            is_paused=is_paused,
+            has_listeners=has_active_listeners(members),
+        )
+        # ! 일시정지 중에는 진행 바가 변하지 않으므로 수정하지 않는다
+        if is_paused:
+            return interval
+        # ! 재생시간 계산
+        elapsed = int(time.time() - state.start_ts)
+        total = state.player.data.get("duration", 0)
+        embed = self._make_playing_embed(
+            state.player, guild_id, min(elapsed, total) if total else elapsed
+        )
+        # ! 마지막으로 보낸 임베드와 같으면 REST 호출 생략
+        if not self._panel_scheduler.should_send(
+            guild_id,
+            music_embed_fingerprint(embed),
+        ):
+            return interval
+        dbg(f"_refresh_guild_panel: guild={guild_id} elapsed={elapsed} total={total}")
+        await self._edit_msg(state, embed, state.control_view)
+        return interval
+
+    # ! 다음 곡 미리 해석
+    def _schedule_prefetch(self, guild_id: int) -> None:
+        state = self._get_state(guild_id)
+        next_track = plan_music_prefetch(state)
+        if next_track is None:
+            return
+        dbg(f"_schedule_prefetch: guild_id={guild_id} url={next_track.url}")
+        task = self._spawn_bg(self._resolve_prefetch(guild_id, next_track))
+        state.prefetch = MusicPrefetch(track=next_track, task=task)
+
+    async def _resolve_prefetch(
+        self,
+        guild_id: int,
+        track: QueuedTrack,
+    ) -> ResolvedAudioStream | None:
+        try:
+            return await resolve_audio_stream(track.url, loop=self.bot.loop)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.debug(
+                "다음 곡 미리 해석 실패: guild_id=%s url=%s",
+                guild_id,
+                track.url,
+                exc_info=True,
+            )
+            return None
 
     def _cancel_idle_disconnect(self, state: GuildMusicState) -> None:
         task = state.idle_disconnect_task
@@ -721,6 +846,7 @@ class MusicCog(commands.Cog):
 
             state.control_view = await self._build_helper_view(guild_id)
             reset_music_idle_state(state)
+            self._panel_scheduler.forget(guild_id)
             await self._edit_music_panel_safely(
                 state,
                 self._make_default_embed(),
@@ -756,6 +882,7 @@ class MusicCog(commands.Cog):
         )
         # 상태 초기화
         reset_music_playback_state(state)
+        self._panel_scheduler.forget(guild_id)
 
     # ?완
     # ! 메시지 자동 삭제
@@ -1130,6 +1257,7 @@ class MusicCog(commands.Cog):
         dbg(f"_play: appended URL to queue size={url_play_result.queue_size}")
         if url_play_result.queued_track is not None:
             self._spawn_bg(self._fill_queue_meta(url_play_result.queued_track))
+        self._schedule_prefetch(interaction.guild.id)
         await self._send_auto_delete(interaction, url_play_result.user_message)
 
     async def _ensure_music_url_voice_client(
@@ -1389,6 +1517,7 @@ class MusicCog(commands.Cog):
 
         # ! 재생 상태 완전 초기화
         reset_music_playback_state(state)
+        self._panel_scheduler.forget(interaction.guild.id)
 
         # ! 메시지
         await self._send_auto_delete(interaction, result.user_message)
@@ -1431,6 +1560,8 @@ class MusicCog(commands.Cog):
         except ValueError as e:
             await self._send_auto_delete(interaction, f"❌ {e}")
             return
+        # 대기열 맨 앞이 바뀌었으면 미리 해석하던 곡을 취소하고 새로 준비
+        self._schedule_prefetch(interaction.guild.id)
         await self._send_auto_delete(interaction, result.user_message)
 
     async def _clear_queue(self, interaction: discord.Interaction) -> None:
@@ -1446,6 +1577,8 @@ class MusicCog(commands.Cog):
         except ValueError as e:
             await self._send_auto_delete(interaction, f"❌ {e}")
             return
+        # 대기열 맨 앞이 바뀌었으면 미리 해석하던 곡을 취소하고 새로 준비
+        self._schedule_prefetch(interaction.guild.id)
         await self._send_auto_delete(interaction, result.user_message)
 
     async def _move_queue(
@@ -1463,6 +1596,8 @@ class MusicCog(commands.Cog):
         except ValueError as e:
             await self._send_auto_delete(interaction, f"❌ {e}")
             return
+        # 대기열 맨 앞이 바뀌었으면 미리 해석하던 곡을 취소하고 새로 준비
+        self._schedule_prefetch(interaction.guild.id)
         await self._send_auto_delete(interaction, result.user_message)
 
     async def _shuffle_queue(self, interaction: discord.Interaction) -> None:
@@ -1478,27 +1613,20 @@ class MusicCog(commands.Cog):
         except ValueError as e:
             await self._send_auto_delete(interaction, f"❌ {e}")
             return
+        # 대기열 맨 앞이 바뀌었으면 미리 해석하던 곡을 취소하고 새로 준비
+        self._schedule_prefetch(interaction.guild.id)
         await self._send_auto_delete(interaction, result.user_message)
 
     async def _restart_updater(self, guild_id: int):
         dbg("_restart_updater: called")
-        # ! 기본정보 로드
         state = self._get_state(guild_id)
-
-        # ! task 종료
-        if state.updater_task:
-            dbg("_restart_updater: cancel existing updater_task")
-            state.updater_task.cancel()
-
-        # ! task 종료 대기
-        while state.updater_task:
-            dbg("_restart_updater: waiting for updater_task to finish")
-            await asyncio.sleep(0.5)
-
-        # ! task 재등록
-        dbg("_restart_updater: creating new updater task")
-        state.updater_task = self._spawn_bg(self._updater_loop(guild_id))
-        await asyncio.sleep(1)
+        state.panel_refresh_active = True
+        self._panel_scheduler.schedule(
+            guild_id,
+            now=time.time(),
+            delay=PANEL_REFRESH_PLAYING_SECONDS,
+        )
+        self._ensure_panel_refresh_loop()
 
     async def _seek(self, interaction: discord.Interaction, seconds: int):
         dbg(f"_seek: seconds={seconds}")
@@ -1664,6 +1792,7 @@ class MusicCog(commands.Cog):
                     ffmpeg_options=ffmpeg_options,
                     ffmpeg_executable=_detect_ffmpeg_executable(),
                     loop=self.bot.loop,
+                    is_audio_url_fresh=is_stream_url_fresh,
                 )
             except MusicPlayerPreparationError:
                 logger.warning(
@@ -1695,11 +1824,12 @@ class MusicCog(commands.Cog):
         dbg(f"_on_song_end: next track popped, queue_size={len(state.queue)}")
         track = state.queue.popleft()
         try:
-            player = await prepare_music_player(
-                YTDLSource.from_url,
-                track.url,
+            player = await prepare_queued_track_player(
+                track,
+                prefetch=take_music_prefetch(state, track, now=time.time()),
+                source_factory=YTDLSource.from_url,
+                resolved_player_factory=YTDLSource.from_resolved,
                 loop=self.bot.loop,
-                requester=track.requester,
             )
         except MusicPlayerPreparationError as exc:
             dbg(f"_on_song_end: next track prepare failed: {exc.failure.debug_message}")
@@ -1712,6 +1842,7 @@ class MusicCog(commands.Cog):
         await self._edit_msg(state, embed, state.control_view)
         self._vc_play(guild_id, source=state.player.source)
         await self._restart_updater(guild_id)
+        self._schedule_prefetch(guild_id)
 
     @app_commands.command(
         name="음악", description="음악 재생 상태와 컨트롤 버튼을 보여줍니다."
@@ -9,10 +9,19 @@ from discord.ext import commands, tasks
 import uuid
 from datetime import datetime, timedelta
 from bot import SEOUL_TZ
-from util.db import execute_query, fetch_all
+from util.db import chunk_bulk_rows, execute_query, fetch_all
+from util.scheduler.trigger_heap import ScheduledTriggerHeap
 
 logger = logging.getLogger(__name__)
 
+# 이 cog가 쓰는 예약은 쓰는 즉시 힙을 깨우므로, 재동기화는 다른 경로(백엔드,
+# 직접 수정한 DB 행)에서 바뀐 예약을 위한 안전장치다. 그런 예약은 최대 이만큼 늦게 울린다
+SCHEDULE_RESYNC_SECONDS = 300
+SCHEDULE_RETRY_SECONDS = 30
+SCHEDULE_MIN_WAIT_SECONDS = 1.0
+# 이만큼 보낼 때마다 결과를 써서, 중간에 멈춰도 다시 보내는 예약을 이 수 안으로 줄인다
+SCHEDULE_SEND_BATCH_SIZE = 10
+
 
 class ScheduledMessageRow(TypedDict, total=False):
     id: str
@@ -75,6 +84,11 @@ def calculate_recurring_trigger_time(
 class SchedulerCog(commands.Cog):
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        self._triggers = ScheduledTriggerHeap(timezone=SEOUL_TZ)
+        self._next_sync_at: datetime | None = None
+        # 보낸 순서대로 쓰도록 순서를 지키는 dict를 집합처럼 쓴다
+        self._pending_deletes: dict[str, None] = {}
+        self._pending_reschedules: dict[str, datetime] = {}
         self.check_schedule_task.start()
         print("SchedulerCog : init 완료!")
 
@@ -143,6 +157,7 @@ class SchedulerCog(commands.Cog):
                     now,
                 ),
             )
+            self._triggers.push(uid, target_dt)
 
             await interaction.response.send_message(
                 f"✅ 예약 완료!\n📅 일시: {target_dt}\n💬 메시지: {message}",
@@ -196,6 +211,7 @@ class SchedulerCog(commands.Cog):
                 value,
             ),
         )
+        self._triggers.push(uid, trigger_time)
         await interaction.response.send_message("✅ 반복 예약 완료", ephemeral=True)
 
     @schedule_group.command(name="리스트", description="현재 등록된 예약 목록")
@@ -217,62 +233,158 @@ class SchedulerCog(commands.Cog):
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    @tasks.loop(seconds=30)
+    # 대기는 힙이 다음 예약 시각이나 재동기화 시각까지 하므로 루프 간격은 두지 않는다
+    @tasks.loop()
     async def check_schedule_task(self) -> None:
-        await self._run_schedule_check()
+        await self._run_scheduler()
+
+    async def _run_scheduler(self) -> None:
+        """다음 예약 시각이나 재동기화 시각까지 한 번 잠들고, 도래한 예약을 처리한다."""
+        now = datetime.now(SEOUL_TZ)
+        if self._next_sync_at is None or now >= self._next_sync_at:
+            await self._sync_triggers(now)
+
+        max_seconds = (self._next_sync_at - datetime.now(SEOUL_TZ)).total_seconds()
+        # 동기화가 오래 걸려 재동기화 시각이 지났어도 0초 대기로 루프가 돌지 않게 한다
+        if await self._triggers.wait(
+            max_seconds=max(max_seconds, SCHEDULE_MIN_WAIT_SECONDS)
+        ):
+            await self._run_schedule_check()
+
+    async def _sync_triggers(self, now: datetime) -> None:
+        horizon = now + timedelta(seconds=SCHEDULE_RESYNC_SECONDS)
+        try:
+            rows = await fetch_all(
+                "SELECT id, trigger_time FROM scheduled_messages "
+                "WHERE trigger_time <= %s ORDER BY trigger_time",
+                (horizon,),
+            )
+        except Exception:
+            logger.exception("예약 시각 목록 조회 실패")
+            self._next_sync_at = now + timedelta(seconds=SCHEDULE_RETRY_SECONDS)
+            return
+        # 다음 동기화 전까지 도래할 예약만 들고 있으면 충분하다
+        self._triggers.replace(
+            (str(row["id"]), row["trigger_time"])
+            for row in rows
+            if row.get("trigger_time") is not None
+        )
+        self._next_sync_at = horizon
 
     async def _run_schedule_check(self) -> None:
         now = datetime.now(SEOUL_TZ)
+        due_ids = self._triggers.pop_due(now)
+        retry_at = now + timedelta(seconds=SCHEDULE_RETRY_SECONDS)
+        # 이미 보낸 예약의 결과를 쓰지 못했다면 다시 보내기 전에 먼저 쓴다
+        if not await self._flush_schedule_results(retry_at):
+            for schedule_id in due_ids:
+                self._triggers.push(schedule_id, retry_at)
+            return
+
         query = "SELECT * FROM scheduled_messages WHERE trigger_time <= %s"
         try:
             rows = await fetch_all(query, (now,))
         except Exception:
             logger.exception("예약 메시지 조회 실패")
+            for schedule_id in due_ids:
+                self._triggers.push(schedule_id, retry_at)
             return
 
-        if not rows:
-            return
-
-        for row in rows:
-            try:
-                channel = self.bot.get_channel(int(row["channel_id"]))
-                if channel is None:
-                    logger.warning(
-                        "예약 메시지 채널을 찾지 못해 재시도합니다: "
-                        "schedule_id=%s channel_id=%s",
-                        row.get("id"),
-                        row.get("channel_id"),
-                    )
-                    continue
-
-                prefix = "🔄" if row["is_recurring"] else "⏰"
-                await channel.send(
-                    f"{prefix} 예약 메시지 (<@{row['user_id']}>):\n{row['message']}"
-                )
+        for start in range(0, len(rows), SCHEDULE_SEND_BATCH_SIZE):
+            for row in rows[start : start + SCHEDULE_SEND_BATCH_SIZE]:
+                await self._send_scheduled_row(row, retry_at)
+            if not await self._flush_schedule_results(retry_at):
+                for row in rows[start + SCHEDULE_SEND_BATCH_SIZE :]:
+                    self._triggers.push(row["id"], retry_at)
+                return
 
-                if row["is_recurring"]:
-                    next_run = self.calculate_next_run(row, row["trigger_time"])
-                    if next_run:
-                        await execute_query(
-                            "UPDATE scheduled_messages SET trigger_time = %s "
-                            "WHERE id = %s",
-                            (next_run, row["id"]),
-                        )
-                    else:
-                        await execute_query(
-                            "DELETE FROM scheduled_messages WHERE id = %s",
-                            (row["id"],),
-                        )
-                else:
-                    await execute_query(
-                        "DELETE FROM scheduled_messages WHERE id = %s",
-                        (row["id"],),
-                    )
-            except Exception:
-                logger.exception(
-                    "예약 메시지 전송 또는 상태 갱신 실패: schedule_id=%s",
+    async def _send_scheduled_row(
+        self,
+        row: ScheduledMessageRow,
+        retry_at: datetime,
+    ) -> None:
+        try:
+            channel = self.bot.get_channel(int(row["channel_id"]))
+            if channel is None:
+                logger.warning(
+                    "예약 메시지 채널을 찾지 못해 재시도합니다: "
+                    "schedule_id=%s channel_id=%s",
                     row.get("id"),
+                    row.get("channel_id"),
                 )
+                self._triggers.push(row["id"], retry_at)
+                return
+
+            prefix = "🔄" if row["is_recurring"] else "⏰"
+            await channel.send(
+                f"{prefix} 예약 메시지 (<@{row['user_id']}>):\n{row['message']}"
+            )
+        except Exception:
+            logger.exception(
+                "예약 메시지 전송 실패: schedule_id=%s",
+                row.get("id"),
+            )
+            self._triggers.push(row["id"], retry_at)
+            return
+
+        next_run = None
+        if row["is_recurring"]:
+            next_run = self.calculate_next_run(row, row["trigger_time"])
+        if next_run:
+            self._pending_reschedules[row["id"]] = next_run
+            self._triggers.push(row["id"], next_run)
+        else:
+            self._pending_deletes[row["id"]] = None
+
+    async def _flush_schedule_results(self, retry_at: datetime) -> bool:
+        """보낸 예약의 삭제·갱신을 쓴다. 실패하면 남겨 두었다가 다음 확인 때 다시 쓴다."""
+        if not self._pending_deletes and not self._pending_reschedules:
+            return True
+        delete_ids = list(self._pending_deletes)
+        reschedules = [
+            (next_run, schedule_id)
+            for schedule_id, next_run in self._pending_reschedules.items()
+        ]
+        try:
+            await self._apply_schedule_results(delete_ids, reschedules)
+        except Exception:
+            logger.exception(
+                "예약 메시지 상태 갱신 실패: delete=%s reschedule=%s",
+                delete_ids,
+                list(self._pending_reschedules),
+            )
+            for schedule_id in self._pending_deletes:
+                self._triggers.push(schedule_id, retry_at)
+            return False
+        self._pending_deletes.clear()
+        self._pending_reschedules.clear()
+        return True
+
+    async def _apply_schedule_results(
+        self,
+        delete_ids: list[str],
+        reschedules: list[tuple[datetime, str]],
+    ) -> None:
+        """처리한 예약을 행마다 따로 쓰지 않고 묶음 쿼리로 삭제·갱신한다."""
+        for chunk in chunk_bulk_rows([(schedule_id,) for schedule_id in delete_ids]):
+            placeholders = ", ".join(["%s"] * len(chunk))
+            await execute_query(
+                f"DELETE FROM scheduled_messages WHERE id IN ({placeholders})",
+                [schedule_id for (schedule_id,) in chunk],
+            )
+
+        for chunk in chunk_bulk_rows(reschedules):
+            cases = " ".join(["WHEN %s THEN %s"] * len(chunk))
+            placeholders = ", ".join(["%s"] * len(chunk))
+            await execute_query(
+                "UPDATE scheduled_messages "
+                f"SET trigger_time = CASE id {cases} END "
+                f"WHERE id IN ({placeholders})",
+                [
+                    *(value for next_run, schedule_id in chunk for value in (schedule_id, next_run)),
+                    *(schedule_id for _, schedule_id in chunk),
+                ],
+            )
 
     @check_schedule_task.before_loop
     async def before_check_schedule_task(self) -> None:
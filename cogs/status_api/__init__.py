@@ -9,8 +9,9 @@ from aiohttp import web
 from discord.ext import commands
 
 from util.celebration.announcements import refresh_celebration_messages
-from util.db import DB_SCHEMA_VERSION
+from util.db import DB_SCHEMA_VERSION, get_db_pool_stats, get_query_metrics
 from util.env_utils import getenv_clean
+from util.health_counters import get_health_counters
 
 
 logger = logging.getLogger(__name__)
@@ -123,37 +124,50 @@ class StatusApi(commands.Cog):
         return provided_token == expected_token
 
     async def index_handler(self, request):
-        """루트 경로 접속 시 간단한 안내 문구 반환"""
-        return web.Response(text=f"Bot Status API is running on port {self.port}")
+        """루트 경로 접속 시 간단한 안내 문구와 카운터 요약 반환"""
+        counters = get_health_counters(self.bot)
+        return web.Response(
+            text=(
+                f"Bot Status API is running on port {self.port}\n"
+                f"guilds={counters.guild_count} users={counters.member_count} "
+                f"messages={self._message_count()}"
+            )
+        )
 
     async def health_handler(self, request):
         """봇의 상태 정보를 JSON으로 반환"""
         status = "online" if self.bot.is_ready() else "starting"
 
-        # 봇이 참여 중인 길드 수와 총 유저 수 계산
-        guild_count = len(self.bot.guilds)
-        total_members = sum(len(g.members) for g in self.bot.guilds)
-
-        # 저장된 메시지 수 계산
-        message_count = 0
-        if hasattr(self.bot, "USER_MESSAGES"):
-            for guild_data in self.bot.USER_MESSAGES.values():
-                for user_msgs in guild_data.values():
-                    message_count += len(user_msgs)
+        # 길드/유저/메시지 수는 이벤트에서 갱신되는 카운터를 그대로 읽는다
+        counters = get_health_counters(self.bot)
 
         data = {
             "status": status,
             "latency_ms": round(self.bot.latency * 1000, 2),
             "uptime_s": round(time.time() - self.start_time, 2),
-            "guild_count": guild_count,
-            "user_count": total_members,
-            "message_count": message_count,
+            "guild_count": counters.guild_count,
+            "user_count": counters.member_count,
+            "message_count": self._message_count(),
+            "loop_tasks": counters.loop_task_status(),
+            "message_warmup": self._message_warmup_stats(),
             "schema_version": DB_SCHEMA_VERSION,
+            "db": {
+                "pool": get_db_pool_stats(),
+                "query_timings": get_query_metrics(),
+            },
             "timestamp_utc": datetime.now(timezone.utc).isoformat(),
             "bot_name": str(self.bot.user) if self.bot.user else "Unknown",
         }
         return web.json_response(data)
 
+    def _message_count(self) -> int:
+        # MessageCache가 개수를 직접 유지한다
+        return len(getattr(self.bot, "USER_MESSAGES", ()))
+
+    def _message_warmup_stats(self) -> dict | None:
+        stats = getattr(self.bot, "RECENT_MESSAGE_LOAD", None)
+        return stats.to_dict() if stats is not None else None
+
     async def celebration_update_handler(self, request):
         """기념일 공지를 수정하거나, 없으면 새로 전송합니다."""
         if not self.bot.is_ready():
@@ -216,19 +230,19 @@ class StatusApi(commands.Cog):
         return web.Response(text=challenge)
 
     async def youtube_websub_notify_handler(self, request):
-        """YouTube WebSub Atom 알림을 받아 라이브 후보로 처리합니다."""
+        """YouTube WebSub Atom 알림을 큐에 넣고 처리 완료를 기다리지 않고 202로 응답합니다."""
         if not self._is_valid_youtube_websub_request(request):
             return web.Response(status=403, text="Forbidden")
 
         loop_cog = self.bot.get_cog("LoopTasks")
         if loop_cog is None or not hasattr(
-            loop_cog, "handle_youtube_websub_notification"
+            loop_cog, "enqueue_youtube_websub_notification"
         ):
             return web.json_response({"error": "LoopTasks is not ready."}, status=503)
 
         raw_body = await request.text()
         try:
-            result = await loop_cog.handle_youtube_websub_notification(raw_body)
+            result = loop_cog.enqueue_youtube_websub_notification(raw_body)
         except ElementTree.ParseError:
             return web.json_response({"error": "Invalid Atom XML."}, status=400)
         except Exception:
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import logging
 import os
 import tempfile
 import uuid
-import wave
 import discord
 import davey
 import time
@@ -13,14 +13,23 @@ import numpy as np
 from collections import deque
 from discord.ext import commands
 from discord import app_commands
-from faster_whisper import WhisperModel
 
-from .settings import (
+from util.whisper.model_registry import get_whisper_model_registry
+from util.whisper.settings import (
     WhisperSettings,
     cpu_fallback_settings,
     resolve_whisper_settings,
+    whisper_model_options,
 )
 
+from .transcription import (
+    WHISPER_SAMPLE_RATE,
+    SpeakerTranscriptionQueue,
+    VoiceUtterance,
+    merge_voice_utterances,
+)
+from .vad import SpeakerVad
+
 logger = logging.getLogger(__name__)
 
 # Try to import voice_recv, if not available, we can't do voice receive
@@ -36,10 +45,7 @@ class StreamingSink(voice_recv.AudioSink if voice_recv else object):
         self.cog = cog
         self.vc = vc
         self.session_id = session_id
-        self.user_buffers = {}  # user -> bytearray
-        self.user_silence_start = {}  # user -> timestamp
-        self.user_speaking = {}  # user -> bool
-        self.user_pre_speech_buffer = {}  # user -> deque of bytes (ring buffer)
+        self.user_vads = {}  # user -> SpeakerVad
         self.opus_decoders = {}  # SSRC -> decoder
         self.decode_error_counts = {}
         self.decode_error_last_logged = {}
@@ -127,97 +133,33 @@ class StreamingSink(voice_recv.AudioSink if voice_recv else object):
         if not pcm:
             return
 
-        # Calculate RMS
-        pcm_data = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
-        if pcm_data.size == 0:
-            return
-        rms = np.sqrt(np.mean(pcm_data**2))
-        now = time.time()
-
-        if user not in self.user_buffers:
-            self.user_buffers[user] = bytearray()
-            self.user_speaking[user] = False
-            self.user_silence_start[user] = now
-            # 0.2s / 0.02s frame = 10 frames
-            self.user_pre_speech_buffer[user] = deque(maxlen=10)
-
-        # VAD Logic
-        if rms > self.SILENCE_THRESHOLD:
-            if not self.user_speaking[user]:
-                # Just started speaking. Prepend the pre-speech buffer
-                self.user_speaking[user] = True
-                # Prepend pre-speech buffer (chunks)
-                self.user_buffers[user].extend(
-                    b"".join(self.user_pre_speech_buffer[user])
-                )
-                self.user_pre_speech_buffer[user].clear()
-
-            self.user_silence_start[user] = now
-            self.user_buffers[user].extend(pcm)
-        else:
-            # Silence
-            if self.user_speaking[user]:
-                # Was speaking, now silent. Keep recording for a bit (buffer silence)
-                self.user_buffers[user].extend(pcm)
-
-                # Check if silence exceeded threshold + post-roll duration
-                if now - self.user_silence_start[user] > self.SILENCE_DURATION:
-                    # Trim tail to keep only POST_SPEECH_BUFFER_DURATION (0.2s)
-                    excess_time = (
-                        now - self.user_silence_start[user]
-                    ) - self.POST_SPEECH_BUFFER_DURATION
-                    if excess_time > 0:
-                        bytes_to_remove = int(excess_time * 48000 * 2 * 2)
-                        if 0 < bytes_to_remove < len(self.user_buffers[user]):
-                            self.user_buffers[user] = self.user_buffers[user][
-                                :-bytes_to_remove
-                            ]
-
-                    self.flush_user(user)
-            else:
-                # Was silent, still silent.
-                # Add to pre-speech ring buffer (frame)
-                self.user_pre_speech_buffer[user].append(pcm)
-
-    def flush_user(self, user) -> None:
-        buffer = self.user_buffers[user]
-        duration = len(buffer) / (48000 * 2 * 2)  # 48k, stereo, 16bit
-
-        if duration >= self.MIN_SPEECH_DURATION:
-            # Save to file
-            f = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-            f.close()
-
-            with wave.open(f.name, "wb") as wf:
-                wf.setnchannels(2)
-                wf.setsampwidth(2)
-                wf.setframerate(48000)
-                wf.writeframes(buffer)
-
-            print(f"[DEBUG] VAD triggered for {user.name}. Duration: {duration:.2f}s")
-
-            # Trigger processing
-            asyncio.run_coroutine_threadsafe(
-                self.cog.process_audio(
-                    f.name,
-                    user,
-                    self.vc,
-                    self.session_id,
-                ),
-                self.cog.bot.loop,
+        vad = self.user_vads.get(user)
+        if vad is None:
+            vad = SpeakerVad(
+                threshold=self.SILENCE_THRESHOLD,
+                silence_duration=self.SILENCE_DURATION,
+                min_speech_duration=self.MIN_SPEECH_DURATION,
+                pre_speech_duration=self.PRE_SPEECH_BUFFER_DURATION,
+                post_speech_duration=self.POST_SPEECH_BUFFER_DURATION,
             )
+            self.user_vads[user] = vad
+
+        for audio in vad.feed(pcm):
+            self.flush_user(user, audio)
 
-        # Reset state
-        self.user_buffers[user] = bytearray()
-        self.user_speaking[user] = False
-        self.user_pre_speech_buffer[user].clear()
+    def flush_user(self, user, audio: np.ndarray) -> None:
+        duration = len(audio) / WHISPER_SAMPLE_RATE
+        print(f"[DEBUG] VAD triggered for {user.name}. Duration: {duration:.2f}s")
+
+        # 수신 스레드에서 바로 전사하지 않고 화자별 전사 큐에 넘긴다
+        self.cog.bot.loop.call_soon_threadsafe(
+            self.cog.submit_utterance,
+            VoiceUtterance(audio, user, self.vc, self.session_id),
+        )
 
     def cleanup(self) -> None:
         self.opus_decoders.clear()
-        self.user_buffers.clear()
-        self.user_silence_start.clear()
-        self.user_speaking.clear()
-        self.user_pre_speech_buffer.clear()
+        self.user_vads.clear()
 
 
 class VoiceChat(commands.Cog):
@@ -227,8 +169,42 @@ class VoiceChat(commands.Cog):
         self.model_settings: WhisperSettings | None = None
         self.chat_data = {}  # guild_id -> {session_id, queue, message, task}
         self.active_chats = {}  # guild_id -> task
+        self.model_registry = get_whisper_model_registry()
         self.model_load_lock = asyncio.Lock()
-        self.transcribe_lock = asyncio.Lock()
+        self._transcribe_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._transcription_queue: SpeakerTranscriptionQueue[VoiceUtterance] | None = None
+
+    async def cog_unload(self) -> None:
+        self.release_model()
+        if self._transcription_queue is not None:
+            await self._transcription_queue.close()
+            self._transcription_queue = None
+        if self._transcribe_executor is not None:
+            self._transcribe_executor.shutdown(wait=False, cancel_futures=True)
+            self._transcribe_executor = None
+
+    def _transcribe_workers(self) -> int:
+        settings = self.model_settings or resolve_whisper_settings()
+        return settings.workers
+
+    def submit_utterance(self, utterance: VoiceUtterance) -> None:
+        """이벤트 루프에서 발화를 화자별 전사 큐에 넣는다."""
+        if self._transcription_queue is None:
+            self._transcription_queue = SpeakerTranscriptionQueue(
+                self._process_utterance,
+                workers=self._transcribe_workers(),
+                merge=merge_voice_utterances,
+            )
+        speaker_key = (utterance.vc.guild.id, utterance.speaker.id)
+        self._transcription_queue.submit(speaker_key, utterance)
+
+    async def _process_utterance(self, utterance: VoiceUtterance) -> None:
+        await self.process_audio(
+            utterance.audio,
+            utterance.speaker,
+            utterance.vc,
+            utterance.session_id,
+        )
 
     async def load_model(self) -> None:
         settings = resolve_whisper_settings()
@@ -282,51 +258,46 @@ class VoiceChat(commands.Cog):
                 settings.device,
                 settings.compute_type,
             )
-            loop = asyncio.get_running_loop()
-
-            def _load_model() -> tuple[object, WhisperSettings]:
-                try:
-                    return (
-                        WhisperModel(
-                            settings.model,
-                            device=settings.device,
-                            compute_type=settings.compute_type,
-                        ),
-                        settings,
-                    )
-                except Exception:
-                    if settings.device != "cuda":
-                        raise
-
-                    fallback = cpu_fallback_settings()
-                    logger.warning(
-                        "Configured GPU model load failed. Falling back to "
-                        "model=%s device=%s compute_type=%s.",
-                        fallback.model,
-                        fallback.device,
-                        fallback.compute_type,
-                        exc_info=True,
-                    )
-                    return (
-                        WhisperModel(
-                            fallback.model,
-                            device=fallback.device,
-                            compute_type=fallback.compute_type,
-                        ),
-                        fallback,
-                    )
+            try:
+                self.model = await self.model_registry.acquire(
+                    settings.spec,
+                    **whisper_model_options(settings),
+                )
+                self.model_settings = settings
+            except Exception:
+                if settings.device != "cuda":
+                    raise
 
-            self.model, self.model_settings = await loop.run_in_executor(
-                None,
-                _load_model,
-            )
+                fallback = cpu_fallback_settings(settings.workers)
+                logger.warning(
+                    "Configured GPU model load failed. Falling back to "
+                    "model=%s device=%s compute_type=%s.",
+                    fallback.model,
+                    fallback.device,
+                    fallback.compute_type,
+                    exc_info=True,
+                )
+                self.model = await self.model_registry.acquire(
+                    fallback.spec,
+                    **whisper_model_options(fallback),
+                )
+                self.model_settings = fallback
             logger.info(
-                "Whisper model loaded: model=%s device=%s compute_type=%s",
+                "Whisper model loaded: model=%s device=%s compute_type=%s "
+                "workers=%s",
                 self.model_settings.model,
                 self.model_settings.device,
                 self.model_settings.compute_type,
+                self.model_settings.workers,
             )
 
+    def release_model(self) -> None:
+        """빌린 모델을 반납해 다른 기능이 쓰지 않으면 유휴 시간 뒤 내려가게 한다."""
+        if self.model is None or self.model_settings is None:
+            return
+        self.model = None
+        self.model_registry.release(self.model_settings.spec)
+
     @app_commands.command(
         name="대화",
         description="음성 채널에 봇을 초대하여 실시간 대화를 시작합니다.",
@@ -585,16 +556,18 @@ class VoiceChat(commands.Cog):
                     display_task = data.get("task")
                     if display_task is not None:
                         display_task.cancel()
+            if not self.active_chats:
+                self.release_model()
 
     async def process_audio(
         self,
-        filepath: str,
+        audio: np.ndarray,
         speaker,
         vc,
         session_id: str,
     ) -> None:
         print(
-            f"[DEBUG] process_audio started. File: {filepath}, Speaker: {speaker.name}"
+            f"[DEBUG] process_audio started. Samples: {len(audio)}, Speaker: {speaker.name}"
         )
         try:
             guild_id = vc.guild.id
@@ -605,21 +578,17 @@ class VoiceChat(commands.Cog):
                 )
                 return
 
-            # Check if file has data (header is 44 bytes)
-            file_size = os.path.getsize(filepath)
-            print(f"[DEBUG] File size: {file_size} bytes")
-            if file_size <= 44:
-                print("[DEBUG] File is empty (only header). Skipping.")
+            if len(audio) == 0:
+                print("[DEBUG] Audio is empty. Skipping.")
                 return
 
             print("[DEBUG] Starting transcription...")
-            text = await self.transcribe(filepath)
+            text = await self.transcribe(audio)
             print(f"[DEBUG] Transcription result: '{text}'")
 
             if text.strip():
                 # 4. 환각(Hallucination) 필터 조건부 수정
-                file_size = os.path.getsize(filepath)
-                duration = file_size / (48000 * 2 * 2)
+                duration = len(audio) / WHISPER_SAMPLE_RATE
 
                 hallucinations = [
                     "자막",
@@ -655,19 +624,17 @@ class VoiceChat(commands.Cog):
 
         except Exception:
             logger.exception("Processing Error")
-        finally:
-            if os.path.exists(filepath):
-                try:
-                    os.remove(filepath)
-                except OSError:
-                    logger.warning("failed to remove temporary voice file: %s", filepath, exc_info=True)
 
-    async def transcribe(self, filepath: str) -> str:
+    async def transcribe(self, audio: np.ndarray) -> str:
         loop = asyncio.get_event_loop()
+        # 마지막 대화가 끝나 반납돼도 진행 중인 전사는 잡아 둔 모델로 마친다
+        model = self.model
+        if model is None:
+            return ""
 
         def _transcribe():
-            segments, info = self.model.transcribe(
-                filepath,
+            segments, info = model.transcribe(
+                audio,
                 language="ko",
                 no_speech_threshold=0.6,
                 log_prob_threshold=-1.0,
@@ -697,11 +664,13 @@ class VoiceChat(commands.Cog):
 
             return " ".join([segment.text for segment in segments_list])
 
-        async with self.transcribe_lock:
-            # language=None allows auto-detection (supports both Korean and English)
-            # initial_prompt helps guide the model context
-            text = await loop.run_in_executor(None, _transcribe)
-        return text
+        if self._transcribe_executor is None:
+            # 기본 executor를 다른 작업과 나눠 쓰지 않도록 전사 전용 스레드를 둔다
+            self._transcribe_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._transcribe_workers(),
+                thread_name_prefix="whisper",
+            )
+        return await loop.run_in_executor(self._transcribe_executor, _transcribe)
 
     async def display_loop(self, guild_id: int, session_id: str) -> None:
         """Updates the status message every 3 seconds with the latest STT queue."""
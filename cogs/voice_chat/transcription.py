@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Discord 수신 PCM은 48kHz 스테레오 16비트, faster-whisper 입력은 16kHz 모노 float32다
+DISCORD_SAMPLE_RATE = 48000
+DISCORD_CHANNELS = 2
+WHISPER_SAMPLE_RATE = 16000
+
+# 화자 한 명이 밀린 발화를 이보다 많이 쌓으면 오래된 것부터 합치거나 버린다
+MAX_PENDING_PER_SPEAKER = 3
+# 이보다 오래 기다린 발화는 실시간 자막으로서 의미가 없어 버린다
+MAX_UTTERANCE_LAG_SECONDS = 15.0
+
+
+@dataclass(frozen=True, slots=True)
+class VoiceUtterance:
+    audio: np.ndarray
+    speaker: object
+    vc: object
+    session_id: str
+
+    @property
+    def duration(self) -> float:
+        return len(self.audio) / WHISPER_SAMPLE_RATE
+
+
+def merge_voice_utterances(utterances: list[VoiceUtterance]) -> VoiceUtterance:
+    """밀린 발화를 이어 붙여 한 번에 전사한다. 세션과 화자는 첫 발화를 따른다."""
+    first = utterances[0]
+    return VoiceUtterance(
+        np.concatenate([utterance.audio for utterance in utterances]),
+        first.speaker,
+        first.vc,
+        first.session_id,
+    )
+
+
+@dataclass(slots=True)
+class _PendingUtterance(Generic[T]):
+    item: T
+    queued_at: float
+
+
+@dataclass(slots=True)
+class _SpeakerQueue(Generic[T]):
+    pending: deque[_PendingUtterance[T]] = field(default_factory=deque)
+    scheduled: bool = False
+
+
+class SpeakerTranscriptionQueue(Generic[T]):
+    """발화를 화자별로 줄 세우고 고정 개수의 작업자가 화자를 돌아가며 전사한다.
+
+    한 화자의 발화는 순서대로 하나씩만 처리되므로 자막 순서가 뒤섞이지 않고,
+    여러 화자는 작업자 수만큼 동시에 전사된다.
+    """
+
+    def __init__(
+        self,
+        handle: Callable[[T], Awaitable[None]],
+        *,
+        workers: int,
+        max_pending: int = MAX_PENDING_PER_SPEAKER,
+        max_lag_seconds: float = MAX_UTTERANCE_LAG_SECONDS,
+        merge: Callable[[list[T]], T] | None = None,
+        discard: Callable[[T], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._handle = handle
+        self._worker_count = max(1, workers)
+        self._max_pending = max(1, max_pending)
+        self._max_lag_seconds = max_lag_seconds
+        self._merge = merge
+        self._discard = discard
+        self._clock = clock
+        self._speakers: dict[Hashable, _SpeakerQueue[T]] = {}
+        self._ready: asyncio.Queue[Hashable] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def worker_count(self) -> int:
+        return self._worker_count
+
+    def pending_count(self, speaker: Hashable | None = None) -> int:
+        if speaker is not None:
+            queue = self._speakers.get(speaker)
+            return len(queue.pending) if queue else 0
+        return sum(len(queue.pending) for queue in self._speakers.values())
+
+    def submit(self, speaker: Hashable, item: T) -> None:
+        """이벤트 루프 스레드에서 호출한다."""
+        self._ensure_workers()
+        queue = self._speakers.setdefault(speaker, _SpeakerQueue())
+        queue.pending.append(_PendingUtterance(item, self._clock()))
+        if len(queue.pending) > self._max_pending:
+            self._compact(speaker, queue)
+        if not queue.scheduled:
+            queue.scheduled = True
+            self._ready.put_nowait(speaker)
+
+    async def close(self) -> None:
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for queue in self._speakers.values():
+            while queue.pending:
+                self._drop(queue.pending.popleft().item)
+        self._speakers.clear()
+        self._ready = asyncio.Queue()
+
+    def _ensure_workers(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._work()) for _ in range(self._worker_count)
+        ]
+
+    def _compact(self, speaker: Hashable, queue: _SpeakerQueue[T]) -> None:
+        overflow = len(queue.pending) - self._max_pending
+        if self._merge is not None:
+            # 밀린 발화를 하나로 합쳐 내용은 살리고 전사 횟수만 줄인다
+            oldest = [queue.pending.popleft() for _ in range(overflow + 1)]
+            merged = self._merge([pending.item for pending in oldest])
+            queue.pending.appendleft(_PendingUtterance(merged, oldest[0].queued_at))
+            return
+        oldest = [queue.pending.popleft() for _ in range(overflow)]
+        logger.info(
+            "음성 전사가 밀려 오래된 발화를 버립니다: speaker=%s count=%s",
+            speaker,
+            len(oldest),
+        )
+        for pending in oldest:
+            self._drop(pending.item)
+
+    def _next_item(self, speaker: Hashable) -> T | None:
+        queue = self._speakers.get(speaker)
+        if queue is None:
+            return None
+        deadline = self._clock() - self._max_lag_seconds
+        stale = 0
+        while queue.pending and queue.pending[0].queued_at < deadline:
+            self._drop(queue.pending.popleft().item)
+            stale += 1
+        if stale:
+            logger.info(
+                "오래 기다린 발화를 전사하지 않고 버립니다: speaker=%s count=%s",
+                speaker,
+                stale,
+            )
+        if not queue.pending:
+            queue.scheduled = False
+            self._speakers.pop(speaker, None)
+            return None
+        return queue.pending.popleft().item
+
+    async def _work(self) -> None:
+        while True:
+            speaker = await self._ready.get()
+            item = self._next_item(speaker)
+            if item is None:
+                continue
+            try:
+                await self._handle(item)
+            except Exception:
+                logger.exception("음성 전사 작업 실패: speaker=%s", speaker)
+
+            queue = self._speakers.get(speaker)
+            if queue is None:
+                continue
+            if queue.pending:
+                # 다른 화자 뒤로 다시 줄 세워 한 사람이 작업자를 독차지하지 않게 한다
+                self._ready.put_nowait(speaker)
+            else:
+                queue.scheduled = False
+                self._speakers.pop(speaker, None)
+
+    def _drop(self, item: T) -> None:
+        if self._discard is None:
+            return
+        try:
+            self._discard(item)
+        except Exception:
+            logger.warning("버린 발화 정리 실패", exc_info=True)
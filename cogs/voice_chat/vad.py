@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .transcription import (
+    DISCORD_CHANNELS,
+    DISCORD_SAMPLE_RATE,
+    WHISPER_SAMPLE_RATE,
+)
+
+
+FRAME_SECONDS = 0.02
+# 20ms 프레임 하나의 인터리브된 int16 샘플 수 (48kHz 스테레오)
+FRAME_SAMPLES = int(DISCORD_SAMPLE_RATE * FRAME_SECONDS) * DISCORD_CHANNELS
+# 같은 프레임을 16kHz 모노로 줄였을 때의 샘플 수
+WHISPER_FRAME_SAMPLES = int(WHISPER_SAMPLE_RATE * FRAME_SECONDS)
+_SAMPLES_PER_OUTPUT = FRAME_SAMPLES // WHISPER_FRAME_SAMPLES
+
+# 프레임을 이만큼 모아 한 번에 RMS를 계산한다. 최대 100ms 늦게 판정하는 대신
+# 패킷마다 배열을 만들지 않는다
+VAD_BATCH_FRAMES = 5
+# 한 발화가 이보다 길면 끊어서 전사로 넘기고 이어서 녹음한다
+MAX_UTTERANCE_SECONDS = 30.0
+
+
+class SpeakerVad:
+    """화자 한 명의 수신 PCM을 20ms 프레임 단위로 묶어 발화 구간을 잘라낸다.
+
+    버퍼는 모두 생성 시 한 번만 잡아 두고 재사용하며, 발화는 faster-whisper가
+    바로 받는 16kHz 모노 float32 배열로 쌓는다.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float,
+        silence_duration: float,
+        min_speech_duration: float,
+        pre_speech_duration: float,
+        post_speech_duration: float,
+        batch_frames: int = VAD_BATCH_FRAMES,
+        max_utterance_seconds: float = MAX_UTTERANCE_SECONDS,
+    ) -> None:
+        self.threshold = threshold
+        self._silence_frames = round(silence_duration / FRAME_SECONDS)
+        self._post_frames = round(post_speech_duration / FRAME_SECONDS)
+        self._min_samples = int(min_speech_duration * WHISPER_SAMPLE_RATE)
+        self._batch_frames = max(1, batch_frames)
+
+        self._staging = np.zeros(self._batch_frames * FRAME_SAMPLES, dtype=np.int16)
+        self._staged = 0
+        self._scratch = np.zeros(
+            (self._batch_frames, FRAME_SAMPLES),
+            dtype=np.float32,
+        )
+        self._mono = np.zeros(
+            (self._batch_frames, WHISPER_FRAME_SAMPLES),
+            dtype=np.float32,
+        )
+
+        pre_frames = max(1, round(pre_speech_duration / FRAME_SECONDS))
+        self._pre_roll = np.zeros(
+            (pre_frames, WHISPER_FRAME_SAMPLES),
+            dtype=np.float32,
+        )
+        self._pre_roll_head = 0
+        self._pre_roll_count = 0
+
+        max_frames = max(1, int(max_utterance_seconds / FRAME_SECONDS))
+        self._utterance = np.zeros(
+            max_frames * WHISPER_FRAME_SAMPLES,
+            dtype=np.float32,
+        )
+        self._length = 0
+        self.speaking = False
+        self._silent_run = 0
+
+    def feed(self, pcm: bytes) -> list[np.ndarray]:
+        """PCM 패킷을 받아 이번에 끝난 발화 배열들을 돌려준다."""
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        finished: list[np.ndarray] = []
+        offset = 0
+        capacity = len(self._staging)
+        while offset < len(samples):
+            count = min(capacity - self._staged, len(samples) - offset)
+            self._staging[self._staged : self._staged + count] = samples[
+                offset : offset + count
+            ]
+            self._staged += count
+            offset += count
+            if self._staged == capacity:
+                self._process_batch(finished)
+                self._staged = 0
+        return finished
+
+    def reset(self) -> None:
+        self._staged = 0
+        self._pre_roll_head = 0
+        self._pre_roll_count = 0
+        self._length = 0
+        self.speaking = False
+        self._silent_run = 0
+
+    def _process_batch(self, finished: list[np.ndarray]) -> None:
+        np.copyto(self._scratch, self._staging.reshape(self._scratch.shape))
+        rms = np.sqrt(
+            np.einsum("ij,ij->i", self._scratch, self._scratch) / FRAME_SAMPLES
+        )
+        # 채널과 연속 샘플을 한 번에 평균 내 16kHz 모노로 줄이고 [-1, 1]로 맞춘다
+        np.mean(
+            self._scratch.reshape(
+                self._batch_frames,
+                WHISPER_FRAME_SAMPLES,
+                _SAMPLES_PER_OUTPUT,
+            ),
+            axis=2,
+            out=self._mono,
+        )
+        self._mono /= 32768.0
+
+        for index, frame_rms in enumerate(rms):
+            frame = self._mono[index]
+            if frame_rms > self.threshold:
+                if not self.speaking:
+                    self.speaking = True
+                    self._drain_pre_roll()
+                self._silent_run = 0
+                self._append(frame, finished)
+            elif self.speaking:
+                self._silent_run += 1
+                self._append(frame, finished)
+                if self._silent_run > self._silence_frames:
+                    # 말끝 뒤 침묵은 포스트롤만큼만 남긴다
+                    trim = self._silent_run - self._post_frames
+                    if trim > 0:
+                        self._length = max(
+                            0,
+                            self._length - trim * WHISPER_FRAME_SAMPLES,
+                        )
+                    self._emit(finished)
+                    self.speaking = False
+                    self._silent_run = 0
+            else:
+                size = len(self._pre_roll)
+                self._pre_roll[self._pre_roll_head] = frame
+                self._pre_roll_head = (self._pre_roll_head + 1) % size
+                self._pre_roll_count = min(self._pre_roll_count + 1, size)
+
+    def _drain_pre_roll(self) -> None:
+        size = len(self._pre_roll)
+        start = (self._pre_roll_head - self._pre_roll_count) % size
+        for step in range(self._pre_roll_count):
+            self._write(self._pre_roll[(start + step) % size])
+        self._pre_roll_count = 0
+
+    def _append(self, frame: np.ndarray, finished: list[np.ndarray]) -> None:
+        if self._length + WHISPER_FRAME_SAMPLES > len(self._utterance):
+            # 너무 긴 발화는 잘라 먼저 넘기고 같은 발화를 이어서 받는다
+            self._emit(finished)
+        self._write(frame)
+
+    def _write(self, frame: np.ndarray) -> None:
+        end = self._length + WHISPER_FRAME_SAMPLES
+        if end > len(self._utterance):
+            return
+        self._utterance[self._length : end] = frame
+        self._length = end
+
+    def _emit(self, finished: list[np.ndarray]) -> None:
+        if self._length >= self._min_samples:
+            finished.append(self._utterance[: self._length].copy())
+        self._length = 0
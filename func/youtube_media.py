@@ -9,7 +9,6 @@ import subprocess
 from pathlib import Path
 
 import aiohttp
-from faster_whisper import WhisperModel
 from pytube.exceptions import VideoUnavailable
 from yt_dlp import YoutubeDL
 from yt_dlp.utils import DownloadError
@@ -17,6 +16,13 @@ from yt_dlp.utils import DownloadError
 from common.http import EXTERNAL_HTTP_TIMEOUT
 from func.youtube_links import normalize_youtube_link
 from func.youtube_workspace import subtitle_output_template
+from util.whisper.model_registry import get_whisper_model_registry
+from util.whisper.settings import (
+    WhisperSettings,
+    cpu_fallback_settings,
+    resolve_whisper_settings,
+    whisper_model_options,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -281,16 +287,20 @@ async def youtube_to_mp3(
             raise
 
 
+def youtube_stt_settings() -> WhisperSettings:
+    """음성 대화 CPU 모델과 같은 spec·로드 옵션을 써서 한 인스턴스를 나눠 쓴다."""
+    return cpu_fallback_settings(resolve_whisper_settings().workers)
+
+
 async def speech_to_text(audio_path: str) -> str:
-    def _run_stt():
-        full_path = os.path.abspath(audio_path)
-        if not os.path.exists(full_path):
-            raise FileNotFoundError(
-                f"STT를 위한 '{full_path}' 파일을 찾을 수 없습니다."
-            )
+    full_path = os.path.abspath(audio_path)
+    if not os.path.exists(full_path):
+        raise FileNotFoundError(
+            f"STT를 위한 '{full_path}' 파일을 찾을 수 없습니다."
+        )
 
+    def _run_stt(model):
         logger.debug("STT input path: %s", full_path)
-        model = WhisperModel("tiny", device="cpu", compute_type="int8")
         segments, _info = model.transcribe(
             full_path,
             language="ko",
@@ -301,4 +311,9 @@ async def speech_to_text(audio_path: str) -> str:
         logger.debug("STT completed: chars=%s", len(text))
         return text
 
-    return await asyncio.to_thread(_run_stt)
+    settings = youtube_stt_settings()
+    async with get_whisper_model_registry().lease(
+        settings.spec,
+        **whisper_model_options(settings),
+    ) as model:
+        return await asyncio.to_thread(_run_stt, model)
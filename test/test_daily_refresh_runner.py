@@ -11,6 +11,7 @@ with warnings.catch_warnings():
         category=DeprecationWarning,
     )
     from util.loop.daily_refresh_runner import run_daily_refreshes
+from util.message.cache import MessageCache
 
 
 DAILY_REFRESH_RUNNER_PATH = Path("util/loop/daily_refresh_runner.py")
@@ -24,7 +25,9 @@ class DailyRefreshRunnerTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_runs_daily_refreshes_in_order_and_resets_message_cache(self):
         calls: list[str] = []
-        bot = SimpleNamespace(USER_MESSAGES={"guild": ["message"]})
+        cache = MessageCache()
+        cache.add(1, author="tester", role="user", text="message", timestamp=1.0)
+        bot = SimpleNamespace(USER_MESSAGES=cache)
 
         async def refresh_celebration(bot_arg):
             self.assertIs(bot_arg, bot)
@@ -56,14 +59,14 @@ class DailyRefreshRunnerTests(unittest.IsolatedAsyncioTestCase):
 
         refresh_calls = [call for call in calls if not call.startswith("log:")]
         self.assertEqual(refresh_calls, ["celebration", "dday", "sunday_maple", "reload"])
-        self.assertEqual(bot.USER_MESSAGES, {})
+        self.assertEqual(len(bot.USER_MESSAGES), 0)
         self.assertEqual(summary.celebration_success_count, 1)
         self.assertEqual(summary.dday_success_count, 1)
         self.assertEqual(summary.sunday_maple_success_count, 1)
 
     async def test_skips_sunday_maple_on_non_sunday(self):
         calls: list[str] = []
-        bot = SimpleNamespace(USER_MESSAGES={})
+        bot = SimpleNamespace(USER_MESSAGES=MessageCache())
 
         async def refresh_empty(bot_arg):
             calls.append("refresh")
@@ -0,0 +1,174 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import util.db as db
+
+
+class _FakeCursor:
+    def __init__(self, log, *, fail_on=None):
+        self.log = log
+        self.fail_on = fail_on
+        self.lastrowid = 7
+        self.rowcount = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, query, args=None):
+        if self.fail_on and self.fail_on in query:
+            raise RuntimeError("boom")
+        self.log.append(("execute", query, args))
+        self.rowcount = 1
+
+    async def executemany(self, query, args_list):
+        self.log.append(("executemany", query, list(args_list)))
+        self.rowcount = len(args_list)
+
+    async def fetchone(self):
+        return {"value": 1}
+
+
+class _FakeConnection:
+    def __init__(self, *, fail_on=None):
+        self.log = []
+        self.fail_on = fail_on
+
+    def cursor(self, *args):
+        return _FakeCursor(self.log, fail_on=self.fail_on)
+
+    async def begin(self):
+        self.log.append("begin")
+
+    async def commit(self):
+        self.log.append("commit")
+
+    async def rollback(self):
+        self.log.append("rollback")
+
+
+class _FakeAcquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def acquire(self):
+        return _FakeAcquire(self.conn)
+
+
+class DbPoolTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        db.reset_query_metrics()
+
+    async def test_transaction_commits_statements_on_one_connection(self):
+        conn = _FakeConnection()
+        with patch.object(db, "get_db_pool", new=AsyncMock(return_value=_FakePool(conn))):
+            async with db.db_transaction() as tx:
+                await tx.execute("UPDATE guild SET guild_name = %s", ("a",))
+                await tx.executemany("INSERT INTO guild VALUES (%s)", [(1,), (2,)])
+                row = await tx.fetch_one("SELECT 1 AS value FROM guild")
+
+        self.assertEqual(row, {"value": 1})
+        self.assertEqual(tx.rowcount, 2)
+        self.assertEqual(conn.log[0], "begin")
+        self.assertEqual(conn.log[-1], "commit")
+        self.assertNotIn("rollback", conn.log)
+
+    async def test_transaction_rolls_back_on_error(self):
+        conn = _FakeConnection(fail_on="DELETE")
+        with patch.object(db, "get_db_pool", new=AsyncMock(return_value=_FakePool(conn))):
+            with self.assertRaises(RuntimeError):
+                async with db.db_transaction() as tx:
+                    await tx.execute("UPDATE guild SET guild_name = 'a'")
+                    await tx.execute("DELETE FROM guild")
+
+        self.assertEqual(conn.log[-1], "rollback")
+        self.assertNotIn("commit", conn.log)
+
+    async def test_query_helpers_record_timing_by_statement_label(self):
+        conn = _FakeConnection()
+        with patch.object(db, "get_db_pool", new=AsyncMock(return_value=_FakePool(conn))):
+            await db.execute_query("INSERT INTO guild (guild_id) VALUES (%s)", (1,))
+            await db.fetch_one("SELECT * FROM guild WHERE guild_id = %s", (1,))
+            await db.fetch_one("select * from guild")
+
+        metrics = db.get_query_metrics()
+
+        self.assertEqual(metrics["insert:guild"]["count"], 1)
+        self.assertEqual(metrics["select:guild"]["count"], 2)
+        self.assertEqual(sum(metrics["select:guild"]["buckets"].values()), 2)
+
+    def test_histogram_places_samples_into_upper_bound_buckets(self):
+        histogram = db.QueryTimingHistogram()
+        histogram.observe(0.5)
+        histogram.observe(30)
+        histogram.observe(10_000)
+
+        data = histogram.to_dict()
+
+        self.assertEqual(data["count"], 3)
+        self.assertEqual(data["buckets"]["le_1ms"], 1)
+        self.assertEqual(data["buckets"]["le_50ms"], 1)
+        self.assertEqual(data["buckets"]["inf"], 1)
+        self.assertEqual(data["max_ms"], 10_000)
+
+    def test_pool_settings_fall_back_to_defaults_for_invalid_values(self):
+        with patch.object(db, "getenv_clean", return_value="many"):
+            self.assertEqual(db._getenv_int("DB_POOL_MAXSIZE", 10), 10)
+        with patch.object(db, "getenv_clean", return_value="20"):
+            self.assertEqual(db._getenv_int("DB_POOL_MAXSIZE", 10), 20)
+
+
+class BulkUpsertTests(unittest.IsolatedAsyncioTestCase):
+    def test_chunk_bulk_rows_respects_row_and_byte_limits(self):
+        rows = [(index, "name") for index in range(5)]
+
+        by_rows = list(db.chunk_bulk_rows(rows, max_rows=2, max_bytes=10_000))
+        by_bytes = list(db.chunk_bulk_rows(rows, max_rows=100, max_bytes=40))
+
+        self.assertEqual([len(chunk) for chunk in by_rows], [2, 2, 1])
+        self.assertTrue(all(len(chunk) == 1 for chunk in by_bytes))
+        self.assertEqual([row for chunk in by_bytes for row in chunk], rows)
+
+    async def test_upsert_users_skips_unchanged_and_batches_changes(self):
+        conn = _FakeConnection()
+        stored = [{"user_id": 1, "username": "same"}, {"user_id": 2, "username": "old"}]
+        users = [(1, "same"), (2, "new"), (3, "fresh"), (3, "fresh")]
+        with patch.object(db, "fetch_all", new=AsyncMock(return_value=stored)) as fetch_all:
+            with patch.object(db, "get_db_pool", new=AsyncMock(return_value=_FakePool(conn))):
+                with patch.object(db, "DB_BULK_MAX_ROWS", 1):
+                    written = await db.upsert_users(users)
+
+        self.assertEqual(written, 2)
+        self.assertEqual(fetch_all.await_count, 3)
+        statements = [entry for entry in conn.log if isinstance(entry, tuple)]
+        self.assertEqual(len(statements), 1)
+        self.assertIn("ON DUPLICATE KEY UPDATE", statements[0][1])
+        self.assertEqual(statements[0][2], [2, "new", 3, "fresh"])
+        self.assertEqual(conn.log[0], "begin")
+        self.assertEqual(conn.log[-1], "commit")
+
+    async def test_upsert_users_without_changes_writes_nothing(self):
+        stored = [{"user_id": 1, "username": "same"}]
+        with patch.object(db, "fetch_all", new=AsyncMock(return_value=stored)):
+            with patch.object(db, "db_transaction") as db_transaction:
+                self.assertEqual(await db.upsert_users([(1, "same")]), 0)
+                self.assertEqual(await db.upsert_users([]), 0)
+
+        db_transaction.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import io
 import unittest
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
@@ -13,6 +15,7 @@ import discord
 from PIL import Image
 
 from cogs.earthquake_alert import EarthquakeAlertCommands
+from util.earthquake.alert_cache import EarthquakeAlertCache
 from util.earthquake.alerts import (
     EARTHQUAKE_ALERT_CHANNEL_TYPE,
     build_jma_eew_embed,
@@ -29,6 +32,7 @@ from util.earthquake.map_image import (
     EARTHQUAKE_MAP_FILENAME,
     EARTHQUAKE_MAP_HEIGHT,
     EARTHQUAKE_MAP_WIDTH,
+    EarthquakeMapCache,
     build_jma_eew_map_file,
 )
 from util.earthquake.state import (
@@ -37,8 +41,11 @@ from util.earthquake.state import (
     remember_jma_eew_message,
 )
 from util.earthquake.stream import consume_jma_eew_messages
+from util.earthquake import translation
 from util.earthquake.translation import (
     _extract_google_translation,
+    load_earthquake_translation_cache,
+    translate_japanese_texts,
     translate_jma_eew_terms,
 )
 
@@ -832,6 +839,277 @@ class JmaEewAlertTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(cancelled.color, discord.Color.light_grey())
 
 
+class JmaEewFanOutTests(unittest.IsolatedAsyncioTestCase):
+    async def test_delivers_to_guilds_concurrently(self):
+        event = _event(magnitude=6.0)
+        started = []
+        both_started = asyncio.Event()
+
+        async def get_channels():
+            return {1: 100, 2: 200}
+
+        async def load(_guild_id):
+            return EarthquakeAlertState()
+
+        async def save(_guild_id, _state):
+            return None
+
+        async def resolve(_bot, channel_id):
+            return channel_id
+
+        async def send(target, _event, _notify_everyone):
+            started.append(target)
+            if len(started) == 2:
+                both_started.set()
+            # 순차 처리라면 첫 길드가 두 번째 길드를 기다리며 멈춘다
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return target + 1
+
+        results = await process_jma_eew_event(
+            object(),
+            event,
+            get_channels=get_channels,
+            load_state=load,
+            save_state=save,
+            resolve_channel=resolve,
+            send_alert=send,
+        )
+
+        self.assertEqual([result.guild_id for result in results], [1, 2])
+        self.assertEqual([result.message_id for result in results], [101, 201])
+
+    async def test_shared_cache_reuses_state_and_coalesces_saves(self):
+        loads = []
+        saved = []
+        channel_reads = []
+        resolves = []
+        release_save = asyncio.Event()
+
+        async def get_channels():
+            channel_reads.append(True)
+            return {1: 100}
+
+        async def load(guild_id):
+            loads.append(guild_id)
+            return EarthquakeAlertState(channel_id=100)
+
+        async def save(_guild_id, state):
+            await release_save.wait()
+            saved.append(find_jma_eew_record(state, "20260728165922").serial)
+
+        async def resolve(_bot, channel_id):
+            resolves.append(channel_id)
+            return object()
+
+        async def send(_target, _event, _notify_everyone):
+            return 900
+
+        async def edit(_target, message_id, _event, _notify_everyone):
+            return message_id
+
+        cache = EarthquakeAlertCache(
+            get_channels=get_channels,
+            load_state=load,
+            save_state=save,
+            resolve_channel=resolve,
+        )
+        for serial in (1, 2, 3):
+            results = await process_jma_eew_event(
+                object(),
+                _event(serial=serial, magnitude=6.0),
+                send_alert=send,
+                edit_alert=edit,
+                cache=cache,
+            )
+            self.assertEqual(results[0].status, "ok")
+
+        release_save.set()
+        await cache.flush()
+
+        self.assertEqual(channel_reads, [True])
+        self.assertEqual(loads, [1])
+        self.assertEqual(resolves, [100])
+        # 첫 저장이 끝나기 전에 들어온 2·3보는 최신 상태 하나로 합쳐 저장된다
+        self.assertEqual(saved, [1, 3])
+
+    async def test_invalidate_drops_cached_state_and_channels(self):
+        loads = []
+
+        async def get_channels():
+            return {1: 100}
+
+        async def load(guild_id):
+            loads.append(guild_id)
+            return EarthquakeAlertState(channel_id=100)
+
+        async def resolve(_bot, _channel_id):
+            return object()
+
+        cache = EarthquakeAlertCache(
+            get_channels=get_channels,
+            load_state=load,
+            resolve_channel=resolve,
+        )
+        await cache.state(1)
+        cache.invalidate(1)
+        await cache.state(1)
+
+        self.assertEqual(loads, [1, 1])
+
+
+def _tile_png() -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (256, 256), "#dce8d5").save(output, format="PNG")
+    return output.getvalue()
+
+
+class EarthquakeMapCacheTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_maps_share_tile_loads_and_rendered_image(self):
+        tile_bytes = _tile_png()
+        loads: list[tuple[int, int, int]] = []
+
+        async def load_tile(zoom, tile_x, tile_y):
+            loads.append((zoom, tile_x, tile_y))
+            await asyncio.sleep(0)
+            return tile_bytes
+
+        cache = EarthquakeMapCache(load_tile=load_tile)
+        first, second = await asyncio.gather(
+            build_jma_eew_map_file(_event(), cache=cache),
+            build_jma_eew_map_file(_event(), cache=cache),
+        )
+        loads_after_first_event = len(loads)
+        third = await build_jma_eew_map_file(_event(serial=2), cache=cache)
+
+        self.assertEqual(len(loads), len(set(loads)))
+        self.assertEqual(len(loads), loads_after_first_event)
+        self.assertEqual(first.fp.getvalue(), third.fp.getvalue())
+        for map_file in (first, second, third):
+            map_file.close()
+
+    async def test_tile_lru_evicts_least_recently_used_tile(self):
+        tile_bytes = _tile_png()
+        loads: list[tuple[int, int, int]] = []
+
+        async def load_tile(zoom, tile_x, tile_y):
+            loads.append((zoom, tile_x, tile_y))
+            return tile_bytes
+
+        cache = EarthquakeMapCache(load_tile=load_tile, max_tiles=2)
+        await cache.tile(7, 1, 1)
+        await cache.tile(7, 2, 2)
+        await cache.tile(7, 1, 1)
+        await cache.tile(7, 3, 3)
+        await cache.tile(7, 1, 1)
+        await cache.tile(7, 2, 2)
+
+        self.assertEqual(
+            loads,
+            [(7, 1, 1), (7, 2, 2), (7, 3, 3), (7, 2, 2)],
+        )
+
+    async def test_prewarm_loads_japan_tiles_once(self):
+        tile_bytes = _tile_png()
+        loads: list[tuple[int, int, int]] = []
+
+        async def load_tile(zoom, tile_x, tile_y):
+            loads.append((zoom, tile_x, tile_y))
+            return tile_bytes
+
+        cache = EarthquakeMapCache(load_tile=load_tile)
+        loaded = await cache.prewarm()
+        again = await cache.prewarm()
+        map_file = await build_jma_eew_map_file(_event(), cache=cache)
+
+        self.assertGreater(loaded, 0)
+        self.assertEqual(again, 0)
+        self.assertEqual(len(loads), loaded)
+        self.assertTrue(all(zoom == 7 for zoom, _, _ in loads))
+        self.assertIsNotNone(map_file)
+        map_file.close()
+
+
+class EarthquakeTranslationCacheTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        for name, value in (
+            ("_translation_cache", OrderedDict()),
+            ("_translation_cache_loaded", False),
+            ("_translation_retry_at", 0.0),
+            ("_translation_load_retry_at", 0.0),
+            ("_translation_save_task", None),
+            ("_translation_save_pending", False),
+        ):
+            patcher = patch.object(translation, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_preloaded_translations_skip_network_request(self):
+        stored = {"entries": [["熊本県熊本地方", "구마모토현 구마모토 지방"]]}
+        request = AsyncMock()
+
+        with (
+            patch.object(
+                translation,
+                "fetch_one",
+                AsyncMock(return_value={"setting_value": json.dumps(stored)}),
+            ),
+            patch.object(translation, "_request_google_translations", request),
+        ):
+            loaded = await load_earthquake_translation_cache()
+            translated = await translate_japanese_texts(("熊本県熊本地方",))
+
+        self.assertEqual(loaded, 1)
+        self.assertEqual(translated, {"熊本県熊本地方": "구마모토현 구마모토 지방"})
+        request.assert_not_awaited()
+
+    async def test_new_translations_are_bounded_and_saved_in_lru_order(self):
+        saved = []
+
+        async def execute_query(_query, args):
+            saved.append(json.loads(args[1]))
+
+        async def request(texts):
+            return {text: f"번역-{text}" for text in texts}
+
+        with (
+            patch.object(translation, "TRANSLATION_CACHE_SIZE", 2),
+            patch.object(translation, "fetch_one", AsyncMock(return_value=None)),
+            patch.object(translation, "execute_query", execute_query),
+            patch.object(translation, "_request_google_translations", request),
+        ):
+            await translate_japanese_texts(("東京", "大阪"))
+            await translate_japanese_texts(("東京",))
+            await translate_japanese_texts(("京都",))
+            await translation._translation_save_task
+
+        self.assertEqual(
+            saved[-1],
+            {"entries": [["東京", "번역-東京"], ["京都", "번역-京都"]]},
+        )
+
+    async def test_failed_cache_load_backs_off_instead_of_retrying_every_alert(self):
+        fetch_one = AsyncMock(side_effect=OSError("db down"))
+
+        async def request(texts):
+            return {text: f"번역-{text}" for text in texts}
+
+        with (
+            patch.object(translation, "fetch_one", fetch_one),
+            patch.object(translation, "execute_query", AsyncMock()),
+            patch.object(translation, "_request_google_translations", request),
+        ):
+            await translate_japanese_texts(("東京",))
+            await translate_japanese_texts(("大阪",))
+            await translation._translation_save_task
+
+            fetch_one.assert_awaited_once()
+            translation._translation_load_retry_at = 0.0
+            await translate_japanese_texts(("京都",))
+            await translation._translation_save_task
+
+        self.assertEqual(fetch_one.await_count, 2)
+
+
 class JmaEewStreamTests(unittest.IsolatedAsyncioTestCase):
     async def test_consumes_heartbeat_and_eew_message(self):
         class FakeWebSocket:
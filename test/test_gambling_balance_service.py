@@ -0,0 +1,193 @@
+import unittest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from cogs.gambling.blackjack import run_blackjack
+from cogs.gambling.ranking import show_ranking
+from cogs.gambling.services import (
+    BalanceRank,
+    BalanceService,
+    BalanceUpdate,
+    TransferResult,
+)
+
+
+class _FakeTransaction:
+    def __init__(self, *, rowcount: int = 1, rows: list[dict] | None = None):
+        self.rowcount = 0
+        self.next_rowcount = rowcount
+        self.rows = rows or []
+        self.statements: list[tuple[str, tuple]] = []
+
+    async def execute(self, query: str, args=None) -> int:
+        self.statements.append((" ".join(query.split()), args))
+        self.rowcount = self.next_rowcount
+        return 0
+
+    async def fetch_one(self, query: str, args=None):
+        self.statements.append((" ".join(query.split()), args))
+        return self.rows[0] if self.rows else None
+
+    async def fetch_all(self, query: str, args=None):
+        self.statements.append((" ".join(query.split()), args))
+        return list(self.rows)
+
+
+def _patch_transaction(tx: _FakeTransaction):
+    @asynccontextmanager
+    async def db_transaction():
+        yield tx
+
+    return patch("cogs.gambling.services.db_transaction", db_transaction)
+
+
+class BalanceServiceAtomicTests(unittest.IsolatedAsyncioTestCase):
+    async def test_decrement_checks_floor_inside_update(self):
+        tx = _FakeTransaction(rowcount=1, rows=[{"balance": 700}])
+
+        with _patch_transaction(tx):
+            result = await BalanceService().decrement_balance("1", "2", 300)
+
+        self.assertEqual(result, BalanceUpdate(True, 700))
+        update_sql, update_args = tx.statements[0]
+        self.assertIn("AND balance - %s >= %s", update_sql)
+        self.assertEqual(update_args, (300, 1, 2, 300, 0))
+
+    async def test_decrement_reports_current_balance_when_insufficient(self):
+        tx = _FakeTransaction(rowcount=0, rows=[{"balance": 100}])
+
+        with _patch_transaction(tx):
+            result = await BalanceService().decrement_balance("1", "2", 300)
+
+        self.assertEqual(result, BalanceUpdate(False, 100))
+
+    async def test_increment_upserts_and_returns_new_balance(self):
+        tx = _FakeTransaction(rows=[{"balance": 1500}])
+
+        with _patch_transaction(tx):
+            balance = await BalanceService().increment_balance("1", "2", 500)
+
+        self.assertEqual(balance, 1500)
+        self.assertIn(
+            "ON DUPLICATE KEY UPDATE balance = balance + VALUES(balance)",
+            tx.statements[0][0],
+        )
+
+    async def test_transfer_locks_both_rows_and_moves_balance(self):
+        tx = _FakeTransaction(
+            rows=[
+                {"user_id": 2, "balance": 1000},
+                {"user_id": 3, "balance": 50},
+            ]
+        )
+
+        with _patch_transaction(tx):
+            result = await BalanceService().transfer_balance("1", "3", "2", 30)
+
+        self.assertEqual(result, TransferResult(True, 20, 1030))
+        lock_sql, lock_args = tx.statements[0]
+        self.assertIn("ORDER BY user_id FOR UPDATE", lock_sql)
+        self.assertEqual(lock_args, (1, 3, 2))
+        self.assertEqual(tx.statements[1][1], (30, 1, 3))
+        self.assertEqual(tx.statements[2][1], (1, 2, 30))
+
+    async def test_transfer_is_rejected_without_writes_when_sender_is_short(self):
+        tx = _FakeTransaction(rows=[{"user_id": 3, "balance": 10}])
+
+        with _patch_transaction(tx):
+            result = await BalanceService().transfer_balance("1", "3", "2", 30)
+
+        self.assertEqual(result, TransferResult(False, 10, 0))
+        self.assertEqual(len(tx.statements), 1)
+
+
+def _balance_row(user_id: int, balance: int) -> dict:
+    return {
+        "user_id": user_id,
+        "balance": balance,
+        "wins": 0,
+        "losses": 0,
+        "bj_wins": 0,
+        "bj_losses": 0,
+        "bj_pushes": 0,
+    }
+
+
+class BalanceLeaderboardTests(unittest.IsolatedAsyncioTestCase):
+    async def test_guild_balances_limits_and_orders_in_sql(self):
+        fetch_all = AsyncMock(return_value=[_balance_row(2, 900), _balance_row(3, 100)])
+
+        with patch("cogs.gambling.services.fetch_all", fetch_all):
+            balances = await BalanceService().get_guild_balances("1", limit=10)
+
+        query, args = fetch_all.await_args.args
+        self.assertIn("ORDER BY balance DESC, user_id LIMIT %s", query)
+        self.assertNotIn("SELECT *", query)
+        self.assertEqual(args, (1, 10))
+        self.assertEqual(list(balances), ["2", "3"])
+
+    async def test_rank_counts_richer_members(self):
+        fetch_one = AsyncMock(
+            side_effect=[{"balance": 500, "total": 40}, {"higher": 12}]
+        )
+
+        with patch("cogs.gambling.services.fetch_one", fetch_one):
+            rank = await BalanceService().get_balance_rank("1", "2")
+
+        self.assertEqual(rank, BalanceRank(13, 40))
+        self.assertEqual(fetch_one.await_args.args[1], (1, 500))
+
+    async def test_rank_is_missing_without_balance_row(self):
+        fetch_one = AsyncMock(return_value={"balance": None, "total": 40})
+
+        with patch("cogs.gambling.services.fetch_one", fetch_one):
+            rank = await BalanceService().get_balance_rank("1", "2")
+
+        self.assertEqual(rank, BalanceRank(None, 40))
+        fetch_one.assert_awaited_once()
+
+    async def test_ranking_shows_top_entries_and_sql_rank_in_footer(self):
+        service = SimpleNamespace(
+            get_guild_balances=AsyncMock(
+                return_value={"2": {"balance": 900}, "3": {"balance": 100}}
+            ),
+            get_balance_rank=AsyncMock(return_value=BalanceRank(25, 40)),
+        )
+        send_message = AsyncMock()
+        interaction = SimpleNamespace(
+            guild=SimpleNamespace(id=1, get_member=lambda _user_id: None),
+            user=SimpleNamespace(id=99),
+            response=SimpleNamespace(send_message=send_message),
+        )
+
+        await show_ranking(interaction, service, limit=2)
+
+        service.get_guild_balances.assert_awaited_once_with("1", limit=2)
+        embed = send_message.await_args.kwargs["embed"]
+        self.assertEqual(embed.description.count("위 —"), 2)
+        self.assertEqual(embed.footer.text, "총 40명 | 내 순위: 25위")
+
+
+
+class BlackjackBalanceTests(unittest.IsolatedAsyncioTestCase):
+    async def test_insufficient_funds_use_failed_decrement_balance(self):
+        service = SimpleNamespace(
+            get_balance=AsyncMock(return_value=10_000),
+            decrement_balance=AsyncMock(return_value=BalanceUpdate(False, 300)),
+        )
+        send_message = AsyncMock()
+        interaction = SimpleNamespace(
+            guild_id=1,
+            user=SimpleNamespace(id=2),
+            response=SimpleNamespace(send_message=send_message),
+        )
+
+        await run_blackjack(interaction, service, bet_amount=500)
+
+        service.decrement_balance.assert_awaited_once_with("1", "2", 500)
+        service.get_balance.assert_not_awaited()
+        send_message.assert_awaited_once_with("❌ 잔액 부족 (현재 300원)", ephemeral=True)
+
+if __name__ == "__main__":
+    unittest.main()
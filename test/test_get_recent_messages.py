@@ -1,46 +1,50 @@
 import unittest
+from datetime import datetime
 from pathlib import Path
 from types import SimpleNamespace
 
-from util.message.recent import get_recent_messages
+from util.message.cache import MessageCache
+from util.message.recent import SEOUL_TZ, get_recent_messages
 
 
 RECENT_MESSAGES_PATH = Path("util/message/recent.py")
 LEGACY_RECENT_MESSAGES_PATH = Path("util/get_recent_messages.py")
 
 
+def _kst_timestamp(hour, minute):
+    return datetime(2026, 6, 22, hour, minute, tzinfo=SEOUL_TZ).timestamp()
+
+
 class GetRecentMessagesTests(unittest.TestCase):
     def test_get_recent_messages_lives_under_message_package(self):
         self.assertTrue(RECENT_MESSAGES_PATH.exists())
         self.assertFalse(LEGACY_RECENT_MESSAGES_PATH.exists())
 
     def test_formats_recent_messages_oldest_to_newest(self):
-        client = SimpleNamespace(
-            USER_MESSAGES={
-                123: {
-                    "Alice": [
-                        {
-                            "role": "user",
-                            "content": "second",
-                            "time": "2026-06-22 10:02:00",
-                        }
-                    ],
-                    "Bob": [
-                        {
-                            "role": "assistant",
-                            "content": [
-                                {"type": "input_text", "text": "first"},
-                                {
-                                    "type": "input_image",
-                                    "image_url": "https://example.com/a.png",
-                                },
-                            ],
-                            "time": "2026-06-22 10:01:00",
-                        }
-                    ],
-                }
-            }
+        cache = MessageCache()
+        cache.add(
+            123,
+            author="Bob",
+            role="user",
+            text="zero",
+            timestamp=_kst_timestamp(10, 0),
+        )
+        cache.add(
+            123,
+            author="Alice",
+            role="user",
+            text="second",
+            timestamp=_kst_timestamp(10, 2),
+        )
+        cache.add(
+            123,
+            author="Bob",
+            role="assistant",
+            text="first",
+            image_urls=("https://example.com/a.png",),
+            timestamp=_kst_timestamp(10, 1),
         )
+        client = SimpleNamespace(USER_MESSAGES=cache)
 
         self.assertEqual(
             get_recent_messages(client, 123, limit=2),
@@ -52,6 +56,37 @@ class GetRecentMessagesTests(unittest.TestCase):
             ),
         )
 
+    def test_limits_to_requested_channel(self):
+        cache = MessageCache()
+        cache.add(
+            123,
+            author="Alice",
+            role="user",
+            text="elsewhere",
+            timestamp=_kst_timestamp(10, 5),
+            channel_id=2,
+        )
+        cache.add(
+            123,
+            author="Bob",
+            role="user",
+            text="here",
+            timestamp=_kst_timestamp(10, 0),
+            channel_id=1,
+        )
+
+        self.assertEqual(
+            get_recent_messages(SimpleNamespace(USER_MESSAGES=cache), 123, channel_id=1),
+            "[2026-06-22 10:00:00] Bob(user): here",
+        )
+
+    def test_returns_empty_for_unknown_guild_or_legacy_structure(self):
+        self.assertEqual(
+            get_recent_messages(SimpleNamespace(USER_MESSAGES=MessageCache()), 1),
+            "",
+        )
+        self.assertEqual(get_recent_messages(SimpleNamespace(USER_MESSAGES={}), 1), "")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,93 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from util.health_counters import BotHealthCounters, get_health_counters
+from util.message.cache import MessageCache
+
+
+class _Task:
+    def __init__(self, running):
+        self.running = running
+
+    def is_running(self):
+        return self.running
+
+
+class _MembersThatMustNotBeIterated:
+    def __iter__(self):
+        raise AssertionError("members should not be scanned")
+
+    def __len__(self):
+        raise AssertionError("members should not be counted")
+
+
+class BotHealthCountersTests(unittest.TestCase):
+    def test_events_keep_guild_and_member_totals_in_sync(self):
+        counters = BotHealthCounters()
+        counters.sync_guilds(
+            [SimpleNamespace(id=1, member_count=10), SimpleNamespace(id=2, member_count=5)]
+        )
+
+        counters.member_joined(1)
+        counters.member_left(2)
+        counters.member_joined(99)
+        counters.guild_joined(SimpleNamespace(id=3, member_count=7))
+        counters.guild_left(1)
+
+        self.assertEqual(counters.guild_count, 2)
+        self.assertEqual(counters.member_count, 4 + 7)
+
+    def test_rejoining_guild_does_not_double_count(self):
+        counters = BotHealthCounters()
+        counters.guild_joined(SimpleNamespace(id=1, member_count=3))
+        counters.guild_joined(SimpleNamespace(id=1, member_count=4))
+
+        self.assertEqual(counters.member_count, 4)
+
+    def test_loop_task_status_reads_registered_tasks(self):
+        counters = BotHealthCounters()
+        owner = SimpleNamespace(alive=_Task(True), dead=_Task(False))
+
+        counters.register_loop_tasks(owner, ["alive", "dead"])
+        self.assertEqual(counters.loop_task_status(), {"alive": True, "dead": False})
+
+        counters.unregister_loop_tasks(["dead"])
+        self.assertEqual(counters.loop_task_status(), {"alive": True})
+
+    def test_get_health_counters_attaches_one_instance(self):
+        bot = SimpleNamespace()
+
+        self.assertIs(get_health_counters(bot), get_health_counters(bot))
+
+
+class StatusApiHealthTests(unittest.IsolatedAsyncioTestCase):
+    async def test_health_reads_counters_without_scanning_members(self):
+        from cogs.status_api import StatusApi
+
+        cache = MessageCache()
+        cache.add(1, author="a", role="user", text="hi", timestamp=1.0)
+        counters = BotHealthCounters(guild_members={1: 3}, member_count=3)
+        bot = SimpleNamespace(
+            guilds=[SimpleNamespace(id=1, members=_MembersThatMustNotBeIterated())],
+            USER_MESSAGES=cache,
+            HEALTH_COUNTERS=counters,
+            latency=0.01,
+            user=None,
+            is_ready=lambda: True,
+        )
+        with patch("cogs.status_api.get_youtube_websub_verify_token", return_value=""):
+            cog = StatusApi(bot)
+
+        response = await cog.health_handler(None)
+        data = json.loads(response.text)
+
+        self.assertEqual(data["guild_count"], 1)
+        self.assertEqual(data["user_count"], 3)
+        self.assertEqual(data["message_count"], 1)
+        self.assertEqual(data["loop_tasks"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+
+from util.message.cache import CachedMessage, MessageCache
+
+
+def _add(cache, guild_id, author, timestamp, text="x"):
+    return cache.add(guild_id, author=author, role="user", text=text, timestamp=timestamp)
+
+
+class MessageCacheTests(unittest.TestCase):
+    def test_records_are_slotted(self):
+        record = _add(MessageCache(), 1, "a", 1.0)
+
+        self.assertIsInstance(record, CachedMessage)
+        self.assertFalse(hasattr(record, "__dict__"))
+
+    def test_per_author_limit_keeps_latest_and_updates_counts(self):
+        cache = MessageCache(per_author_limit=2)
+        for index in range(4):
+            _add(cache, 1, "a", float(index), text=str(index))
+        _add(cache, 1, "b", 10.0, text="b")
+
+        self.assertEqual([m.text for m in cache.author_messages(1, "a")], ["2", "3"])
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.guild_message_count(1), 3)
+        self.assertEqual(
+            [m.text for m in cache.iter_guild_messages(1)],
+            ["2", "3", "b"],
+        )
+
+    def test_out_of_order_insert_keeps_time_order(self):
+        cache = MessageCache()
+        _add(cache, 1, "a", 30.0, text="live")
+        _add(cache, 1, "b", 10.0, text="history-1")
+        _add(cache, 1, "a", 20.0, text="history-2")
+
+        self.assertEqual(
+            [m.text for m in cache.iter_guild_messages(1)],
+            ["history-1", "history-2", "live"],
+        )
+        self.assertEqual([m.text for m in cache.author_messages(1, "a")], ["history-2", "live"])
+
+    def test_memory_budget_evicts_globally_oldest_messages(self):
+        probe = MessageCache()
+        record_size = _add(probe, 1, "a", 0.0).size
+        cache = MessageCache(max_bytes=record_size * 3)
+
+        _add(cache, 1, "a", 1.0, text="x")
+        _add(cache, 2, "b", 2.0, text="x")
+        _add(cache, 1, "c", 3.0, text="x")
+        _add(cache, 2, "b", 4.0, text="x")
+
+        self.assertEqual(len(cache), 3)
+        self.assertLessEqual(cache.approx_bytes, cache.max_bytes)
+        self.assertEqual(cache.authors(1), ["c"])
+        self.assertEqual([m.timestamp for m in cache.iter_guild_messages(2)], [2.0, 4.0])
+
+    def test_recent_merges_authors_newest_first_and_returns_oldest_first(self):
+        cache = MessageCache()
+        _add(cache, 1, "a", 1.0, text="a1")
+        _add(cache, 1, "b", 2.0, text="b2")
+        _add(cache, 1, "a", 3.0, text="a3")
+        _add(cache, 1, "c", 4.0, text="c4")
+        _add(cache, 1, "b", 5.0, text="b5")
+
+        self.assertEqual([m.text for m in cache.recent(1, 3)], ["a3", "c4", "b5"])
+        self.assertEqual(len(cache.recent(1, 50)), 5)
+        self.assertEqual(cache.recent(1, 0), [])
+        self.assertEqual(cache.recent(2, 5), [])
+
+    def test_recent_filters_by_channel(self):
+        cache = MessageCache()
+        for index in range(6):
+            cache.add(
+                1,
+                author=f"user-{index % 2}",
+                role="user",
+                text=str(index),
+                timestamp=float(index),
+                channel_id=10 + index % 3,
+            )
+
+        self.assertEqual(
+            [m.text for m in cache.recent(1, 5, channel_id=10)],
+            ["0", "3"],
+        )
+
+    def test_clear_resets_counters(self):
+        cache = MessageCache()
+        _add(cache, 1, "a", 1.0)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.approx_bytes, 0)
+        self.assertEqual(list(cache.iter_guild_messages(1)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
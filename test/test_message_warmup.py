@@ -0,0 +1,105 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from util.message.warmup import (
+    SEOUL_TZ,
+    RecentMessageLoadStats,
+    fetch_channel_messages_since,
+    kst_day_start,
+    warm_up_channel_history,
+)
+
+
+SINCE = datetime(2026, 6, 22, tzinfo=SEOUL_TZ)
+
+
+class _FakeChannel:
+    def __init__(self, channel_id, messages, *, error=None, tracker=None):
+        self.id = channel_id
+        self.messages = messages
+        self.error = error
+        self.tracker = tracker
+        self.yielded = 0
+
+    async def history(self, *, limit=None):
+        if self.tracker is not None:
+            self.tracker["active"] += 1
+            self.tracker["peak"] = max(self.tracker["peak"], self.tracker["active"])
+        try:
+            await asyncio.sleep(0)
+            if self.error is not None:
+                raise self.error
+            for message in self.messages[:limit]:
+                self.yielded += 1
+                yield message
+        finally:
+            if self.tracker is not None:
+                self.tracker["active"] -= 1
+
+
+def _message(minutes_from_since):
+    return SimpleNamespace(created_at=SINCE + timedelta(minutes=minutes_from_since))
+
+
+class MessageWarmupTests(unittest.IsolatedAsyncioTestCase):
+    def test_kst_day_start_uses_seoul_midnight(self):
+        now = datetime(2026, 6, 21, 16, 30, tzinfo=timezone.utc)
+
+        self.assertEqual(kst_day_start(now), datetime(2026, 6, 22, tzinfo=SEOUL_TZ))
+
+    async def test_fetch_stops_paging_at_first_message_before_today(self):
+        channel = _FakeChannel(1, [_message(20), _message(10), _message(-5), _message(-10)])
+
+        messages = await fetch_channel_messages_since(channel, since=SINCE)
+
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(channel.yielded, 3)
+
+    async def test_warm_up_bounds_concurrency_and_reports_stats(self):
+        tracker = {"active": 0, "peak": 0}
+        channels = [
+            _FakeChannel(index, [_message(1)], tracker=tracker) for index in range(6)
+        ]
+        channels.append(_FakeChannel(99, [], error=RuntimeError("forbidden")))
+        collected = []
+
+        stats = await warm_up_channel_history(
+            channels,
+            since=SINCE,
+            handle_messages=lambda channel, messages: collected.append(channel.id),
+            concurrency=2,
+        )
+
+        self.assertLessEqual(tracker["peak"], 2)
+        self.assertEqual(sorted(collected), list(range(6)))
+        self.assertEqual(stats.channels_total, 7)
+        self.assertEqual(stats.channels_done, 7)
+        self.assertEqual(stats.channels_failed, 1)
+        self.assertEqual(stats.messages, 6)
+        self.assertTrue(stats.to_dict()["finished"])
+
+    async def test_warm_up_updates_published_stats_in_place(self):
+        stats = RecentMessageLoadStats()
+        progress = []
+
+        def handle_messages(_channel, _messages):
+            progress.append(stats.to_dict())
+
+        result = await warm_up_channel_history(
+            [_FakeChannel(1, [_message(1)]), _FakeChannel(2, [_message(1)])],
+            since=SINCE,
+            handle_messages=handle_messages,
+            concurrency=1,
+            stats=stats,
+        )
+
+        self.assertIs(result, stats)
+        self.assertEqual(progress[0]["channels_total"], 2)
+        self.assertFalse(progress[0]["finished"])
+        self.assertTrue(stats.to_dict()["finished"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -182,7 +182,7 @@ class MusicCommandSurfaceTests(unittest.TestCase):
 
     def test_updater_does_not_advance_queue_directly(self):
         tree = ast.parse(MUSIC_PATH.read_text(encoding="utf-8"))
-        updater_node = _function_node(tree, "_updater_loop")
+        updater_node = _function_node(tree, "_refresh_guild_panel")
 
         self.assertFalse(
             any(
@@ -145,3 +145,37 @@ class MusicExtractorHelperTests(unittest.TestCase):
         from util.music.extractor import select_best_audio_format
 
         self.assertIsNone(select_best_audio_format([]))
+
+    def test_extract_youtube_video_id_handles_watch_short_and_shorts_urls(self):
+        from util.music.extractor import extract_youtube_video_id
+
+        self.assertEqual(
+            extract_youtube_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=3"),
+            "dQw4w9WgXcQ",
+        )
+        self.assertEqual(
+            extract_youtube_video_id("https://youtu.be/dQw4w9WgXcQ?si=abc"),
+            "dQw4w9WgXcQ",
+        )
+        self.assertEqual(
+            extract_youtube_video_id("https://youtube.com/shorts/dQw4w9WgXcQ"),
+            "dQw4w9WgXcQ",
+        )
+        self.assertIsNone(extract_youtube_video_id("https://example.com/watch?v=dQw4w9WgXcQ"))
+        self.assertIsNone(extract_youtube_video_id("https://www.youtube.com/watch?v=short"))
+        self.assertIsNone(extract_youtube_video_id(None))
+
+    def test_parse_stream_url_expiry_reads_query_and_path_forms(self):
+        from util.music.extractor import parse_stream_url_expiry
+
+        self.assertEqual(
+            parse_stream_url_expiry("https://rr1.googlevideo.com/videoplayback?expire=1700000000&id=1"),
+            1700000000.0,
+        )
+        self.assertEqual(
+            parse_stream_url_expiry("https://manifest.googlevideo.com/api/expire/1700000000/ei/x"),
+            1700000000.0,
+        )
+        self.assertIsNone(parse_stream_url_expiry("https://example.com/audio?expire=soon"))
+        self.assertIsNone(parse_stream_url_expiry("https://example.com/audio"))
+
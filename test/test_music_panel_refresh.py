@@ -0,0 +1,185 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from discord import Embed
+
+from cogs.music import MusicCog
+from util.music.embeds import music_embed_fingerprint
+from util.music.panel_refresh import (
+    PANEL_MIN_EDIT_GAP_SECONDS,
+    PANEL_REFRESH_IDLE_SECONDS,
+    PANEL_REFRESH_PLAYING_SECONDS,
+    PanelRefreshScheduler,
+    has_active_listeners,
+    resolve_panel_refresh_interval,
+)
+from util.music.state import GuildMusicState
+
+
+class PanelRefreshSchedulerTests(unittest.TestCase):
+    def test_pop_due_returns_guilds_in_due_order_up_to_limit(self):
+        scheduler = PanelRefreshScheduler()
+        scheduler.schedule(1, now=0.0, delay=5.0)
+        scheduler.schedule(2, now=0.0, delay=1.0)
+        scheduler.schedule(3, now=0.0, delay=3.0)
+        scheduler.schedule(4, now=0.0, delay=30.0)
+
+        self.assertEqual(scheduler.pop_due(now=10.0, limit=2), [2, 3])
+        self.assertEqual(scheduler.pop_due(now=10.0, limit=2), [1])
+        self.assertEqual(scheduler.next_wakeup(now=10.0), 20.0)
+
+    def test_rescheduling_replaces_previous_due_time(self):
+        scheduler = PanelRefreshScheduler()
+        scheduler.schedule(1, now=0.0, delay=1.0)
+        scheduler.schedule(1, now=0.0, delay=10.0)
+
+        self.assertEqual(scheduler.pop_due(now=5.0), [])
+        self.assertEqual(scheduler.pop_due(now=10.0), [1])
+
+    def test_unschedule_and_empty_wakeup(self):
+        scheduler = PanelRefreshScheduler()
+        scheduler.schedule(1, now=0.0)
+        scheduler.unschedule(1)
+
+        self.assertEqual(scheduler.pop_due(now=1.0), [])
+        self.assertIsNone(scheduler.next_wakeup(now=1.0))
+
+    def test_recent_edit_defers_due_refresh_by_min_gap(self):
+        scheduler = PanelRefreshScheduler()
+        scheduler.mark_sent(1, "embed", now=10.0)
+        scheduler.schedule(1, now=10.0)
+
+        self.assertEqual(scheduler.pop_due(now=10.5), [])
+        self.assertEqual(
+            scheduler.next_wakeup(now=10.5),
+            PANEL_MIN_EDIT_GAP_SECONDS - 0.5,
+        )
+
+    def test_should_send_skips_identical_fingerprint(self):
+        scheduler = PanelRefreshScheduler()
+        scheduler.mark_sent(1, "same", now=0.0)
+
+        self.assertFalse(scheduler.should_send(1, "same"))
+        self.assertTrue(scheduler.should_send(1, "changed"))
+        self.assertTrue(scheduler.should_send(2, "same"))
+
+    def test_refresh_interval_slows_when_paused_or_nobody_listens(self):
+        self.assertEqual(
+            resolve_panel_refresh_interval(is_paused=False, has_listeners=True),
+            PANEL_REFRESH_PLAYING_SECONDS,
+        )
+        self.assertEqual(
+            resolve_panel_refresh_interval(is_paused=True, has_listeners=True),
+            PANEL_REFRESH_IDLE_SECONDS,
+        )
+        self.assertEqual(
+            resolve_panel_refresh_interval(is_paused=False, has_listeners=False),
+            PANEL_REFRESH_IDLE_SECONDS,
+        )
+
+    def test_has_active_listeners_ignores_bots_and_deafened_members(self):
+        bot = SimpleNamespace(bot=True, voice=None)
+        deafened = SimpleNamespace(bot=False, voice=SimpleNamespace(self_deaf=True, deaf=False))
+        listener = SimpleNamespace(bot=False, voice=SimpleNamespace(self_deaf=False, deaf=False))
+
+        self.assertFalse(has_active_listeners([bot, deafened]))
+        self.assertTrue(has_active_listeners([bot, deafened, listener]))
+
+    def test_embed_fingerprint_is_stable_for_identical_embeds(self):
+        first = Embed(title="패널")
+        first.add_field(name="진행", value="00:05")
+        second = Embed(title="패널")
+        second.add_field(name="진행", value="00:05")
+        third = Embed(title="패널")
+        third.add_field(name="진행", value="00:10")
+
+        self.assertEqual(music_embed_fingerprint(first), music_embed_fingerprint(second))
+        self.assertNotEqual(music_embed_fingerprint(first), music_embed_fingerprint(third))
+
+
+class MusicCogPanelRefreshTests(unittest.IsolatedAsyncioTestCase):
+    def _make_cog(self, *, members, is_paused=False):
+        cog = MusicCog(SimpleNamespace(loop="loop"))
+        voice_client = SimpleNamespace(
+            channel=SimpleNamespace(members=members),
+            is_paused=lambda: is_paused,
+        )
+        state = cog._get_state(1)
+        state.player = SimpleNamespace(data={"duration": 100})
+        state.start_ts = 0.0
+        state.panel_refresh_active = True
+        state.control_msg = SimpleNamespace(guild=SimpleNamespace(voice_client=voice_client))
+        state.control_channel = SimpleNamespace(guild=SimpleNamespace(id=1))
+        edits = []
+
+        async def edit_msg(target_state, embed, view):
+            edits.append(embed)
+            cog._mark_panel_sent(target_state, embed)
+
+        cog._edit_msg = edit_msg
+        cog._make_playing_embed = lambda player, guild_id, elapsed=0: {"fixed": True}
+        return cog, edits
+
+    async def test_refresh_skips_edit_when_embed_is_unchanged(self):
+        listener = SimpleNamespace(bot=False, voice=None)
+        cog, edits = self._make_cog(members=[SimpleNamespace(bot=True), listener])
+
+        first = await cog._refresh_guild_panel(1)
+        cog._panel_scheduler.last_sent_at.clear()
+        second = await cog._refresh_guild_panel(1)
+
+        self.assertEqual(first, PANEL_REFRESH_PLAYING_SECONDS)
+        self.assertEqual(second, PANEL_REFRESH_PLAYING_SECONDS)
+        self.assertEqual(len(edits), 1)
+
+    async def test_refresh_does_not_edit_while_paused(self):
+        listener = SimpleNamespace(bot=False, voice=None)
+        cog, edits = self._make_cog(
+            members=[SimpleNamespace(bot=True), listener],
+            is_paused=True,
+        )
+
+        interval = await cog._refresh_guild_panel(1)
+
+        self.assertEqual(interval, PANEL_REFRESH_IDLE_SECONDS)
+        self.assertEqual(edits, [])
+
+    async def test_refresh_stops_for_inactive_state(self):
+        cog, edits = self._make_cog(members=[])
+        cog._get_state(1).panel_refresh_active = False
+
+        self.assertIsNone(await cog._refresh_guild_panel(1))
+        self.assertEqual(edits, [])
+
+    async def test_restart_updater_schedules_guild_on_shared_loop(self):
+        cog = MusicCog(SimpleNamespace(loop="loop"))
+        state = GuildMusicState()
+        cog.states[7] = state
+
+        await cog._restart_updater(7)
+        first_task = cog._panel_refresh_task
+        await cog._restart_updater(7)
+
+        self.assertTrue(state.panel_refresh_active)
+        self.assertIn(7, cog._panel_scheduler.due_at)
+        self.assertIs(cog._panel_refresh_task, first_task)
+        await cog.cog_unload()
+
+    async def test_force_stop_forgets_guild_refresh_bookkeeping(self):
+        cog = MusicCog(SimpleNamespace(loop="loop", get_guild=lambda _guild_id: None))
+        cog._build_helper_view = AsyncMock()
+        cog._edit_music_panel_safely = AsyncMock()
+        cog._make_default_embed = lambda: None
+        cog._panel_scheduler.schedule(7, now=0.0)
+        cog._panel_scheduler.mark_sent(7, "embed", now=0.0)
+
+        await cog._force_stop(7)
+
+        self.assertNotIn(7, cog._panel_scheduler.due_at)
+        self.assertNotIn(7, cog._panel_scheduler.last_fingerprints)
+        self.assertNotIn(7, cog._panel_scheduler.last_sent_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -215,6 +215,32 @@ class MusicPlaybackTests(unittest.IsolatedAsyncioTestCase):
         self.assertIs(result.refreshed_player, refreshed)
         self.assertEqual(calls, [("https://example.com/watch?v=1", "loop", None)])
 
+    async def test_prepare_replay_source_refreshes_expired_audio_url_without_ffmpeg(self):
+        refreshed = SimpleNamespace(source="fresh-source", audio_url="fresh-audio")
+        player = SimpleNamespace(
+            audio_url="expired-audio",
+            data={},
+            webpage_url="https://example.com/watch?v=1",
+        )
+
+        def ffmpeg_source_factory(audio_url, **kwargs):
+            raise AssertionError("expired url should not start ffmpeg")
+
+        async def source_factory(url, *, loop, requester):
+            return refreshed
+
+        result = await prepare_replay_source(
+            player,
+            source_factory=source_factory,
+            ffmpeg_source_factory=ffmpeg_source_factory,
+            ffmpeg_options={},
+            ffmpeg_executable="ffmpeg.exe",
+            loop="loop",
+            is_audio_url_fresh=lambda audio_url: False,
+        )
+
+        self.assertIs(result.refreshed_player, refreshed)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,170 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from util.music.prefetch import (
+    PREFETCH_MAX_AGE_SECONDS,
+    MusicPrefetch,
+    cancel_music_prefetch,
+    plan_music_prefetch,
+    prepare_queued_track_player,
+    take_music_prefetch,
+)
+from util.music.queue import QueuedTrack, move_queue_track, shuffle_queue
+from util.music.state import GuildMusicState, reset_music_playback_state
+
+
+def _done_future(result):
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(result)
+    return future
+
+
+class MusicPrefetchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_plan_returns_queue_head_only_while_playing(self):
+        state = GuildMusicState()
+        track = QueuedTrack(url="https://example.com/a")
+        state.queue.append(track)
+
+        self.assertIsNone(plan_music_prefetch(state))
+
+        state.player = object()
+        self.assertIs(plan_music_prefetch(state), track)
+
+    async def test_plan_keeps_prefetch_for_same_head(self):
+        state = GuildMusicState(player=object())
+        track = QueuedTrack(url="https://example.com/a")
+        state.queue.append(track)
+        future = asyncio.get_running_loop().create_future()
+        state.prefetch = MusicPrefetch(track=track, task=future)
+
+        self.assertIsNone(plan_music_prefetch(state))
+        self.assertFalse(future.cancelled())
+        self.assertIs(state.prefetch.track, track)
+
+    async def test_plan_cancels_prefetch_when_queue_head_moves(self):
+        state = GuildMusicState(player=object())
+        first = QueuedTrack(url="https://example.com/a")
+        second = QueuedTrack(url="https://example.com/b")
+        state.queue.extend([first, second])
+        future = asyncio.get_running_loop().create_future()
+        state.prefetch = MusicPrefetch(track=first, task=future)
+
+        move_queue_track(state.queue, 2, 1)
+
+        self.assertIs(plan_music_prefetch(state), second)
+        self.assertTrue(future.cancelled())
+        self.assertIsNone(state.prefetch)
+
+    async def test_plan_cancels_prefetch_when_queue_becomes_empty(self):
+        state = GuildMusicState(player=object())
+        track = QueuedTrack(url="https://example.com/a")
+        future = asyncio.get_running_loop().create_future()
+        state.prefetch = MusicPrefetch(track=track, task=future)
+
+        self.assertIsNone(plan_music_prefetch(state))
+        self.assertTrue(future.cancelled())
+
+    async def test_shuffle_with_same_head_keeps_prefetch(self):
+        state = GuildMusicState(player=object())
+        only = QueuedTrack(url="https://example.com/a")
+        state.queue.append(only)
+        future = asyncio.get_running_loop().create_future()
+        state.prefetch = MusicPrefetch(track=only, task=future)
+
+        shuffle_queue(state.queue)
+
+        self.assertIsNone(plan_music_prefetch(state))
+        self.assertFalse(future.cancelled())
+
+    async def test_reset_playback_state_cancels_prefetch(self):
+        state = GuildMusicState(player=object())
+        future = asyncio.get_running_loop().create_future()
+        state.prefetch = MusicPrefetch(
+            track=QueuedTrack(url="https://example.com/a"),
+            task=future,
+        )
+
+        reset_music_playback_state(state)
+
+        self.assertIsNone(state.prefetch)
+        self.assertTrue(future.cancelled())
+
+    async def test_take_returns_matching_prefetch_and_clears_state(self):
+        state = GuildMusicState()
+        track = QueuedTrack(url="https://example.com/a")
+        prefetch = MusicPrefetch(track=track, task=_done_future("resolved"), started_at=100.0)
+        state.prefetch = prefetch
+
+        self.assertIs(take_music_prefetch(state, track, now=110.0), prefetch)
+        self.assertIsNone(state.prefetch)
+
+    async def test_take_discards_other_track_or_stale_prefetch(self):
+        state = GuildMusicState()
+        track = QueuedTrack(url="https://example.com/a")
+        other = QueuedTrack(url="https://example.com/b")
+        pending = asyncio.get_running_loop().create_future()
+        state.prefetch = MusicPrefetch(track=other, task=pending, started_at=100.0)
+
+        self.assertIsNone(take_music_prefetch(state, track, now=110.0))
+        self.assertTrue(pending.cancelled())
+
+        state.prefetch = MusicPrefetch(track=track, task=_done_future("old"), started_at=0.0)
+        self.assertIsNone(
+            take_music_prefetch(state, track, now=PREFETCH_MAX_AGE_SECONDS + 1)
+        )
+
+    async def test_cancel_is_safe_without_prefetch(self):
+        state = GuildMusicState()
+
+        cancel_music_prefetch(state)
+
+        self.assertIsNone(state.prefetch)
+
+    async def test_prepare_uses_resolved_stream_without_extraction(self):
+        track = QueuedTrack(url="https://example.com/a", requester="requester")
+        prefetch = MusicPrefetch(track=track, task=_done_future("resolved"))
+        calls = []
+
+        async def source_factory(url, *, loop, requester):
+            calls.append(("extract", url))
+            return "extracted"
+
+        def resolved_player_factory(resolved, *, requester):
+            calls.append(("resolved", resolved, requester))
+            return SimpleNamespace(source="audio", title="곡")
+
+        player = await prepare_queued_track_player(
+            track,
+            prefetch=prefetch,
+            source_factory=source_factory,
+            resolved_player_factory=resolved_player_factory,
+            loop="loop",
+        )
+
+        self.assertEqual(player.source, "audio")
+        self.assertEqual(calls, [("resolved", "resolved", "requester")])
+
+    async def test_prepare_falls_back_to_extraction_when_prefetch_failed(self):
+        track = QueuedTrack(url="https://example.com/a", requester="requester")
+        prefetch = MusicPrefetch(track=track, task=_done_future(None))
+        calls = []
+
+        async def source_factory(url, *, loop, requester):
+            calls.append((url, loop, requester))
+            return "extracted"
+
+        player = await prepare_queued_track_player(
+            track,
+            prefetch=prefetch,
+            source_factory=source_factory,
+            resolved_player_factory=lambda resolved, *, requester: "unused",
+            loop="loop",
+        )
+
+        self.assertEqual(player, "extracted")
+        self.assertEqual(calls, [("https://example.com/a", "loop", "requester")])
+
+
+if __name__ == "__main__":
+    unittest.main()
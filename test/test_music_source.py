@@ -61,6 +61,134 @@ class MusicSourceTests(unittest.TestCase):
         self.assertTrue(hasattr(search_ytdl, "extract_info"))
         self.assertTrue(hasattr(info_ytdl, "extract_info"))
 
+    def test_stream_cache_reuses_stream_until_expiry_margin(self):
+        from util.music.source import (
+            STREAM_URL_EXPIRY_MARGIN_SECONDS,
+            StreamInfoCache,
+        )
+
+        now = [1000.0]
+        cache = StreamInfoCache(clock=lambda: now[0])
+        expire = 1000 + STREAM_URL_EXPIRY_MARGIN_SECONDS + 60
+        entry = cache.put_stream(
+            "video",
+            {"id": "video", "title": "곡", "formats": [{"url": "a"}]},
+            audio_format={"url": f"https://audio?expire={expire}"},
+            audio_url=f"https://audio?expire={expire}",
+        )
+
+        self.assertEqual(entry.expires_at, float(expire))
+        self.assertNotIn("formats", entry.info)
+        self.assertIs(cache.get_stream("video"), entry)
+
+        now[0] += 61
+        self.assertIsNone(cache.get_stream("video"))
+        self.assertEqual(cache.get_metadata("video")["title"], "곡")
+
+    def test_stream_cache_evicts_least_recently_used_entry(self):
+        from util.music.source import StreamInfoCache
+
+        cache = StreamInfoCache(max_entries=2, clock=lambda: 0.0)
+        cache.put_metadata("a", {"title": "a"})
+        cache.put_metadata("b", {"title": "b"})
+        cache.get_metadata("a")
+        cache.put_metadata("c", {"title": "c"})
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get_metadata("b"))
+        self.assertEqual(cache.get_metadata("a"), {"title": "a"})
+
+    def test_stream_cache_metadata_does_not_replace_fresh_stream(self):
+        from util.music.source import StreamInfoCache
+
+        cache = StreamInfoCache(clock=lambda: 0.0)
+        cache.put_stream(
+            "video",
+            {"title": "stream"},
+            audio_format=None,
+            audio_url="https://audio",
+        )
+        cache.put_metadata("video", {"title": "metadata"})
+
+        self.assertEqual(cache.get_stream("video").info, {"title": "stream"})
+
+    def test_is_stream_url_fresh_respects_expire_parameter(self):
+        from util.music.source import is_stream_url_fresh
+
+        self.assertTrue(is_stream_url_fresh("https://audio?expire=100000", now=0.0))
+        self.assertFalse(is_stream_url_fresh("https://audio?expire=100", now=0.0))
+        self.assertTrue(is_stream_url_fresh("https://audio", now=0.0))
+        self.assertFalse(is_stream_url_fresh(None, now=0.0))
+
+    def test_youtube_dl_pool_reuses_instances_up_to_size(self):
+        from util.music.source import YoutubeDLPool
+
+        created = []
+
+        def ydl_factory(opts):
+            created.append(opts)
+            return object()
+
+        pool = YoutubeDLPool(
+            lambda: {"quiet": True},
+            size=2,
+            ydl_factory=ydl_factory,
+            signature=lambda: None,
+        )
+
+        with pool.acquire() as first:
+            with pool.acquire() as second:
+                self.assertIsNot(first, second)
+        with pool.acquire() as reused:
+            self.assertIn(reused, (first, second))
+
+        self.assertEqual(len(created), 2)
+
+    def test_youtube_dl_pool_rebuilds_when_cookies_change(self):
+        from util.music.source import YoutubeDLPool
+
+        signature = ["v1"]
+        created = []
+
+        def ydl_factory(opts):
+            instance = object()
+            created.append(instance)
+            return instance
+
+        pool = YoutubeDLPool(
+            lambda: {"cookiefile": signature[0]},
+            size=1,
+            ydl_factory=ydl_factory,
+            signature=lambda: signature[0],
+        )
+        with pool.acquire() as first:
+            pass
+
+        signature[0] = "v2"
+        with pool.acquire() as second:
+            self.assertIsNot(first, second)
+
+        self.assertEqual(pool.opts, {"cookiefile": "v2"})
+        self.assertEqual(len(created), 2)
+
+    def test_youtube_dl_pools_follow_fallback_profiles_and_executor_size(self):
+        from util.music.source import (
+            YTDL_EXECUTOR_WORKERS,
+            YTDL_POOLS,
+            _summarize_ydl_opts,
+        )
+
+        self.assertEqual(
+            [_summarize_ydl_opts(pool.opts) for pool in YTDL_POOLS],
+            [
+                "pc=android,web hdr=Y",
+                "pc=default hdr=Y",
+                "pc=android,web,ios hdr=Y",
+                "pc=default hdr=N",
+            ],
+        )
+        self.assertTrue(all(pool.size == YTDL_EXECUTOR_WORKERS for pool in YTDL_POOLS))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -35,13 +35,12 @@ class MusicStateTests(unittest.TestCase):
         self.assertFalse(first.is_skipping)
         self.assertFalse(first.is_stopping)
 
-    def test_reset_playback_state_clears_player_queue_loop_and_cancels_updater(self):
-        task = _Task()
+    def test_reset_playback_state_clears_player_queue_loop_and_stops_panel_refresh(self):
         state = GuildMusicState(
             player=object(),
             start_ts=123.4,
             paused_at=100.0,
-            updater_task=task,
+            panel_refresh_active=True,
             is_loop=True,
             is_skipping=True,
             is_stopping=True,
@@ -55,8 +54,7 @@ class MusicStateTests(unittest.TestCase):
         self.assertFalse(state.is_loop)
         self.assertFalse(state.is_skipping)
         self.assertTrue(state.is_stopping)
-        self.assertIsNone(state.updater_task)
-        self.assertTrue(task.cancelled)
+        self.assertFalse(state.panel_refresh_active)
 
     def test_reset_idle_state_clears_elapsed_and_flags_without_touching_queue(self):
         state = GuildMusicState(
@@ -97,28 +95,19 @@ class MusicStateTests(unittest.TestCase):
         self.assertFalse(state.is_skipping)
         self.assertFalse(state.is_stopping)
 
-    def test_finish_music_track_state_cancels_updater_and_marks_end_time(self):
-        task = _Task()
+    def test_finish_music_track_state_stops_panel_refresh_and_marks_end_time(self):
         state = GuildMusicState(
             player=object(),
             start_ts=1.0,
             paused_at=2.0,
-            updater_task=task,
+            panel_refresh_active=True,
         )
 
         finish_music_track_state(state, ended_at=321.0)
 
         self.assertEqual(state.start_ts, 321.0)
         self.assertIsNone(state.paused_at)
-        self.assertTrue(task.cancelled)
-
-
-class _Task:
-    def __init__(self):
-        self.cancelled = False
-
-    def cancel(self):
-        self.cancelled = True
+        self.assertFalse(state.panel_refresh_active)
 
 
 if __name__ == "__main__":
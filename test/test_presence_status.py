@@ -5,6 +5,7 @@ from util.loop.presence_status import (
     build_presence_activity_name,
     count_cached_user_messages,
 )
+from util.message.cache import MessageCache
 
 
 PRESENCE_STATUS_PATH = Path("util/loop/presence_status.py")
@@ -16,37 +17,27 @@ class PresenceStatusTests(unittest.TestCase):
         self.assertTrue(PRESENCE_STATUS_PATH.exists())
         self.assertFalse(LEGACY_PRESENCE_STATUS_PATH.exists())
 
-    def test_counts_only_list_messages_in_guild_user_cache(self):
-        user_messages = {
-            1: {
-                10: ["a", "b"],
-                20: [],
-                30: ("not", "a", "list"),
-            },
-            2: {
-                40: ["c"],
-            },
-            3: ["not-a-guild-map"],
-        }
-
-        self.assertEqual(count_cached_user_messages(user_messages), 3)
+    def test_counts_messages_across_guilds_in_cache(self):
+        cache = MessageCache()
+        cache.add(1, author="a", role="user", text="a", timestamp=1.0)
+        cache.add(1, author="b", role="user", text="b", timestamp=2.0)
+        cache.add(2, author="c", role="user", text="c", timestamp=3.0)
+
+        self.assertEqual(count_cached_user_messages(cache), 3)
 
     def test_builds_presence_activity_name_with_comma_separator(self):
-        user_messages = {
-            1: {
-                10: [object()] * 1000,
-                20: [object()] * 234,
-            },
-        }
+        cache = MessageCache()
+        for index in range(1234):
+            cache.add(1, author=f"user-{index % 20}", role="user", text="", timestamp=index)
 
         self.assertEqual(
-            build_presence_activity_name(user_messages),
+            build_presence_activity_name(cache),
             "/도움 | 1,234개의 채팅 메시지 보관",
         )
 
     def test_builds_zero_count_presence_activity_name(self):
         self.assertEqual(
-            build_presence_activity_name({}),
+            build_presence_activity_name(MessageCache()),
             "/도움 | 0개의 채팅 메시지 보관",
         )
 
@@ -151,18 +151,13 @@ class RuntimeReliabilityGuardTests(unittest.IsolatedAsyncioTestCase):
     def test_message_cache_keeps_only_latest_entries_per_author(self):
         import bot
 
-        guild_map = {}
+        cache = bot.MessageCache(per_author_limit=3)
         for index in range(5):
-            bot.append_cached_message(
-                guild_map,
-                "tester",
-                {"time": str(index)},
-                limit=3,
-            )
+            cache.add(1, author="tester", role="user", text=str(index), timestamp=index)
 
         self.assertEqual(
             ["2", "3", "4"],
-            [message["time"] for message in guild_map["tester"]],
+            [message.text for message in cache.author_messages(1, "tester")],
         )
 
     async def test_youtube_prompt_failure_is_isolated(self):
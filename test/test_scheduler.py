@@ -1,10 +1,17 @@
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 import unittest
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 from bot import SEOUL_TZ
-from cogs.scheduler import SchedulerCog, calculate_recurring_trigger_time
+from cogs.scheduler import (
+    SCHEDULE_RETRY_SECONDS,
+    SCHEDULE_SEND_BATCH_SIZE,
+    SchedulerCog,
+    calculate_recurring_trigger_time,
+)
+from util.scheduler.trigger_heap import ScheduledTriggerHeap
 
 
 class SchedulerRecurringTests(unittest.TestCase):
@@ -39,6 +46,10 @@ class SchedulerDeliveryTests(unittest.IsolatedAsyncioTestCase):
     def build_cog(self, channel):
         cog = object.__new__(SchedulerCog)
         cog.bot = SimpleNamespace(get_channel=lambda _channel_id: channel)
+        cog._triggers = ScheduledTriggerHeap(timezone=SEOUL_TZ)
+        cog._next_sync_at = None
+        cog._pending_deletes = {}
+        cog._pending_reschedules = {}
         return cog
 
     def build_row(self):
@@ -99,8 +110,49 @@ class SchedulerDeliveryTests(unittest.IsolatedAsyncioTestCase):
 
         channel.send.assert_awaited_once()
         execute_query.assert_awaited_once_with(
-            "DELETE FROM scheduled_messages WHERE id = %s",
-            ("schedule-1",),
+            "DELETE FROM scheduled_messages WHERE id IN (%s)",
+            ["schedule-1"],
+        )
+
+    async def test_due_rows_are_deleted_and_rescheduled_in_batches(self):
+        channel = SimpleNamespace(send=AsyncMock())
+        cog = self.build_cog(channel)
+        trigger_time = datetime(2026, 7, 31, 9, 0)
+        rows = [
+            {**self.build_row(), "id": "once-1"},
+            {**self.build_row(), "id": "once-2"},
+            {
+                **self.build_row(),
+                "id": "daily-1",
+                "is_recurring": True,
+                "repeat_type": "daily",
+                "repeat_value": "09:00",
+                "trigger_time": trigger_time,
+            },
+        ]
+
+        with (
+            patch("cogs.scheduler.fetch_all", new=AsyncMock(return_value=rows)),
+            patch("cogs.scheduler.execute_query", new=AsyncMock()) as execute_query,
+        ):
+            await cog._run_schedule_check()
+
+        self.assertEqual(channel.send.await_count, 3)
+        self.assertEqual(execute_query.await_count, 2)
+        delete_call, update_call = execute_query.await_args_list
+        self.assertEqual(
+            delete_call.args,
+            (
+                "DELETE FROM scheduled_messages WHERE id IN (%s, %s)",
+                ["once-1", "once-2"],
+            ),
+        )
+        self.assertIn("CASE id WHEN %s THEN %s END", update_call.args[0])
+        next_run = trigger_time + timedelta(days=1)
+        self.assertEqual(update_call.args[1], ["daily-1", next_run, "daily-1"])
+        self.assertEqual(
+            cog._triggers.next_time(),
+            next_run.replace(tzinfo=SEOUL_TZ),
         )
 
     async def test_query_failure_does_not_terminate_iteration_method(self):
@@ -115,6 +167,119 @@ class SchedulerDeliveryTests(unittest.IsolatedAsyncioTestCase):
         ):
             await cog._run_schedule_check()
 
+    async def test_scheduler_step_resyncs_once_and_returns_after_one_wait(self):
+        cog = self.build_cog(None)
+        due = datetime.now(SEOUL_TZ) - timedelta(seconds=1)
+        fetch_all = AsyncMock(return_value=[{"id": "external", "trigger_time": due}])
+        cog._run_schedule_check = AsyncMock()
+
+        with patch("cogs.scheduler.fetch_all", new=fetch_all):
+            await asyncio.wait_for(cog._run_scheduler(), 1)
+
+        self.assertIsNotNone(cog._next_sync_at)
+        fetch_all.assert_awaited_once()
+        cog._run_schedule_check.assert_awaited_once()
+
+    async def test_failed_resync_waits_before_retrying(self):
+        cog = self.build_cog(None)
+        cog._next_sync_at = datetime.now(SEOUL_TZ) - timedelta(minutes=10)
+        fetch_all = AsyncMock(side_effect=RuntimeError("database unavailable"))
+        cog._triggers.wait = AsyncMock(return_value=False)
+
+        with (
+            patch("cogs.scheduler.fetch_all", new=fetch_all),
+            self.assertLogs("cogs.scheduler", level="ERROR"),
+        ):
+            await cog._run_scheduler()
+            await cog._run_scheduler()
+
+        fetch_all.assert_awaited_once()
+        max_seconds = cog._triggers.wait.await_args.kwargs["max_seconds"]
+        self.assertGreater(max_seconds, SCHEDULE_RETRY_SECONDS - 5)
+        self.assertLessEqual(max_seconds, SCHEDULE_RETRY_SECONDS)
+
+    async def test_results_are_written_after_each_send_batch(self):
+        channel = SimpleNamespace(send=AsyncMock())
+        cog = self.build_cog(channel)
+        rows = [
+            {**self.build_row(), "id": f"once-{index}"}
+            for index in range(SCHEDULE_SEND_BATCH_SIZE + 1)
+        ]
+
+        with (
+            patch("cogs.scheduler.fetch_all", new=AsyncMock(return_value=rows)),
+            patch("cogs.scheduler.execute_query", new=AsyncMock()) as execute_query,
+        ):
+            await cog._run_schedule_check()
+
+        self.assertEqual(execute_query.await_count, 2)
+        first_batch = execute_query.await_args_list[0].args[1]
+        self.assertEqual(len(first_batch), SCHEDULE_SEND_BATCH_SIZE)
+
+    async def test_failed_result_write_is_retried_before_sending_again(self):
+        channel = SimpleNamespace(send=AsyncMock())
+        cog = self.build_cog(channel)
+        rows = [
+            {**self.build_row(), "id": f"once-{index}"}
+            for index in range(SCHEDULE_SEND_BATCH_SIZE + 1)
+        ]
+        fetch_all = AsyncMock(return_value=rows)
+
+        with (
+            patch("cogs.scheduler.fetch_all", new=fetch_all),
+            patch(
+                "cogs.scheduler.execute_query",
+                new=AsyncMock(side_effect=RuntimeError("write failed")),
+            ),
+            self.assertLogs("cogs.scheduler", level="ERROR"),
+        ):
+            await cog._run_schedule_check()
+
+        self.assertEqual(channel.send.await_count, SCHEDULE_SEND_BATCH_SIZE)
+        self.assertEqual(len(cog._pending_deletes), SCHEDULE_SEND_BATCH_SIZE)
+        self.assertIsNotNone(cog._triggers.next_time())
+
+        with (
+            patch("cogs.scheduler.fetch_all", new=fetch_all),
+            patch(
+                "cogs.scheduler.execute_query",
+                new=AsyncMock(side_effect=RuntimeError("write failed")),
+            ),
+            self.assertLogs("cogs.scheduler", level="ERROR"),
+        ):
+            await cog._run_schedule_check()
+
+        self.assertEqual(channel.send.await_count, SCHEDULE_SEND_BATCH_SIZE)
+        fetch_all.assert_awaited_once()
+
+
+class ScheduledTriggerHeapTests(unittest.IsolatedAsyncioTestCase):
+    def test_pop_due_returns_only_elapsed_triggers_in_time_order(self):
+        now = datetime(2026, 7, 31, 12, 0, tzinfo=SEOUL_TZ)
+        heap = ScheduledTriggerHeap(timezone=SEOUL_TZ, clock=lambda: now)
+        heap.push("later", now + timedelta(minutes=5))
+        heap.push("second", now - timedelta(seconds=1))
+        heap.push("first", datetime(2026, 7, 31, 11, 0))
+
+        self.assertEqual(heap.pop_due(), ["first", "second"])
+        self.assertEqual(heap.next_time(), now + timedelta(minutes=5))
+
+    async def test_wait_sleeps_until_next_trigger(self):
+        heap = ScheduledTriggerHeap(timezone=SEOUL_TZ)
+        heap.push("soon", datetime.now(SEOUL_TZ) + timedelta(milliseconds=50))
+
+        self.assertTrue(await asyncio.wait_for(heap.wait(max_seconds=5), 1))
+        self.assertEqual(heap.pop_due(), ["soon"])
+
+    async def test_push_wakes_waiter_before_timeout(self):
+        heap = ScheduledTriggerHeap(timezone=SEOUL_TZ)
+        waiter = asyncio.create_task(heap.wait(max_seconds=60))
+        await asyncio.sleep(0)
+
+        heap.push("now", datetime.now(SEOUL_TZ) - timedelta(seconds=1))
+
+        self.assertTrue(await asyncio.wait_for(waiter, 1))
+
 
 if __name__ == "__main__":
     unittest.main()
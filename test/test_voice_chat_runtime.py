@@ -4,14 +4,26 @@ import unittest
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
+
 import cogs.voice_chat as voice_chat_module
 from cogs.voice_chat import StreamingSink, VoiceChat
-from cogs.voice_chat.settings import (
+from cogs.voice_chat.transcription import (
+    WHISPER_SAMPLE_RATE,
+    SpeakerTranscriptionQueue,
+    VoiceUtterance,
+    merge_voice_utterances,
+)
+from cogs.voice_chat.vad import FRAME_SAMPLES, WHISPER_FRAME_SAMPLES, SpeakerVad
+from util.whisper.model_registry import WhisperModelRegistry
+from util.whisper.settings import (
     CPU_WHISPER_COMPUTE_TYPE,
     CPU_WHISPER_MODEL,
     CUDA_WHISPER_COMPUTE_TYPE,
     CUDA_WHISPER_MODEL,
+    MAX_WHISPER_CPU_THREADS,
     resolve_whisper_settings,
+    whisper_model_options,
 )
 
 
@@ -76,6 +88,30 @@ class VoiceChatSettingsTests(unittest.TestCase):
         self.assertEqual("cpu", settings.device)
         self.assertEqual(CPU_WHISPER_COMPUTE_TYPE, settings.compute_type)
 
+    def test_worker_count_is_clamped_and_shared_with_model_options(self):
+        self.assertEqual(2, resolve_whisper_settings({}).workers)
+        self.assertEqual(
+            2,
+            resolve_whisper_settings({"VOICE_CHAT_WHISPER_WORKERS": "many"}).workers,
+        )
+        settings = resolve_whisper_settings(
+            {"VOICE_CHAT_WHISPER_DEVICE": "cuda", "VOICE_CHAT_WHISPER_WORKERS": "64"}
+        )
+
+        self.assertEqual(8, settings.workers)
+        self.assertEqual({"num_workers": 8}, whisper_model_options(settings))
+
+    def test_cpu_threads_use_available_cores_and_stay_capped(self):
+        settings = resolve_whisper_settings({"VOICE_CHAT_WHISPER_WORKERS": "2"})
+
+        with patch("util.whisper.settings._available_cpu_count", return_value=64):
+            options = whisper_model_options(settings)
+        with patch("util.whisper.settings._available_cpu_count", return_value=2):
+            small_options = whisper_model_options(settings)
+
+        self.assertEqual(MAX_WHISPER_CPU_THREADS, options["cpu_threads"])
+        self.assertEqual(1, small_options["cpu_threads"])
+
 
 class StreamingSinkTests(unittest.TestCase):
     def build_sink(self, *, dave_protocol_version=1):
@@ -195,6 +231,157 @@ class StreamingSinkTests(unittest.TestCase):
         self.assertNotIn(55, sink.opus_decoders)
         self.assertEqual(1, sink.decode_error_counts["opus"])
 
+    def test_write_hands_finished_utterance_to_cog_queue_on_event_loop(self):
+        sink, _session = self.build_sink()
+        sink.cog.submit_utterance = Mock()
+        user = Mock(id=101)
+        user.name = "speaker"
+        packets = [_frame(0)] * 20 + [_frame(2000)] * 25 + [_frame(0)] * 50
+
+        with patch.object(sink, "_decode_voice_packet", side_effect=packets):
+            for _packet in packets:
+                sink.write(user, None)
+
+        callback, utterance = sink.cog.bot.loop.call_soon_threadsafe.call_args.args
+        sink.cog.bot.loop.call_soon_threadsafe.assert_called_once()
+        self.assertIs(sink.cog.submit_utterance, callback)
+        self.assertIs(user, utterance.speaker)
+        self.assertEqual("session-1", utterance.session_id)
+        self.assertEqual(np.float32, utterance.audio.dtype)
+        # 프리롤 0.2초 + 발화 0.5초 + 포스트롤 0.2초
+        self.assertAlmostEqual(0.9, utterance.duration)
+
+
+def _frame(value: int, frames: int = 1) -> bytes:
+    return np.full(FRAME_SAMPLES * frames, value, dtype=np.int16).tobytes()
+
+
+def _vad(**overrides) -> SpeakerVad:
+    options = {
+        "threshold": 700,
+        "silence_duration": 0.6,
+        "min_speech_duration": 0.25,
+        "pre_speech_duration": 0.2,
+        "post_speech_duration": 0.2,
+    }
+    options.update(overrides)
+    return SpeakerVad(**options)
+
+
+class SpeakerVadTests(unittest.TestCase):
+    def test_batched_frames_keep_pre_roll_order_and_downmix_to_whisper_audio(self):
+        vad = _vad(pre_speech_duration=0.04, post_speech_duration=0.0)
+        staging = vad._staging
+
+        # 패킷 경계와 배치 경계가 어긋나도 프레임 단위로 이어 붙는다
+        pcm = _frame(100) + _frame(200) + _frame(16384, 11) + _frame(0, 33)
+        finished = []
+        for offset in range(0, len(pcm), 1000):
+            finished.extend(vad.feed(pcm[offset : offset + 1000]))
+
+        self.assertIs(staging, vad._staging)
+        self.assertEqual(1, len(finished))
+        audio = finished[0]
+        self.assertEqual(13 * WHISPER_FRAME_SAMPLES, len(audio))
+        np.testing.assert_allclose(audio[0], 100 / 32768)
+        np.testing.assert_allclose(audio[WHISPER_FRAME_SAMPLES], 200 / 32768)
+        np.testing.assert_allclose(audio[-1], 0.5)
+
+    def test_short_bursts_are_dropped_and_long_speech_is_split(self):
+        short = _vad(pre_speech_duration=0.02, post_speech_duration=0.0)
+        self.assertEqual([], short.feed(_frame(2000, 5) + _frame(0, 35)))
+
+        long = _vad(max_utterance_seconds=1.0)
+        finished = long.feed(_frame(2000, 75))
+
+        self.assertEqual([WHISPER_SAMPLE_RATE], [len(audio) for audio in finished])
+        self.assertTrue(long.speaking)
+
+    def test_merged_utterance_concatenates_audio_in_order(self):
+        speaker = SimpleNamespace(id=1)
+        first = VoiceUtterance(np.ones(2, dtype=np.float32), speaker, None, "s")
+        second = VoiceUtterance(np.zeros(3, dtype=np.float32), speaker, None, "s")
+
+        merged = merge_voice_utterances([first, second])
+
+        np.testing.assert_array_equal(merged.audio, [1, 1, 0, 0, 0])
+        self.assertEqual("s", merged.session_id)
+
+
+class SpeakerTranscriptionQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_speakers_run_concurrently_but_each_speaker_stays_ordered(self):
+        release = asyncio.Event()
+        started: list[str] = []
+
+        async def handle(item):
+            started.append(item)
+            await release.wait()
+
+        queue = SpeakerTranscriptionQueue(handle, workers=2)
+        queue.submit("a", "a1")
+        queue.submit("a", "a2")
+        queue.submit("b", "b1")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        self.assertEqual(["a1", "b1"], started)
+        release.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        self.assertEqual(["a1", "b1", "a2"], started)
+        await queue.close()
+
+    async def test_backlog_sheds_oldest_or_merges_when_merge_is_given(self):
+        discarded: list[str] = []
+        shed = SpeakerTranscriptionQueue(
+            AsyncMock(),
+            workers=1,
+            max_pending=2,
+            discard=discarded.append,
+        )
+        merged = SpeakerTranscriptionQueue(
+            AsyncMock(),
+            workers=1,
+            max_pending=2,
+            merge="+".join,
+        )
+        for item in ("1", "2", "3"):
+            shed.submit("a", item)
+            merged.submit("a", item)
+
+        self.assertEqual(["1"], discarded)
+        self.assertEqual(["2", "3"], [p.item for p in shed._speakers["a"].pending])
+        self.assertEqual(["1+2", "3"], [p.item for p in merged._speakers["a"].pending])
+        await shed.close()
+        await merged.close()
+        self.assertEqual(["1", "2", "3"], discarded)
+
+    async def test_stale_utterances_are_dropped_before_transcription(self):
+        now = [0.0]
+        handled: list[str] = []
+        discarded: list[str] = []
+
+        async def handle(item):
+            handled.append(item)
+
+        queue = SpeakerTranscriptionQueue(
+            handle,
+            workers=1,
+            max_lag_seconds=10.0,
+            discard=discarded.append,
+            clock=lambda: now[0],
+        )
+        queue.submit("a", "old")
+        now[0] = 11.0
+        queue.submit("a", "fresh")
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        self.assertEqual(["fresh"], handled)
+        self.assertEqual(["old"], discarded)
+        self.assertEqual(0, queue.pending_count())
+        await queue.close()
+
 
 class VoiceChatRuntimeTests(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
@@ -212,17 +399,16 @@ class VoiceChatRuntimeTests(unittest.IsolatedAsyncioTestCase):
             "VOICE_CHAT_WHISPER_DEVICE": "cpu",
             "VOICE_CHAT_WHISPER_MODEL": "",
             "VOICE_CHAT_WHISPER_COMPUTE_TYPE": "",
+            "VOICE_CHAT_WHISPER_WORKERS": "2",
         }
 
         with (
             patch.dict(os.environ, environment),
             patch("shutil.which", return_value="ffmpeg"),
-            patch.object(
-                voice_chat_module,
-                "WhisperModel",
-                return_value=model,
-            ) as whisper_model,
+            patch("util.whisper.settings._available_cpu_count", return_value=8),
         ):
+            whisper_model = Mock(return_value=model)
+            self.cog.model_registry = WhisperModelRegistry(factory=whisper_model)
             await asyncio.gather(
                 self.cog.load_model(),
                 self.cog.load_model(),
@@ -233,7 +419,17 @@ class VoiceChatRuntimeTests(unittest.IsolatedAsyncioTestCase):
             CPU_WHISPER_MODEL,
             device="cpu",
             compute_type=CPU_WHISPER_COMPUTE_TYPE,
+            num_workers=2,
+            cpu_threads=4,
         )
+        spec = self.cog.model_settings.spec
+        self.assertEqual(1, self.cog.model_registry.ref_count(spec))
+
+        self.cog.release_model()
+
+        self.assertIsNone(self.cog.model)
+        self.assertEqual(0, self.cog.model_registry.ref_count(spec))
+        self.cog.model_registry.close()
 
     async def test_start_chat_acknowledges_interaction_and_keys_task_by_guild(self):
         voice_channel = SimpleNamespace(id=200)
@@ -351,22 +547,18 @@ class VoiceChatRuntimeTests(unittest.IsolatedAsyncioTestCase):
         speaker = SimpleNamespace(name="speaker", display_name="Speaker")
         vc = SimpleNamespace(guild=SimpleNamespace(id=300))
 
-        async def transcribe_and_stop(_filepath):
+        async def transcribe_and_stop(_audio):
             self.cog.chat_data.pop(300, None)
             return "종료 뒤 결과"
 
         self.cog.transcribe = AsyncMock(side_effect=transcribe_and_stop)
 
-        with (
-            patch.object(os.path, "getsize", return_value=192044),
-            patch.object(os.path, "exists", return_value=False),
-        ):
-            await self.cog.process_audio(
-                "voice.wav",
-                speaker,
-                vc,
-                session_id,
-            )
+        await self.cog.process_audio(
+            np.zeros(WHISPER_SAMPLE_RATE * 2, dtype=np.float32),
+            speaker,
+            vc,
+            session_id,
+        )
 
         self.assertEqual([], queue)
 
@@ -383,21 +575,35 @@ class VoiceChatRuntimeTests(unittest.IsolatedAsyncioTestCase):
         vc = SimpleNamespace(guild=SimpleNamespace(id=300))
         self.cog.transcribe = AsyncMock(return_value="안녕하세요")
 
-        with (
-            patch.object(os.path, "getsize", return_value=192044),
-            patch.object(os.path, "exists", return_value=False),
-        ):
-            await self.cog.process_audio(
-                "voice.wav",
-                speaker,
-                vc,
-                session_id,
-            )
+        await self.cog.process_audio(
+            np.zeros(WHISPER_SAMPLE_RATE * 2, dtype=np.float32),
+            speaker,
+            vc,
+            session_id,
+        )
 
         self.assertEqual(1, len(queue))
         self.assertIn("안녕하세요", queue[0])
         self.cog.chat_data.pop(300, None)
 
+    async def test_submitted_utterance_is_transcribed_by_worker_pool(self):
+        self.cog.model_settings = resolve_whisper_settings(
+            {"VOICE_CHAT_WHISPER_WORKERS": "3"}
+        )
+        self.cog.process_audio = AsyncMock()
+        speaker = SimpleNamespace(id=101, name="speaker")
+        vc = SimpleNamespace(guild=SimpleNamespace(id=300))
+
+        audio = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+        self.cog.submit_utterance(VoiceUtterance(audio, speaker, vc, "s"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        self.assertEqual(3, self.cog._transcription_queue.worker_count)
+        self.cog.process_audio.assert_awaited_once_with(audio, speaker, vc, "s")
+        await self.cog.cog_unload()
+        self.assertIsNone(self.cog._transcription_queue)
+
 
 if __name__ == "__main__":
     unittest.main()
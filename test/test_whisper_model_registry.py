@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from util.whisper.model_registry import WhisperModelRegistry, WhisperModelSpec
+
+
+TINY = WhisperModelSpec("tiny", "cpu", "int8")
+
+
+class WhisperModelRegistryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_acquires_share_one_lazy_load(self):
+        factory = Mock(side_effect=lambda *_args, **_kwargs: object())
+        registry = WhisperModelRegistry(factory=factory)
+
+        first, second = await asyncio.gather(
+            registry.acquire(TINY, num_workers=2),
+            registry.acquire(TINY, num_workers=2),
+        )
+
+        self.assertIs(first, second)
+        factory.assert_called_once_with(
+            "tiny",
+            device="cpu",
+            compute_type="int8",
+            num_workers=2,
+        )
+        self.assertEqual(2, registry.ref_count(TINY))
+        registry.close()
+
+    async def test_reusing_loaded_model_with_other_options_logs_warning(self):
+        factory = Mock(side_effect=lambda *_args, **_kwargs: object())
+        registry = WhisperModelRegistry(factory=factory)
+        first = await registry.acquire(TINY, num_workers=1)
+
+        with self.assertLogs("util.whisper.model_registry", level="WARNING") as logs:
+            second = await registry.acquire(TINY, num_workers=2, cpu_threads=4)
+
+        self.assertIs(first, second)
+        factory.assert_called_once()
+        self.assertIn("num_workers", logs.output[0])
+        registry.close()
+
+    async def test_model_is_unloaded_only_after_idle_without_references(self):
+        factory = Mock(side_effect=lambda *_args, **_kwargs: object())
+        registry = WhisperModelRegistry(factory=factory, idle_seconds=0.01)
+
+        async with registry.lease(TINY) as model:
+            pass
+        reused = await registry.acquire(TINY)
+        await asyncio.sleep(0.02)
+
+        self.assertIs(model, reused)
+        self.assertTrue(registry.is_loaded(TINY))
+
+        registry.release(TINY)
+        await asyncio.sleep(0.02)
+
+        self.assertFalse(registry.is_loaded(TINY))
+        await registry.acquire(TINY)
+        self.assertEqual(2, factory.call_count)
+        registry.close()
+
+    async def test_failed_load_is_not_cached(self):
+        factory = Mock(side_effect=[RuntimeError("cuda"), object()])
+        registry = WhisperModelRegistry(factory=factory)
+
+        with self.assertRaises(RuntimeError):
+            await registry.acquire(TINY)
+
+        self.assertFalse(registry.is_loaded(TINY))
+        await registry.acquire(TINY)
+        self.assertEqual(1, registry.ref_count(TINY))
+        registry.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,18 @@
 import unittest
 from dataclasses import replace
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from util.youtube.feed_fallback import (
     YouTubeFeedFallbackState,
+    YouTubeFeedValidators,
     fetch_youtube_feed_entries,
-    poll_youtube_feed_fallback,
+    poll_youtube_channel_feed_fallback,
     remember_youtube_feed_entry_seen,
     should_poll_youtube_feed,
 )
 from util.youtube.subscriptions import YouTubeSubscription
+from util.youtube.video_candidate_runner import YouTubeVideoCandidateResult
 from util.youtube.websub import YouTubeAtomEntry
 
 
@@ -115,22 +117,7 @@ class YouTubeFeedFallbackTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_fetch_feed_entries_parses_atom_and_returns_empty_on_http_error(self):
         success_entries = await fetch_youtube_feed_entries(
-            _Session(
-                200,
-                """<?xml version="1.0" encoding="UTF-8"?>
-<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
-      xmlns="http://www.w3.org/2005/Atom">
-  <entry>
-    <yt:videoId>VIDEO123</yt:videoId>
-    <yt:channelId>UC_TEST</yt:channelId>
-    <title>테스트 라이브</title>
-    <link rel="alternate" href="https://www.youtube.com/watch?v=VIDEO123"/>
-    <published>2026-06-23T01:00:00+00:00</published>
-    <updated>2026-06-23T01:10:00+00:00</updated>
-  </entry>
-</feed>
-""",
-            ),
+            _Session(200, _ATOM_FEED),
             _subscription(),
             log=lambda _message: None,
         )
@@ -143,7 +130,7 @@ class YouTubeFeedFallbackTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual([entry.video_id for entry in success_entries], ["VIDEO123"])
         self.assertEqual(failed_entries, [])
 
-    async def test_poll_feed_fallback_processes_matching_entries_and_refreshes(self):
+    async def test_poll_feed_fallback_processes_matching_entries_and_threads_state(self):
         state = YouTubeFeedFallbackState(
             seen_updates={
                 1: {"skip-seen": "2026-06-23T01:10:00+00:00"},
@@ -156,53 +143,208 @@ class YouTubeFeedFallbackTests(unittest.IsolatedAsyncioTestCase):
         )
         processed_video_ids: list[str] = []
 
-        async def process_candidate(_subscription, video_id: str):
+        async def resolve_candidate(target, video_id: str, **_kwargs):
             processed_video_ids.append(video_id)
-            return "processed"
+            return YouTubeVideoCandidateResult(
+                "processed",
+                replace(target, channel_name=f"updated-{video_id}"),
+            )
 
-        async def fetch_entries(_session, _subscription):
+        async def fetch_entries(_session, _subscription, **_kwargs):
             return [
                 _entry("wrong-channel", channel_id="UC_OTHER"),
                 _entry("skip-seen"),
                 _entry("process-me", updated="2026-06-23T01:11:00+00:00"),
             ]
 
-        async def get_subscription(subscription_id: int):
-            return replace(subscription, channel_name=f"refreshed-{subscription_id}")
-
-        result = await poll_youtube_feed_fallback(
-            process_candidate,
+        result = await poll_youtube_channel_feed_fallback(
+            resolve_candidate,
             state,
-            subscription,
+            [subscription],
             object(),
             fetch_entries=fetch_entries,
-            get_subscription=get_subscription,
             now=datetime(2026, 6, 23, 1, 10, tzinfo=timezone.utc),
             interval_seconds=300,
             max_entries=5,
         )
 
         self.assertEqual(processed_video_ids, ["process-me"])
-        self.assertEqual(result.channel_name, "refreshed-1")
+        self.assertEqual([sub.channel_name for sub in result], ["updated-process-me"])
         self.assertEqual(
             state.seen_updates[1]["process-me"],
             "2026-06-23T01:11:00+00:00",
         )
 
+    async def test_poll_channel_feed_fallback_shares_fetches_across_guilds(self):
+        # 새 구독(2)이 섞여 있으면 저장된 검증자를 버리고 전체 피드를 받아야 한다
+        state = YouTubeFeedFallbackState(
+            seen_updates={1: {}},
+            validators={"UC_TEST": YouTubeFeedValidators(etag='"v1"')},
+        )
+        subscriptions = [_subscription(id=1), _subscription(id=2, guild_id=20)]
+        sent_validators: list[dict] = []
+        feed_fetches: list[int] = []
+        status_fetches: list[list[str]] = []
+        resolved: list[tuple[int, str, dict]] = []
+
+        async def fetch_entries(_session, target, *, validators):
+            feed_fetches.append(target.id)
+            sent_validators.append(dict(validators))
+            return [_entry("video-1")]
+
+        async def fetch_video_statuses(video_ids):
+            status_fetches.append(list(video_ids))
+            return {"video-1": "status"}
+
+        async def resolve_candidate(target, video_id: str, *, known_statuses=None):
+            resolved.append((target.id, video_id, known_statuses))
+            return YouTubeVideoCandidateResult("processed", target)
+
+        await poll_youtube_channel_feed_fallback(
+            resolve_candidate,
+            state,
+            subscriptions,
+            object(),
+            fetch_entries=fetch_entries,
+            fetch_video_statuses=fetch_video_statuses,
+            now=datetime(2026, 6, 23, 1, 10, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(feed_fetches, [1])
+        self.assertEqual(sent_validators, [{}])
+        self.assertEqual(status_fetches, [["video-1"]])
+        self.assertEqual(
+            resolved,
+            [
+                (1, "video-1", {"video-1": "status"}),
+                (2, "video-1", {"video-1": "status"}),
+            ],
+        )
+
+    async def test_poll_channel_feed_fallback_checks_all_guilds_of_a_channel_together(self):
+        # 구독마다 확인 시각이 달라도 한 구독이 받은 검증자로 다른 구독이 304를 받지 않아야 한다
+        now = datetime(2026, 6, 23, 1, 10, tzinfo=timezone.utc)
+        state = YouTubeFeedFallbackState(
+            checked_at={1: now - timedelta(seconds=300), 2: now - timedelta(seconds=100)},
+            seen_updates={1: {}, 2: {}},
+        )
+        subscriptions = [_subscription(id=1), _subscription(id=2, guild_id=20)]
+        resolved: list[int] = []
+
+        async def fetch_entries(_session, _target, *, validators):
+            return [_entry("video-1")]
+
+        async def resolve_candidate(target, _video_id: str, **_kwargs):
+            resolved.append(target.id)
+            return YouTubeVideoCandidateResult("processed", target)
+
+        await poll_youtube_channel_feed_fallback(
+            resolve_candidate,
+            state,
+            subscriptions,
+            object(),
+            fetch_entries=fetch_entries,
+            now=now,
+        )
+
+        self.assertEqual(resolved, [1, 2])
+        self.assertEqual(state.checked_at, {1: now, 2: now})
+
+    async def test_fetch_feed_entries_sends_validators_and_skips_not_modified(self):
+        validators: dict[str, YouTubeFeedValidators] = {}
+        fresh_session = _Session(
+            200,
+            _ATOM_FEED,
+            headers={"ETag": '"v1"', "Last-Modified": "Tue, 23 Jun 2026 01:10:00 GMT"},
+        )
+
+        entries = await fetch_youtube_feed_entries(
+            fresh_session,
+            _subscription(),
+            validators=validators,
+        )
+
+        self.assertEqual([entry.video_id for entry in entries], ["VIDEO123"])
+        self.assertIsNone(fresh_session.requests[0])
+        self.assertEqual(
+            validators["UC_TEST"],
+            YouTubeFeedValidators('"v1"', "Tue, 23 Jun 2026 01:10:00 GMT"),
+        )
+
+        not_modified_session = _Session(304, "")
+        entries = await fetch_youtube_feed_entries(
+            not_modified_session,
+            _subscription(),
+            validators=validators,
+        )
+
+        self.assertEqual(entries, [])
+        self.assertEqual(
+            not_modified_session.requests[0],
+            {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Tue, 23 Jun 2026 01:10:00 GMT",
+            },
+        )
+        self.assertIn("UC_TEST", validators)
+
+    async def test_poll_feed_fallback_drops_validators_when_processing_fails(self):
+        state = YouTubeFeedFallbackState(
+            seen_updates={1: {}},
+            validators={"UC_TEST": YouTubeFeedValidators(etag='"v1"')},
+        )
+
+        async def resolve_candidate(_subscription, _video_id: str, **_kwargs):
+            raise RuntimeError("boom")
+
+        async def fetch_entries(_session, _subscription, **_kwargs):
+            return [_entry("process-me")]
+
+        with self.assertRaises(RuntimeError):
+            await poll_youtube_channel_feed_fallback(
+                resolve_candidate,
+                state,
+                [_subscription()],
+                object(),
+                fetch_entries=fetch_entries,
+                now=datetime(2026, 6, 23, 1, 10, tzinfo=timezone.utc),
+            )
+
+        self.assertNotIn("UC_TEST", state.validators)
+
+
+_ATOM_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <yt:videoId>VIDEO123</yt:videoId>
+    <yt:channelId>UC_TEST</yt:channelId>
+    <title>테스트 라이브</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=VIDEO123"/>
+    <published>2026-06-23T01:00:00+00:00</published>
+    <updated>2026-06-23T01:10:00+00:00</updated>
+  </entry>
+</feed>
+"""
+
 
 class _Session:
-    def __init__(self, status: int, body: str):
+    def __init__(self, status: int, body: str, *, headers: dict | None = None):
         self.status = status
         self.body = body
+        self.headers = headers or {}
+        self.requests: list[dict | None] = []
 
-    def get(self, _url: str):
-        return _Response(self.status, self.body)
+    def get(self, _url: str, *, headers: dict | None = None):
+        self.requests.append(headers)
+        return _Response(self.status, self.body, self.headers)
 
 
 class _Response:
-    def __init__(self, status: int, body: str):
+    def __init__(self, status: int, body: str, headers: dict):
         self.status = status
         self.body = body
+        self.headers = headers
 
     async def __aenter__(self):
         return self
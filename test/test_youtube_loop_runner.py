@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from dataclasses import replace
 from pathlib import Path
@@ -8,6 +9,7 @@ from util.youtube.loop_runner import (
     run_youtube_notification_candidates,
 )
 from util.youtube.subscriptions import YouTubeSubscription
+from util.youtube.video_candidate_runner import YouTubeVideoCandidateResult
 
 
 YOUTUBE_LOOP_RUNNER_PATH = Path("util/youtube/loop_runner.py")
@@ -17,6 +19,7 @@ LEGACY_YOUTUBE_LOOP_RUNNER_PATH = Path("util/youtube_loop_runner.py")
 def _subscription(
     subscription_id: int,
     *,
+    channel_id: str | None = None,
     pending_videos: dict | None = None,
     community_alert_enabled: bool = False,
 ) -> YouTubeSubscription:
@@ -24,7 +27,7 @@ def _subscription(
         id=subscription_id,
         guild_id=10,
         channel_name=f"채널 {subscription_id}",
-        channel_id=f"UC_{subscription_id}",
+        channel_id=channel_id or f"UC_{subscription_id}",
         channel_handle=None,
         source_input=f"UC_{subscription_id}",
         websub_subscribed_at=None,
@@ -35,37 +38,28 @@ def _subscription(
     )
 
 
-class FakeSession:
-    async def __aenter__(self):
-        return self
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
-
-class FakeSessionFactory:
-    def __init__(self, **_kwargs):
-        self.session = FakeSession()
-
-    async def __aenter__(self):
-        return self.session
-
-    async def __aexit__(self, exc_type, exc, tb):
-        return False
-
-
 class FakeNotificationOwner:
     def __init__(self):
         self.deleted_legacy_setting = False
         self.removed_pending: list[str] = []
         self.processed_candidates: list[str] = []
         self.processed_pending: list[dict] = []
+        self.status_batches: list[list[str]] = []
+        self.known_statuses: list[dict | None] = []
+        self.feed_session = object()
+        self.polled_sessions: list[object] = []
+        self.polled_groups: list[list[int]] = []
 
     async def _delete_legacy_youtube_live_checker_setting_once(self):
         self.deleted_legacy_setting = True
 
-    async def _poll_youtube_feed_fallback(self, subscription, _session):
-        return subscription
+    def _get_youtube_feed_session(self):
+        return self.feed_session
+
+    async def _poll_youtube_channel_feed_fallback(self, subscriptions, session):
+        self.polled_sessions.append(session)
+        self.polled_groups.append([subscription.id for subscription in subscriptions])
+        return list(subscriptions)
 
     async def _remove_pending_youtube_video(self, subscription, video_id):
         self.removed_pending.append(video_id)
@@ -76,17 +70,35 @@ class FakeNotificationOwner:
     def _should_check_pending_youtube_video(self, pending_entry):
         return bool(pending_entry.get("check"))
 
-    async def _process_youtube_video_candidate(self, subscription, video_id):
+    async def _fetch_youtube_video_statuses(self, video_ids):
+        self.status_batches.append(list(video_ids))
+        return {video_id: f"status-{video_id}" for video_id in video_ids}
+
+    async def _resolve_youtube_video_candidate(
+        self,
+        subscription,
+        video_id,
+        *,
+        known_statuses=None,
+    ):
         self.processed_candidates.append(video_id)
         self.processed_pending.append(dict(subscription.pending_videos))
+        self.known_statuses.append(known_statuses)
+        pending = dict(subscription.pending_videos)
+        pending.pop(video_id, None)
+        return YouTubeVideoCandidateResult(
+            "not_live",
+            replace(subscription, pending_videos=pending),
+        )
 
 
 class FakeCommunityOwner:
     def __init__(self):
-        self.polled_subscription_ids: list[int] = []
+        self.polled_groups: list[list[int]] = []
 
-    async def _poll_youtube_community_posts(self, subscription):
-        self.polled_subscription_ids.append(subscription.id)
+    async def _poll_youtube_channel_community_posts(self, subscriptions):
+        self.polled_groups.append([subscription.id for subscription in subscriptions])
+        return list(subscriptions)
 
 
 class YouTubeLoopRunnerTests(unittest.IsolatedAsyncioTestCase):
@@ -123,15 +135,7 @@ class YouTubeLoopRunnerTests(unittest.IsolatedAsyncioTestCase):
                 "util.youtube.loop_runner.touch_pending_youtube_video_check",
                 touch_pending,
             ):
-                with patch(
-                    "util.youtube.loop_runner.get_youtube_subscription",
-                    new=AsyncMock(return_value=None),
-                ):
-                    with patch(
-                        "util.youtube.loop_runner.aiohttp.ClientSession",
-                        FakeSessionFactory,
-                    ):
-                        await run_youtube_notification_candidates(owner)
+                await run_youtube_notification_candidates(owner)
 
         self.assertTrue(owner.deleted_legacy_setting)
         self.assertEqual(owner.removed_pending, ["bad"])
@@ -151,11 +155,111 @@ class YouTubeLoopRunnerTests(unittest.IsolatedAsyncioTestCase):
             ],
         )
 
+    async def test_notification_runner_resolves_all_due_videos_in_one_batch(self):
+        owner = FakeNotificationOwner()
+        subscriptions = [
+            _subscription(1, pending_videos={"a": {"check": True}, "b": {"check": True}}),
+            _subscription(2, pending_videos={"c": {"check": True}}),
+            _subscription(3),
+        ]
+
+        async def _touch_pending(subscription, video_id, pending_entry):
+            return subscription
+
+        with patch(
+            "util.youtube.loop_runner.list_all_youtube_subscriptions",
+            new=AsyncMock(return_value=subscriptions),
+        ):
+            with patch(
+                "util.youtube.loop_runner.touch_pending_youtube_video_check",
+                new=AsyncMock(side_effect=_touch_pending),
+            ):
+                await run_youtube_notification_candidates(owner)
+
+        self.assertEqual(owner.polled_sessions, [owner.feed_session] * 3)
+        self.assertEqual(owner.status_batches, [["a", "b", "c"]])
+        self.assertEqual(owner.processed_candidates, ["a", "b", "c"])
+        self.assertEqual(owner.known_statuses[0]["c"], "status-c")
+
+    async def test_notification_runner_groups_channels_and_threads_state(self):
+        owner = FakeNotificationOwner()
+        subscriptions = [
+            _subscription(
+                1,
+                channel_id="UC_SHARED",
+                pending_videos={"a": {"check": True}},
+            ),
+            _subscription(2, channel_id="UC_OTHER"),
+            _subscription(
+                3,
+                channel_id="UC_SHARED",
+                pending_videos={"a": {"check": True}, "b": {"check": True}},
+            ),
+        ]
+
+        async def _touch_pending(subscription, video_id, pending_entry):
+            return subscription
+
+        with patch(
+            "util.youtube.loop_runner.list_all_youtube_subscriptions",
+            new=AsyncMock(return_value=subscriptions),
+        ):
+            with patch(
+                "util.youtube.loop_runner.touch_pending_youtube_video_check",
+                new=AsyncMock(side_effect=_touch_pending),
+            ):
+                await run_youtube_notification_candidates(owner)
+
+        self.assertCountEqual(owner.polled_groups, [[1, 3], [2]])
+        self.assertEqual(owner.status_batches, [["a", "a", "b"]])
+        self.assertEqual(owner.processed_candidates, ["a", "a", "b"])
+        # 같은 구독의 두 번째 후보는 DB 재조회 없이 앞선 처리 결과를 이어받는다
+        self.assertEqual(owner.processed_pending[2], {"b": {"check": True}})
+
+    async def test_notification_runner_bounds_concurrency_and_isolates_failures(self):
+        running = 0
+        peak = 0
+
+        class SlowOwner(FakeNotificationOwner):
+            async def _poll_youtube_channel_feed_fallback(self, subscriptions, session):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0)
+                running -= 1
+                if subscriptions[0].id == 1:
+                    raise RuntimeError("slow channel failed")
+                return list(subscriptions)
+
+        owner = SlowOwner()
+        subscriptions = [
+            _subscription(index, pending_videos={"v": {"check": True}})
+            for index in range(1, 6)
+        ]
+
+        async def _touch_pending(subscription, video_id, pending_entry):
+            return subscription
+
+        with patch(
+            "util.youtube.loop_runner.list_all_youtube_subscriptions",
+            new=AsyncMock(return_value=subscriptions),
+        ):
+            with patch(
+                "util.youtube.loop_runner.touch_pending_youtube_video_check",
+                new=AsyncMock(side_effect=_touch_pending),
+            ):
+                with self.assertLogs("util.youtube.loop_runner", level="ERROR"):
+                    await run_youtube_notification_candidates(owner, concurrency=2)
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(len(owner.processed_candidates), 4)
+
     async def test_community_runner_polls_only_enabled_subscriptions(self):
         owner = FakeCommunityOwner()
         subscriptions = [
             _subscription(1, community_alert_enabled=False),
             _subscription(2, community_alert_enabled=True),
+            _subscription(3, channel_id="UC_2", community_alert_enabled=True),
         ]
 
         with patch(
@@ -164,7 +268,7 @@ class YouTubeLoopRunnerTests(unittest.IsolatedAsyncioTestCase):
         ):
             await run_youtube_community_posts(owner)
 
-        self.assertEqual(owner.polled_subscription_ids, [2])
+        self.assertEqual(owner.polled_groups, [[2, 3]])
 
 
 if __name__ == "__main__":
@@ -1,6 +1,15 @@
+import os
+import tempfile
 import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
-from func.youtube_media import build_headers_str
+from func.youtube_media import (
+    build_headers_str,
+    speech_to_text,
+    youtube_stt_settings,
+)
+from util.whisper.model_registry import WhisperModelRegistry
 
 
 class YouTubeMediaTests(unittest.TestCase):
@@ -11,5 +20,42 @@ class YouTubeMediaTests(unittest.TestCase):
         )
 
 
+class YouTubeSpeechToTextTests(unittest.IsolatedAsyncioTestCase):
+    async def test_speech_to_text_reuses_shared_model_between_calls(self):
+        model = Mock()
+        model.transcribe.return_value = ([SimpleNamespace(text=" 안녕 ")], None)
+        factory = Mock(return_value=model)
+        registry = WhisperModelRegistry(factory=factory)
+
+        with (
+            tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as audio,
+            patch(
+                "func.youtube_media.get_whisper_model_registry",
+                return_value=registry,
+            ),
+            patch.dict(os.environ, {"VOICE_CHAT_WHISPER_WORKERS": "2"}),
+            patch("util.whisper.settings._available_cpu_count", return_value=8),
+        ):
+            audio.close()
+            spec = youtube_stt_settings().spec
+            try:
+                first = await speech_to_text(audio.name)
+                second = await speech_to_text(audio.name)
+            finally:
+                os.remove(audio.name)
+
+        self.assertEqual(["안녕", "안녕"], [first, second])
+        factory.assert_called_once_with(
+            "tiny",
+            device="cpu",
+            compute_type="int8",
+            num_workers=2,
+            cpu_threads=4,
+        )
+        self.assertEqual(0, registry.ref_count(spec))
+        self.assertTrue(registry.is_loaded(spec))
+        registry.close()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -56,13 +56,19 @@ def _status(video_id: str = "live-1") -> YouTubeVideoLiveStatus:
 
 class _Recorder:
     def __init__(self):
-        self.calls: list[tuple[int, dict]] = []
+        self.calls: list[tuple] = []
 
-    async def update_subscription_state(self, subscription_id: int, **kwargs) -> None:
-        self.calls.append((subscription_id, kwargs))
+    async def append_notified(self, subscription_id: int, video_id: str, **kwargs):
+        self.calls.append((subscription_id, video_id, kwargs))
 
-    async def update_upload_state(self, subscription_id: int, **kwargs) -> None:
-        self.calls.append((subscription_id, kwargs))
+    async def store_pending(self, subscription_id: int, video_id: str, entry):
+        self.calls.append((subscription_id, video_id, entry))
+
+    async def store_check(self, subscription_id: int, video_id: str, checked_at: str):
+        self.calls.append((subscription_id, video_id, checked_at))
+
+    async def remove_pending(self, subscription_id: int, video_id: str):
+        self.calls.append((subscription_id, video_id))
 
 
 class YouTubeNotificationStateTests(unittest.TestCase):
@@ -136,25 +142,14 @@ class YouTubeNotificationStatePersistenceTests(unittest.IsolatedAsyncioTestCase)
         updated = await mark_youtube_video_notified(
             subscription,
             "live-new",
-            update_state=recorder.update_subscription_state,
+            append_notified=recorder.append_notified,
         )
 
         self.assertNotIn("live-new", updated.pending_videos)
         self.assertEqual(updated.notified_video_ids[-1], "live-new")
         self.assertEqual(len(updated.notified_video_ids), 30)
         self.assertNotIn("old-0", updated.notified_video_ids)
-        self.assertEqual(
-            recorder.calls,
-            [
-                (
-                    1,
-                    {
-                        "pending_videos": {},
-                        "notified_video_ids": updated.notified_video_ids,
-                    },
-                )
-            ],
-        )
+        self.assertEqual(recorder.calls, [(1, "live-new", {"limit": 30})])
 
     async def test_mark_upload_notification_updates_upload_notified_ids(self):
         recorder = _Recorder()
@@ -163,22 +158,14 @@ class YouTubeNotificationStatePersistenceTests(unittest.IsolatedAsyncioTestCase)
         updated = await mark_youtube_upload_video_notified(
             subscription,
             "upload-new",
-            update_upload_state=recorder.update_upload_state,
+            append_notified=recorder.append_notified,
         )
 
         self.assertEqual(
             updated.notified_upload_video_ids,
             ["upload-old", "upload-new"],
         )
-        self.assertEqual(
-            recorder.calls,
-            [
-                (
-                    1,
-                    {"notified_upload_video_ids": ["upload-old", "upload-new"]},
-                )
-            ],
-        )
+        self.assertEqual(recorder.calls, [(1, "upload-new", {"limit": 30})])
 
     async def test_remember_pending_video_records_status_and_checked_at(self):
         recorder = _Recorder()
@@ -189,25 +176,19 @@ class YouTubeNotificationStatePersistenceTests(unittest.IsolatedAsyncioTestCase)
             subscription,
             _status("upcoming-1"),
             now=checked_at,
-            update_state=recorder.update_subscription_state,
+            store_pending=recorder.store_pending,
         )
 
-        self.assertEqual(
-            updated.pending_videos["upcoming-1"],
-            {
-                "title": "라이브 제목",
-                "channelId": "UC_TEST",
-                "scheduledStartTime": "2026-06-23T01:20:00Z",
-                "lastCheckedAt": "2026-06-23T01:10:00+00:00",
-            },
-        )
-        self.assertEqual(recorder.calls[0][0], 1)
-        self.assertEqual(
-            recorder.calls[0][1]["pending_videos"],
-            updated.pending_videos,
-        )
+        expected_entry = {
+            "title": "라이브 제목",
+            "channelId": "UC_TEST",
+            "scheduledStartTime": "2026-06-23T01:20:00Z",
+            "lastCheckedAt": "2026-06-23T01:10:00+00:00",
+        }
+        self.assertEqual(updated.pending_videos["upcoming-1"], expected_entry)
+        self.assertEqual(recorder.calls, [(1, "upcoming-1", expected_entry)])
 
-    async def test_remove_pending_video_persists_remaining_pending_state(self):
+    async def test_remove_pending_video_persists_only_removed_key(self):
         recorder = _Recorder()
         subscription = _subscription(
             pending_videos={
@@ -220,22 +201,11 @@ class YouTubeNotificationStatePersistenceTests(unittest.IsolatedAsyncioTestCase)
         updated = await remove_pending_youtube_video(
             subscription,
             "remove-me",
-            update_state=recorder.update_subscription_state,
+            remove_pending=recorder.remove_pending,
         )
 
         self.assertEqual(updated.pending_videos, {"keep-me": {"title": "유지"}})
-        self.assertEqual(
-            recorder.calls,
-            [
-                (
-                    1,
-                    {
-                        "pending_videos": {"keep-me": {"title": "유지"}},
-                        "notified_video_ids": ["live-1"],
-                    },
-                )
-            ],
-        )
+        self.assertEqual(recorder.calls, [(1, "remove-me")])
 
     async def test_touch_pending_video_check_persists_last_checked_at(self):
         recorder = _Recorder()
@@ -250,7 +220,7 @@ class YouTubeNotificationStatePersistenceTests(unittest.IsolatedAsyncioTestCase)
             "pending-1",
             {"title": "기존"},
             now=checked_at,
-            update_state=recorder.update_subscription_state,
+            store_check=recorder.store_check,
         )
 
         self.assertEqual(
@@ -259,15 +229,7 @@ class YouTubeNotificationStatePersistenceTests(unittest.IsolatedAsyncioTestCase)
         )
         self.assertEqual(
             recorder.calls,
-            [
-                (
-                    1,
-                    {
-                        "pending_videos": updated.pending_videos,
-                        "notified_video_ids": ["live-1"],
-                    },
-                )
-            ],
+            [(1, "pending-1", "2026-06-23T01:10:00+00:00")],
         )
 
 
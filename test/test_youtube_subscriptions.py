@@ -1,8 +1,14 @@
 import ast
 import unittest
 from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
-from util.youtube.subscriptions import YouTubeSubscription, row_to_subscription
+from util.youtube.subscriptions import (
+    YouTubeSubscription,
+    append_youtube_notified_video_id,
+    row_to_subscription,
+    set_youtube_pending_video_checked_at,
+)
 
 
 YOUTUBE_SUBSCRIPTION_COG_PATH = Path("cogs/youtube_subscriptions/__init__.py")
@@ -222,5 +228,42 @@ class YouTubeSubscriptionTests(unittest.TestCase):
         self.assertFalse(LEGACY_YOUTUBE_CHECKER_COG_PATH.exists())
 
 
+class YouTubeSubscriptionStateWriteTests(unittest.IsolatedAsyncioTestCase):
+    async def test_pending_check_touch_updates_only_the_entry_path(self):
+        execute = AsyncMock(return_value=0)
+
+        with patch("util.youtube.subscriptions.execute_query", execute):
+            await set_youtube_pending_video_checked_at(
+                7,
+                "video-1",
+                "2026-06-23T01:10:00+00:00",
+            )
+
+        query, args = execute.await_args.args
+        self.assertIn("JSON_SET(pending_videos, %s, %s)", query)
+        self.assertNotIn("notified_video_ids", query)
+        self.assertEqual(
+            args,
+            (
+                '$."video-1".lastCheckedAt',
+                "2026-06-23T01:10:00+00:00",
+                7,
+                '$."video-1"',
+            ),
+        )
+
+    async def test_notified_append_uses_json_array_append_with_limit(self):
+        execute = AsyncMock(return_value=0)
+
+        with patch("util.youtube.subscriptions.execute_query", execute):
+            await append_youtube_notified_video_id(7, "video-1", limit=30)
+
+        query, args = execute.await_args.args
+        self.assertIn("JSON_ARRAY_APPEND", query)
+        self.assertIn("JSON_REMOVE(", query)
+        self.assertEqual(query.count("%s"), len(args))
+        self.assertEqual(args, ("video-1", 30, "video-1", "video-1", '$."video-1"', 7))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,11 @@
 import unittest
+from dataclasses import replace
 from pathlib import Path
 
-from util.youtube.video_candidate_runner import process_youtube_video_candidate
+from util.youtube.video_candidate_runner import (
+    process_youtube_video_candidate,
+    resolve_youtube_video_candidate,
+)
 from util.youtube.subscriptions import YouTubeSubscription
 from util.youtube.websub import YouTubeVideoLiveStatus, YouTubeVideoStatus
 
@@ -71,6 +75,43 @@ class YouTubeVideoCandidateRunnerTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(owner.marked_live_ids, ["live-1"])
         self.assertEqual(owner.removed_pending_ids, [])
 
+    async def test_known_statuses_skip_individual_fetch(self):
+        owner = _Owner(_status("live-1", YouTubeVideoStatus.LIVE))
+        subscription = _subscription()
+
+        outcome = await process_youtube_video_candidate(
+            owner,
+            subscription,
+            "live-1",
+            known_statuses={"live-1": _status("live-1", YouTubeVideoStatus.LIVE)},
+        )
+        missing = await process_youtube_video_candidate(
+            owner,
+            subscription,
+            "gone-1",
+            known_statuses={},
+        )
+
+        self.assertEqual(outcome, "notified")
+        self.assertEqual(missing, "missing")
+        self.assertEqual(owner.fetched_video_ids, [])
+
+    async def test_resolve_returns_subscription_updated_by_owner(self):
+        owner = _Owner(_status("live-1", YouTubeVideoStatus.LIVE))
+        subscription = _subscription(pending_videos={"live-1": {}})
+
+        async def _mark(target, video_id):
+            owner.marked_live_ids.append(video_id)
+            return replace(target, pending_videos={}, notified_video_ids=[video_id])
+
+        owner._mark_youtube_video_notified = _mark
+
+        result = await resolve_youtube_video_candidate(owner, subscription, "live-1")
+
+        self.assertEqual(result.outcome, "notified")
+        self.assertEqual(result.subscription.pending_videos, {})
+        self.assertEqual(result.subscription.notified_video_ids, ["live-1"])
+
     async def test_upload_candidate_respects_disabled_upload_alert(self):
         owner = _Owner(_status("upload-1", YouTubeVideoStatus.UPLOAD))
         subscription = _subscription(upload_alert_enabled=False)
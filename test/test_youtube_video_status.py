@@ -1,7 +1,13 @@
+import asyncio
 import unittest
 from pathlib import Path
 
-from util.youtube.video_status import fetch_youtube_video_status
+from util.youtube.video_status import (
+    YOUTUBE_VIDEOS_LIST_MAX_IDS,
+    fetch_youtube_video_status,
+    fetch_youtube_video_statuses,
+    thread_youtube_http,
+)
 from util.youtube.websub import YouTubeVideoStatus
 
 
@@ -57,11 +63,50 @@ class YouTubeVideoStatusTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertIsNone(status)
 
+    async def test_fetch_video_statuses_batches_ids_by_fifty(self):
+        video_ids = [f"video-{index}" for index in range(YOUTUBE_VIDEOS_LIST_MAX_IDS + 1)]
+        youtube = _FakeYouTube(
+            {
+                "items": [
+                    {
+                        "id": "video-0",
+                        "snippet": {"channelId": "UC_TEST", "liveBroadcastContent": "live"},
+                        "liveStreamingDetails": {"actualStartTime": "2026-06-23T00:00:00Z"},
+                    }
+                ]
+            }
+        )
+
+        statuses = await fetch_youtube_video_statuses(youtube, video_ids + ["video-0"])
+
+        self.assertEqual(len(youtube.calls), 2)
+        self.assertEqual(youtube.calls[0]["id"], ",".join(video_ids[:YOUTUBE_VIDEOS_LIST_MAX_IDS]))
+        self.assertEqual(youtube.calls[0]["maxResults"], YOUTUBE_VIDEOS_LIST_MAX_IDS)
+        self.assertEqual(youtube.calls[1]["id"], video_ids[-1])
+        self.assertEqual(list(statuses), ["video-0"])
+        self.assertEqual(statuses["video-0"].status, YouTubeVideoStatus.LIVE)
+
+    async def test_fetch_video_statuses_skips_api_for_empty_input(self):
+        youtube = _FakeYouTube({"items": []})
+
+        self.assertEqual(await fetch_youtube_video_statuses(youtube, []), {})
+        self.assertEqual(youtube.calls, [])
+
+    async def test_requests_use_a_separate_http_connection_per_thread(self):
+        youtube = _FakeYouTube({"items": []})
+
+        await fetch_youtube_video_status(youtube, "video-1")
+        worker_http = await asyncio.to_thread(thread_youtube_http)
+
+        self.assertIsNotNone(youtube.https[0])
+        self.assertIsNot(thread_youtube_http(), worker_http)
+
 
 class _FakeYouTube:
     def __init__(self, response):
         self.response = response
         self.calls: list[dict] = []
+        self.https: list = []
 
     def videos(self):
         return _FakeVideos(self)
@@ -73,15 +118,16 @@ class _FakeVideos:
 
     def list(self, **kwargs):
         self.youtube.calls.append(kwargs)
-        return _FakeRequest(self.youtube.response)
+        return _FakeRequest(self.youtube)
 
 
 class _FakeRequest:
-    def __init__(self, response):
-        self.response = response
+    def __init__(self, youtube: _FakeYouTube):
+        self.youtube = youtube
 
-    def execute(self):
-        return self.response
+    def execute(self, http=None):
+        self.youtube.https.append(http)
+        return self.youtube.response
 
 
 if __name__ == "__main__":
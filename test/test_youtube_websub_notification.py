@@ -1,7 +1,9 @@
 import unittest
 from pathlib import Path
 
-from util.youtube.websub_notification import handle_youtube_websub_notification
+from util.youtube.websub import parse_youtube_atom_entries
+from util.youtube.websub_notification import handle_youtube_websub_entry
+from util.youtube.websub_queue import YouTubeWebSubQueue
 from util.youtube.subscriptions import YouTubeSubscription
 
 
@@ -58,7 +60,7 @@ class YouTubeWebSubNotificationTests(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(YOUTUBE_WEBSUB_NOTIFICATION_PATH.exists())
         self.assertFalse(LEGACY_YOUTUBE_WEBSUB_NOTIFICATION_PATH.exists())
 
-    async def test_handles_atom_notification_and_collects_subscription_results(self):
+    async def test_queued_notification_is_handled_per_subscription(self):
         subscriptions = [
             _subscription(id=1, guild_id=10),
             _subscription(id=2, guild_id=20),
@@ -74,19 +76,30 @@ class YouTubeWebSubNotificationTests(unittest.IsolatedAsyncioTestCase):
             processed.append((subscription.id, video_id))
             return f"status-{subscription.id}"
 
-        result = await handle_youtube_websub_notification(
-            SAMPLE_ATOM,
-            find_subscriptions=find_subscriptions,
-            process_video_candidate=process_video_candidate,
-        )
-
+        entry_results = []
+
+        async def handle_entry(entry):
+            # LoopTasks._handle_youtube_websub_entry와 같은 경로로 처리한다
+            entry_results.append(
+                await handle_youtube_websub_entry(
+                    entry,
+                    process_video_candidate=process_video_candidate,
+                    find_subscriptions=find_subscriptions,
+                )
+            )
+
+        queue = YouTubeWebSubQueue(handle_entry, workers=1)
+        queued = queue.enqueue(SAMPLE_ATOM)
+        await queue.join()
+        queue.cancel()
+
+        self.assertEqual(queued["received"], 2)
+        self.assertEqual(queued["queued"], 2)
         self.assertEqual(find_calls, ["UC_MATCHED", "UC_IGNORED"])
         self.assertEqual(processed, [(1, "VIDEO123"), (2, "VIDEO123")])
-        self.assertEqual(result["received"], 2)
-        self.assertEqual(result["processed"], 2)
-        self.assertEqual(result["ignored"], 1)
+        self.assertIsNone(entry_results[1])
         self.assertEqual(
-            result["results"],
+            entry_results[0],
             [
                 {
                     "guild_id": 10,
@@ -103,6 +116,40 @@ class YouTubeWebSubNotificationTests(unittest.IsolatedAsyncioTestCase):
             ],
         )
 
+    async def test_entry_with_several_guilds_fetches_video_status_once(self):
+        entry = parse_youtube_atom_entries(SAMPLE_ATOM)[0]
+        subscriptions = [
+            _subscription(id=1, guild_id=10),
+            _subscription(id=2, guild_id=20),
+        ]
+        fetched: list[list[str]] = []
+        processed: list[tuple[int, dict]] = []
+
+        async def find_subscriptions(_channel_id):
+            return subscriptions
+
+        async def fetch_video_statuses(video_ids):
+            fetched.append(list(video_ids))
+            return {"VIDEO123": "status"}
+
+        async def process_video_candidate(subscription, _video_id, *, known_statuses):
+            processed.append((subscription.id, known_statuses))
+            return "notified"
+
+        results = await handle_youtube_websub_entry(
+            entry,
+            process_video_candidate=process_video_candidate,
+            find_subscriptions=find_subscriptions,
+            fetch_video_statuses=fetch_video_statuses,
+        )
+
+        self.assertEqual(fetched, [["VIDEO123"]])
+        self.assertEqual(
+            processed,
+            [(1, {"VIDEO123": "status"}), (2, {"VIDEO123": "status"})],
+        )
+        self.assertEqual([result["status"] for result in results], ["notified"] * 2)
+
 
 if __name__ == "__main__":
     unittest.main()
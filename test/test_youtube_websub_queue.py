@@ -0,0 +1,115 @@
+import asyncio
+import unittest
+from xml.etree import ElementTree
+
+from util.youtube.websub_queue import YouTubeWebSubQueue
+
+
+def _atom(*video_ids):
+    entries = "".join(
+        f"""
+  <entry>
+    <yt:videoId>{video_id}</yt:videoId>
+    <yt:channelId>UC_CHANNEL</yt:channelId>
+    <title>영상</title>
+  </entry>"""
+        for video_id in video_ids
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015"
+      xmlns="http://www.w3.org/2005/Atom">{entries}
+</feed>
+"""
+
+
+class YouTubeWebSubQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def test_enqueue_returns_before_processing_and_dedups_pending_videos(self):
+        release = asyncio.Event()
+        handled = []
+
+        async def handle_entry(entry):
+            await release.wait()
+            handled.append(entry.video_id)
+
+        queue = YouTubeWebSubQueue(handle_entry, workers=1)
+
+        first = queue.enqueue(_atom("A", "B"))
+        second = queue.enqueue(_atom("B", "C"))
+
+        self.assertEqual(first, {"received": 2, "queued": 2, "duplicates": 0, "dropped": 0})
+        self.assertEqual(second["duplicates"], 1)
+        self.assertEqual(second["queued"], 1)
+        self.assertEqual(handled, [])
+
+        release.set()
+        await queue.join()
+        queue.cancel()
+
+        self.assertEqual(handled, ["A", "B", "C"])
+
+    async def test_video_being_handled_is_not_queued_again(self):
+        release = asyncio.Event()
+        started = asyncio.Event()
+        handled = []
+
+        async def handle_entry(entry):
+            handled.append(entry.video_id)
+            started.set()
+            await release.wait()
+
+        queue = YouTubeWebSubQueue(handle_entry, workers=2)
+        queue.enqueue(_atom("A"))
+        await started.wait()
+
+        repeated = queue.enqueue(_atom("A"))
+        release.set()
+        await queue.join()
+        after = queue.enqueue(_atom("A"))
+        await queue.join()
+        queue.cancel()
+
+        self.assertEqual(repeated["duplicates"], 1)
+        self.assertEqual(repeated["queued"], 0)
+        self.assertEqual(after["queued"], 1)
+        self.assertEqual(handled, ["A", "A"])
+
+    async def test_full_queue_drops_new_entries(self):
+        async def handle_entry(entry):
+            await asyncio.Event().wait()
+
+        queue = YouTubeWebSubQueue(handle_entry, maxsize=1, workers=1)
+
+        result = queue.enqueue(_atom("A", "B", "C"))
+        queue.cancel()
+
+        self.assertEqual(result["queued"], 1)
+        self.assertEqual(result["dropped"], 2)
+
+    async def test_handler_failure_does_not_stop_worker(self):
+        handled = []
+
+        async def handle_entry(entry):
+            if entry.video_id == "BAD":
+                raise RuntimeError("boom")
+            handled.append(entry.video_id)
+
+        queue = YouTubeWebSubQueue(handle_entry, workers=1)
+        with self.assertLogs("util.youtube.websub_queue", level="ERROR"):
+            queue.enqueue(_atom("BAD", "GOOD"))
+            await queue.join()
+        queue.cancel()
+
+        self.assertEqual(handled, ["GOOD"])
+
+    async def test_invalid_xml_raises_parse_error(self):
+        async def handle_entry(entry):
+            return None
+
+        queue = YouTubeWebSubQueue(handle_entry)
+
+        with self.assertRaises(ElementTree.ParseError):
+            queue.enqueue("<feed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import logging
 import os
-from collections.abc import Sequence
+import re
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
 from typing import Any, TypeAlias
 
 import aiomysql
@@ -10,6 +15,19 @@ from util.env_utils import getenv_clean, sanitize_environment
 
 load_dotenv()
 sanitize_environment()
+logger = logging.getLogger(__name__)
+
+
+def _getenv_int(key: str, default: int) -> int:
+    raw_value = getenv_clean(key)
+    if raw_value in (None, ""):
+        return default
+    try:
+        return int(raw_value)
+    except ValueError:
+        logger.warning("%s 값이 정수가 아니어서 기본값 %s을 사용합니다.", key, default)
+        return default
+
 
 DB_HOST_FULL = getenv_clean("DB_HOST", "localhost:3306")
 if ":" in DB_HOST_FULL:
@@ -22,11 +40,22 @@ else:
 DB_USER = getenv_clean("DB_USERNAME")
 DB_PASSWORD = getenv_clean("DB_PASSWORD")
 DB_NAME = getenv_clean("DB_DATABASE")
+DB_POOL_MINSIZE = _getenv_int("DB_POOL_MINSIZE", 1)
+DB_POOL_MAXSIZE = _getenv_int("DB_POOL_MAXSIZE", 10)
+# MySQL wait_timeout보다 먼저 유휴 연결을 재생성한다.
+DB_POOL_RECYCLE_SECONDS = _getenv_int("DB_POOL_RECYCLE", 3600)
+DB_CONNECT_TIMEOUT_SECONDS = _getenv_int("DB_CONNECT_TIMEOUT", 10)
 
 QueryArgs: TypeAlias = Sequence[Any] | dict[str, Any] | None
 DbRow: TypeAlias = dict[str, Any]
-DB_SCHEMA_VERSION = 1
+DB_SCHEMA_VERSION = 3
 SCHEMA_MIGRATION_KEY = "core"
+# Multi-row statements stay far below MySQL's default max_allowed_packet (4MB+).
+DB_BULK_MAX_ROWS = 500
+DB_BULK_MAX_BYTES = 512 * 1024
+QUERY_TIMING_BUCKETS_MS: tuple[float, ...] = (
+    1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500,
+)
 pool: aiomysql.Pool | None = None
 
 
@@ -34,6 +63,89 @@ class SchemaMigrationRequiredError(RuntimeError):
     """Raised when the DB schema is missing or behind the application contract."""
 
 
+@dataclass
+class QueryTimingHistogram:
+    """Cumulative latency histogram for one statement label."""
+
+    bucket_counts: list[int] = field(
+        default_factory=lambda: [0] * (len(QUERY_TIMING_BUCKETS_MS) + 1)
+    )
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for index, upper_bound in enumerate(QUERY_TIMING_BUCKETS_MS):
+            if elapsed_ms <= upper_bound:
+                self.bucket_counts[index] += 1
+                return
+        self.bucket_counts[-1] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        buckets = {
+            f"le_{upper_bound:g}ms": count
+            for upper_bound, count in zip(QUERY_TIMING_BUCKETS_MS, self.bucket_counts)
+        }
+        buckets["inf"] = self.bucket_counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+_QUERY_METRICS: dict[str, QueryTimingHistogram] = {}
+_STATEMENT_TABLE_PATTERN = re.compile(
+    r"\b(?:FROM|INTO|UPDATE|TABLE)\s+`?(\w+)`?",
+    re.IGNORECASE,
+)
+
+
+def _statement_label(query: str) -> str:
+    """Group statements by verb and first table, e.g. ``select:guild``."""
+    stripped = query.lstrip()
+    verb = stripped.split(None, 1)[0].lower() if stripped else "unknown"
+    match = _STATEMENT_TABLE_PATTERN.search(stripped)
+    table = match.group(1).lower() if match else "-"
+    return f"{verb}:{table}"
+
+
+def record_query_timing(label: str, elapsed_ms: float) -> None:
+    _QUERY_METRICS.setdefault(label, QueryTimingHistogram()).observe(elapsed_ms)
+
+
+@contextmanager
+def _timed_query(label: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_query_timing(label, (time.perf_counter() - started) * 1000)
+
+
+def get_query_metrics() -> dict[str, dict[str, Any]]:
+    return {label: histogram.to_dict() for label, histogram in sorted(_QUERY_METRICS.items())}
+
+
+def reset_query_metrics() -> None:
+    _QUERY_METRICS.clear()
+
+
+def get_db_pool_stats() -> dict[str, int] | None:
+    if pool is None:
+        return None
+    return {
+        "size": pool.size,
+        "free": pool.freesize,
+        "minsize": pool.minsize,
+        "maxsize": pool.maxsize,
+    }
+
+
 async def get_db_pool() -> aiomysql.Pool:
     global pool
     if pool is None:
@@ -45,6 +157,10 @@ async def get_db_pool() -> aiomysql.Pool:
             db=DB_NAME,
             autocommit=True,
             charset="utf8mb4",
+            minsize=DB_POOL_MINSIZE,
+            maxsize=DB_POOL_MAXSIZE,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            connect_timeout=DB_CONNECT_TIMEOUT_SECONDS,
         )
     return pool
 
@@ -62,7 +178,8 @@ async def execute_query(query: str, args: QueryArgs = None) -> int:
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         async with conn.cursor() as cur:
-            await cur.execute(query, args)
+            with _timed_query(_statement_label(query)):
+                await cur.execute(query, args)
             return cur.lastrowid
 
 
@@ -71,8 +188,9 @@ async def fetch_one(query: str, args: QueryArgs = None) -> DbRow | None:
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         async with conn.cursor(aiomysql.DictCursor) as cur:
-            await cur.execute(query, args)
-            return await cur.fetchone()
+            with _timed_query(_statement_label(query)):
+                await cur.execute(query, args)
+                return await cur.fetchone()
 
 
 async def fetch_all(query: str, args: QueryArgs = None) -> list[DbRow]:
@@ -80,8 +198,60 @@ async def fetch_all(query: str, args: QueryArgs = None) -> list[DbRow]:
     pool = await get_db_pool()
     async with pool.acquire() as conn:
         async with conn.cursor(aiomysql.DictCursor) as cur:
-            await cur.execute(query, args)
-            return await cur.fetchall()
+            with _timed_query(_statement_label(query)):
+                await cur.execute(query, args)
+                return await cur.fetchall()
+
+
+class DbTransaction:
+    """Runs statements on one pooled connection inside an explicit transaction."""
+
+    def __init__(self, conn: Any) -> None:
+        self._conn = conn
+        self.rowcount = 0
+
+    async def execute(self, query: str, args: QueryArgs = None) -> int:
+        """Executes a statement and returns lastrowid; ``rowcount`` is updated."""
+        async with self._conn.cursor() as cur:
+            with _timed_query(_statement_label(query)):
+                await cur.execute(query, args)
+            self.rowcount = cur.rowcount
+            return cur.lastrowid
+
+    async def executemany(self, query: str, args_list: Sequence[QueryArgs]) -> int:
+        """Executes a statement for each args entry and returns the affected row count."""
+        async with self._conn.cursor() as cur:
+            with _timed_query(_statement_label(query)):
+                await cur.executemany(query, args_list)
+            self.rowcount = cur.rowcount
+            return cur.rowcount
+
+    async def fetch_one(self, query: str, args: QueryArgs = None) -> DbRow | None:
+        async with self._conn.cursor(aiomysql.DictCursor) as cur:
+            with _timed_query(_statement_label(query)):
+                await cur.execute(query, args)
+                return await cur.fetchone()
+
+    async def fetch_all(self, query: str, args: QueryArgs = None) -> list[DbRow]:
+        async with self._conn.cursor(aiomysql.DictCursor) as cur:
+            with _timed_query(_statement_label(query)):
+                await cur.execute(query, args)
+                return await cur.fetchall()
+
+
+@asynccontextmanager
+async def db_transaction() -> AsyncIterator[DbTransaction]:
+    """Acquire one connection, BEGIN, and COMMIT on success or ROLLBACK on error."""
+    pool = await get_db_pool()
+    async with pool.acquire() as conn:
+        with _timed_query("transaction:-"):
+            await conn.begin()
+            try:
+                yield DbTransaction(conn)
+            except BaseException:
+                await conn.rollback()
+                raise
+            await conn.commit()
 
 
 async def run_schema_migrations() -> None:
@@ -118,7 +288,8 @@ async def run_schema_migrations() -> None:
             bj_wins INT DEFAULT 0,
             bj_losses INT DEFAULT 0,
             bj_pushes INT DEFAULT 0,
-            PRIMARY KEY (guild_id, user_id)
+            PRIMARY KEY (guild_id, user_id),
+            INDEX idx_gambling_balances_guild_balance (guild_id, balance)
         ) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
         """,
         """
@@ -133,7 +304,8 @@ async def run_schema_migrations() -> None:
             type VARCHAR(20),
             repeat_type VARCHAR(20),
             repeat_value VARCHAR(50),
-            is_recurring BOOLEAN DEFAULT FALSE
+            is_recurring BOOLEAN DEFAULT FALSE,
+            INDEX idx_scheduled_messages_trigger_time (trigger_time)
         ) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
         """,
         """
@@ -306,6 +478,18 @@ async def run_schema_migrations() -> None:
                 "updated_at",
                 "DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)",
             )
+            await _ensure_index(
+                conn,
+                "gambling_balances",
+                "idx_gambling_balances_guild_balance",
+                "guild_id, balance",
+            )
+            await _ensure_index(
+                conn,
+                "scheduled_messages",
+                "idx_scheduled_messages_trigger_time",
+                "trigger_time",
+            )
             await cur.execute(
                 "DELETE FROM setting_data WHERE setting_key = %s",
                 ("youtubeLiveChecker",),
@@ -369,6 +553,79 @@ async def upsert_user(user_id: int, username: str) -> None:
     await execute_query(query, (int(user_id), username))
 
 
+def _estimate_row_bytes(row: Sequence[Any]) -> int:
+    # Worst case every character is escaped; add quotes/separators per value.
+    return sum(len(str(value).encode("utf-8")) * 2 + 4 for value in row) + 4
+
+
+def chunk_bulk_rows(
+    rows: Sequence[Sequence[Any]],
+    *,
+    max_rows: int = DB_BULK_MAX_ROWS,
+    max_bytes: int = DB_BULK_MAX_BYTES,
+) -> Iterator[list[Sequence[Any]]]:
+    """Split rows into chunks bounded by row count and estimated packet size."""
+    chunk: list[Sequence[Any]] = []
+    chunk_bytes = 0
+    for row in rows:
+        row_bytes = _estimate_row_bytes(row)
+        if chunk and (len(chunk) >= max_rows or chunk_bytes + row_bytes > max_bytes):
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+        chunk.append(row)
+        chunk_bytes += row_bytes
+    if chunk:
+        yield chunk
+
+
+async def _fetch_stored_usernames(user_ids: Sequence[int]) -> dict[int, str | None]:
+    stored: dict[int, str | None] = {}
+    for start in range(0, len(user_ids), DB_BULK_MAX_ROWS):
+        id_chunk = list(user_ids[start : start + DB_BULK_MAX_ROWS])
+        placeholders = ", ".join(["%s"] * len(id_chunk))
+        rows = await fetch_all(
+            f"SELECT user_id, username FROM discord_user WHERE user_id IN ({placeholders})",
+            id_chunk,
+        )
+        stored.update({int(row["user_id"]): row["username"] for row in rows})
+    return stored
+
+
+async def upsert_users(users: Iterable[tuple[int, str]]) -> int:
+    """Bulk variant of upsert_user; returns the number of rows written.
+
+    Duplicate ids keep the last name and users whose stored username already
+    matches are skipped. Changed rows go out as multi-row
+    ``INSERT ... ON DUPLICATE KEY UPDATE`` statements in one transaction.
+    """
+    latest = {int(user_id): username for user_id, username in users}
+    if not latest:
+        return 0
+
+    stored = await _fetch_stored_usernames(list(latest))
+    changed = [
+        (user_id, username)
+        for user_id, username in latest.items()
+        if user_id not in stored or stored[user_id] != username
+    ]
+    if not changed:
+        return 0
+
+    async with db_transaction() as tx:
+        for chunk in chunk_bulk_rows(changed):
+            values = ", ".join(["(%s, %s)"] * len(chunk))
+            await tx.execute(
+                f"""
+                INSERT INTO discord_user (user_id, username)
+                VALUES {values}
+                ON DUPLICATE KEY UPDATE username = VALUES(username)
+                """,
+                [value for row in chunk for value in row],
+            )
+    return len(changed)
+
+
 async def _ensure_bigint_unsigned(conn, table_name: str, column_name: str):
     """
     Ensures the given column is BIGINT UNSIGNED. If the column exists with
@@ -411,3 +668,23 @@ async def _ensure_column(
         await cur.execute(
             f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_definition}"
         )
+
+
+async def _ensure_index(
+    conn,
+    table_name: str,
+    index_name: str,
+    columns: str,
+):
+    query = (
+        "SELECT 1 FROM information_schema.STATISTICS "
+        "WHERE table_schema = %s AND table_name = %s AND index_name = %s"
+    )
+    async with conn.cursor() as cur:
+        await cur.execute(query, (DB_NAME, table_name, index_name))
+        row = await cur.fetchone()
+        if row is not None:
+            return
+        await cur.execute(
+            f"ALTER TABLE {table_name} ADD INDEX {index_name} ({columns})"
+        )
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from util.earthquake.state import (
+    EarthquakeAlertState,
+    load_earthquake_alert_state,
+    save_earthquake_alert_state,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# 채널 설정 명령은 캐시를 바로 무효화하므로 TTL은 놓친 변경을 위한 안전망이다
+EARTHQUAKE_ALERT_CHANNEL_TTL_SECONDS = 300
+
+GetChannels = Callable[[], Awaitable[dict[int, int]]]
+LoadState = Callable[[int], Awaitable[EarthquakeAlertState]]
+SaveState = Callable[[int, EarthquakeAlertState], Awaitable[None]]
+ResolveChannel = Callable[[object, int], Awaitable[object | None]]
+
+
+class EarthquakeAlertCache:
+    """지진 알림 채널·길드 상태·채널 객체를 메모리에 두고 상태 저장은 뒤에서 처리한다.
+
+    길드별 저장은 최신 상태 하나만 남기고 합쳐지므로 같은 이벤트의 후속 보가
+    몰려도 DB 쓰기는 길드당 한 번씩만 진행된다.
+    """
+
+    def __init__(
+        self,
+        *,
+        get_channels: GetChannels,
+        load_state: LoadState = load_earthquake_alert_state,
+        save_state: SaveState = save_earthquake_alert_state,
+        resolve_channel: ResolveChannel,
+        channel_ttl_seconds: float = EARTHQUAKE_ALERT_CHANNEL_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._get_channels = get_channels
+        self._load_state = load_state
+        self._save_state = save_state
+        self._resolve_channel = resolve_channel
+        self._channel_ttl_seconds = channel_ttl_seconds
+        self._clock = clock
+        self._channels: dict[int, int] | None = None
+        self._channels_loaded_at = 0.0
+        self._states: dict[int, EarthquakeAlertState] = {}
+        self._targets: dict[int, object] = {}
+        self._pending_saves: dict[int, EarthquakeAlertState] = {}
+        self._save_tasks: dict[int, asyncio.Task] = {}
+
+    async def channels(self) -> dict[int, int]:
+        expired = self._clock() - self._channels_loaded_at >= self._channel_ttl_seconds
+        if self._channels is None or expired:
+            self._channels = dict(await self._get_channels())
+            self._channels_loaded_at = self._clock()
+        return self._channels
+
+    async def state(self, guild_id: int) -> EarthquakeAlertState:
+        state = self._states.get(guild_id)
+        if state is None:
+            state = await self._load_state(guild_id)
+            self._states[guild_id] = state
+        return state
+
+    async def resolve(self, bot: object, channel_id: int) -> object | None:
+        target = self._targets.get(channel_id)
+        if target is None:
+            target = await self._resolve_channel(bot, channel_id)
+            if target is not None:
+                self._targets[channel_id] = target
+        return target
+
+    def forget_target(self, channel_id: int) -> None:
+        self._targets.pop(channel_id, None)
+
+    def store_state(self, guild_id: int, state: EarthquakeAlertState) -> None:
+        """메모리 상태를 바로 바꾸고 DB 저장은 길드별 백그라운드 작업에 맡긴다."""
+        self._states[guild_id] = state
+        self._pending_saves[guild_id] = state
+        task = self._save_tasks.get(guild_id)
+        if task is None or task.done():
+            self._save_tasks[guild_id] = asyncio.create_task(
+                self._write_back(guild_id)
+            )
+
+    def invalidate(self, guild_id: int | None = None) -> None:
+        self._channels = None
+        self._targets.clear()
+        if guild_id is None:
+            self._states.clear()
+            self._pending_saves.clear()
+            return
+        self._states.pop(guild_id, None)
+        self._pending_saves.pop(guild_id, None)
+
+    async def flush(self) -> None:
+        while True:
+            tasks = [task for task in self._save_tasks.values() if not task.done()]
+            if not tasks:
+                return
+            await asyncio.gather(*tasks)
+
+    async def _write_back(self, guild_id: int) -> None:
+        while guild_id in self._pending_saves:
+            state = self._pending_saves.pop(guild_id)
+            try:
+                await self._save_state(guild_id, state)
+            except Exception:
+                logger.warning(
+                    "일본 EEW 상태 저장 실패: guild=%s",
+                    guild_id,
+                    exc_info=True,
+                )
+
+
+_default_cache: EarthquakeAlertCache | None = None
+
+
+def get_earthquake_alert_cache(
+    *,
+    get_channels: GetChannels,
+    resolve_channel: ResolveChannel,
+) -> EarthquakeAlertCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = EarthquakeAlertCache(
+            get_channels=get_channels,
+            resolve_channel=resolve_channel,
+        )
+    return _default_cache
+
+
+def invalidate_earthquake_alert_cache(guild_id: int | None = None) -> None:
+    """알림 채널 설정이 바뀌면 호출해 다음 이벤트가 DB에서 다시 읽게 한다."""
+    if _default_cache is not None:
+        _default_cache.invalidate(guild_id)
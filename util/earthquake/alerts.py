@@ -7,6 +7,14 @@ from dataclasses import dataclass
 
 import discord
 
+from util.earthquake.alert_cache import (
+    EarthquakeAlertCache,
+    GetChannels,
+    LoadState,
+    ResolveChannel,
+    SaveState,
+    get_earthquake_alert_cache,
+)
 from util.earthquake.jma_eew import (
     JMA_EEW_EVERYONE_MAGNITUDE,
     JMA_EEW_MIN_MAGNITUDE,
@@ -19,7 +27,6 @@ from util.earthquake.map_image import (
     build_openstreetmap_url,
 )
 from util.earthquake.state import (
-    EarthquakeAlertState,
     find_jma_eew_record,
     load_earthquake_alert_state,
     remember_jma_eew_message,
@@ -30,12 +37,9 @@ from util.earthquake.translation import translate_jma_eew_terms
 
 
 EARTHQUAKE_ALERT_CHANNEL_TYPE = "earthquake_alert"
+# 길드별 전송은 서로 기다리지 않되 Discord 요청이 한꺼번에 몰리지 않도록 묶어 둔다
+EARTHQUAKE_ALERT_CONCURRENCY = 16
 logger = logging.getLogger(__name__)
-
-GetChannels = Callable[[], Awaitable[dict[int, int]]]
-LoadState = Callable[[int], Awaitable[EarthquakeAlertState]]
-SaveState = Callable[[int, EarthquakeAlertState], Awaitable[None]]
-ResolveChannel = Callable[[object, int], Awaitable[object | None]]
 SendAlert = Callable[[object, JmaEewEvent, bool], Awaitable[int | None]]
 EditAlert = Callable[[object, int, JmaEewEvent, bool], Awaitable[int | None]]
 
@@ -62,9 +66,31 @@ async def process_jma_eew_event(
     resolve_channel: ResolveChannel | None = None,
     send_alert: SendAlert | None = None,
     edit_alert: EditAlert | None = None,
+    cache: EarthquakeAlertCache | None = None,
+    concurrency: int = EARTHQUAKE_ALERT_CONCURRENCY,
 ) -> list[EarthquakeAlertResult]:
-    get_configured_channels = get_channels or _get_earthquake_alert_channels
-    channels = await get_configured_channels()
+    """설정된 모든 길드에 동시에(최대 concurrency개) 알림을 보내거나 수정한다.
+
+    저장소 함수를 직접 넘기면 이번 호출만의 캐시를 쓰고, 돌아오기 전에 상태 저장을 마친다.
+    """
+    owns_cache = cache is None and any(
+        override is not None
+        for override in (get_channels, load_state, save_state, resolve_channel)
+    )
+    if owns_cache:
+        cache = EarthquakeAlertCache(
+            get_channels=get_channels or _get_earthquake_alert_channels,
+            load_state=load_state or load_earthquake_alert_state,
+            save_state=save_state or save_earthquake_alert_state,
+            resolve_channel=resolve_channel or resolve_earthquake_alert_channel,
+        )
+    elif cache is None:
+        cache = get_earthquake_alert_cache(
+            get_channels=_get_earthquake_alert_channels,
+            resolve_channel=resolve_earthquake_alert_channel,
+        )
+
+    channels = await cache.channels()
     if not channels:
         return []
 
@@ -81,147 +107,133 @@ async def process_jma_eew_event(
             for guild_id, channel_id in channels.items()
         ]
 
-    load = load_state or load_earthquake_alert_state
-    save = save_state or save_earthquake_alert_state
-    resolve = resolve_channel or resolve_earthquake_alert_channel
     send = send_alert or send_jma_eew_alert
     edit = edit_alert or edit_jma_eew_alert
-    results: list[EarthquakeAlertResult] = []
-
-    for guild_id, channel_id in channels.items():
-        try:
-            state = await load(guild_id)
-        except Exception as exc:
-            logger.warning(
-                "일본 EEW 상태 조회 실패: guild=%s",
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _deliver(guild_id: int, channel_id: int) -> EarthquakeAlertResult:
+        async with semaphore:
+            return await _deliver_to_guild(
+                bot,
+                event,
+                cache,
                 guild_id,
-                exc_info=True,
-            )
-            results.append(
-                _error_result(
-                    guild_id,
-                    channel_id,
-                    event,
-                    "state_load_failed",
-                    exc,
-                )
-            )
-            continue
-
-        if state.channel_id != int(channel_id):
-            state = reset_earthquake_alert_state(channel_id)
-
-        record = find_jma_eew_record(state, event.event_id)
-        if record is not None and event.serial <= record.serial:
-            results.append(
-                _skipped_result(
-                    guild_id,
-                    channel_id,
-                    event,
-                    "already_processed",
-                )
+                channel_id,
+                send=send,
+                edit=edit,
             )
-            continue
 
+    results = await asyncio.gather(
+        *(_deliver(guild_id, channel_id) for guild_id, channel_id in channels.items())
+    )
+    if owns_cache:
+        await cache.flush()
+    return list(results)
+
+
+async def _deliver_to_guild(
+    bot: object,
+    event: JmaEewEvent,
+    cache: EarthquakeAlertCache,
+    guild_id: int,
+    channel_id: int,
+    *,
+    send: SendAlert,
+    edit: EditAlert,
+) -> EarthquakeAlertResult:
+    try:
+        state = await cache.state(guild_id)
+    except Exception as exc:
+        logger.warning(
+            "일본 EEW 상태 조회 실패: guild=%s",
+            guild_id,
+            exc_info=True,
+        )
+        return _error_result(
+            guild_id,
+            channel_id,
+            event,
+            "state_load_failed",
+            exc,
+        )
+
+    if state.channel_id != int(channel_id):
+        state = reset_earthquake_alert_state(channel_id)
+
+    record = find_jma_eew_record(state, event.event_id)
+    if record is not None and event.serial <= record.serial:
+        return _skipped_result(guild_id, channel_id, event, "already_processed")
+
+    if record is None:
+        if event.is_cancelled:
+            return _skipped_result(guild_id, channel_id, event, "untracked_cancel")
+        if not event.is_at_least_magnitude(JMA_EEW_MIN_MAGNITUDE):
+            return _skipped_result(guild_id, channel_id, event, "below_threshold")
+        if not is_recent_jma_eew(event):
+            return _skipped_result(guild_id, channel_id, event, "stale")
+
+    target = await cache.resolve(bot, channel_id)
+    if target is None:
+        return EarthquakeAlertResult(
+            guild_id=guild_id,
+            channel_id=channel_id,
+            event_id=event.event_id,
+            serial=event.serial,
+            status="error",
+            action="missing_channel",
+            error="configured channel could not be resolved",
+        )
+
+    notify_everyone = _should_show_everyone(event) and not (
+        record is not None and record.everyone_notified
+    )
+    try:
         if record is None:
-            if event.is_cancelled:
-                results.append(
-                    _skipped_result(
-                        guild_id,
-                        channel_id,
-                        event,
-                        "untracked_cancel",
-                    )
-                )
-                continue
-            if not event.is_at_least_magnitude(JMA_EEW_MIN_MAGNITUDE):
-                results.append(
-                    _skipped_result(
-                        guild_id,
-                        channel_id,
-                        event,
-                        "below_threshold",
-                    )
-                )
-                continue
-            if not is_recent_jma_eew(event):
-                results.append(
-                    _skipped_result(
-                        guild_id,
-                        channel_id,
-                        event,
-                        "stale",
-                    )
-                )
-                continue
-
-        target = await resolve(bot, channel_id)
-        if target is None:
-            results.append(
-                EarthquakeAlertResult(
-                    guild_id=guild_id,
-                    channel_id=channel_id,
-                    event_id=event.event_id,
-                    serial=event.serial,
-                    status="error",
-                    action="missing_channel",
-                    error="configured channel could not be resolved",
-                )
+            message_id = await send(target, event, notify_everyone)
+            action = "sent"
+        else:
+            message_id = await edit(
+                target,
+                record.message_id,
+                event,
+                notify_everyone,
             )
-            continue
+            action = "cancelled" if event.is_cancelled else "edited"
+    except Exception as exc:
+        # 삭제되었거나 권한이 바뀐 채널일 수 있으니 다음 이벤트에서 다시 찾는다
+        cache.forget_target(channel_id)
+        logger.warning(
+            "일본 EEW 알림 처리 실패: guild=%s channel=%s event=%s serial=%s",
+            guild_id,
+            channel_id,
+            event.event_id,
+            event.serial,
+            exc_info=True,
+        )
+        return _error_result(
+            guild_id,
+            channel_id,
+            event,
+            "send_failed" if record is None else "edit_failed",
+            exc,
+        )
 
-        notify_everyone = _should_show_everyone(event) and not (
-            record is not None and record.everyone_notified
+    if message_id is None:
+        message_id = record.message_id if record is not None else None
+    if message_id is None:
+        return EarthquakeAlertResult(
+            guild_id=guild_id,
+            channel_id=channel_id,
+            event_id=event.event_id,
+            serial=event.serial,
+            status="error",
+            action="missing_message_id",
+            error="Discord message ID was not returned",
         )
-        try:
-            if record is None:
-                message_id = await send(target, event, notify_everyone)
-                action = "sent"
-            else:
-                message_id = await edit(
-                    target,
-                    record.message_id,
-                    event,
-                    notify_everyone,
-                )
-                action = "cancelled" if event.is_cancelled else "edited"
-        except Exception as exc:
-            logger.warning(
-                "일본 EEW 알림 처리 실패: guild=%s channel=%s event=%s serial=%s",
-                guild_id,
-                channel_id,
-                event.event_id,
-                event.serial,
-                exc_info=True,
-            )
-            results.append(
-                _error_result(
-                    guild_id,
-                    channel_id,
-                    event,
-                    "send_failed" if record is None else "edit_failed",
-                    exc,
-                )
-            )
-            continue
-
-        if message_id is None:
-            message_id = record.message_id if record is not None else None
-        if message_id is None:
-            results.append(
-                EarthquakeAlertResult(
-                    guild_id=guild_id,
-                    channel_id=channel_id,
-                    event_id=event.event_id,
-                    serial=event.serial,
-                    status="error",
-                    action="missing_message_id",
-                    error="Discord message ID was not returned",
-                )
-            )
-            continue
 
-        updated_state = remember_jma_eew_message(
+    cache.store_state(
+        guild_id,
+        remember_jma_eew_message(
             state,
             event_id=event.event_id,
             serial=event.serial,
@@ -230,41 +242,16 @@ async def process_jma_eew_event(
                 (record.everyone_notified if record is not None else False)
                 or notify_everyone
             ),
-        )
-        try:
-            await save(guild_id, updated_state)
-        except Exception as exc:
-            logger.warning(
-                "일본 EEW 상태 저장 실패: guild=%s event=%s serial=%s",
-                guild_id,
-                event.event_id,
-                event.serial,
-                exc_info=True,
-            )
-            results.append(
-                _error_result(
-                    guild_id,
-                    channel_id,
-                    event,
-                    "state_save_failed",
-                    exc,
-                    message_id=message_id,
-                )
-            )
-            continue
-
-        results.append(
-            EarthquakeAlertResult(
-                guild_id=guild_id,
-                channel_id=channel_id,
-                event_id=event.event_id,
-                serial=event.serial,
-                message_id=message_id,
-                action=action,
-            )
-        )
-
-    return results
+        ),
+    )
+    return EarthquakeAlertResult(
+        guild_id=guild_id,
+        channel_id=channel_id,
+        event_id=event.event_id,
+        serial=event.serial,
+        message_id=message_id,
+        action=action,
+    )
 
 
 async def resolve_earthquake_alert_channel(
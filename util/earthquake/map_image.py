@@ -6,6 +6,7 @@ import logging
 import math
 import tempfile
 import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 
@@ -30,43 +31,199 @@ OSM_USER_AGENT = (
 OSM_TILE_CACHE_DIR = (
     Path(tempfile.gettempdir()) / "discordbot-earthquake-osm-tiles"
 )
+# OSM 타일은 대부분 팔레트 PNG라 원본 모드로 들고 있으면 장당 64KB 정도다
+OSM_TILE_MEMORY_CACHE_SIZE = 160
+OSM_TILE_KEEPALIVE_SECONDS = 120
+OSM_TILE_CONNECTION_LIMIT = 4
+# 여러 길드가 같은 속보를 받으므로 최근 렌더링 결과를 재사용한다
+EARTHQUAKE_MAP_RENDER_CACHE_SIZE = 8
+# 일본 본토와 주변 해역(위도 24~46, 경도 122~146)
+JAPAN_MAP_BOUNDS = (24.0, 122.0, 46.0, 146.0)
 
 logger = logging.getLogger(__name__)
 LoadTile = Callable[[int, int, int], Awaitable[bytes]]
+TileKey = tuple[int, int, int]
+RenderKey = tuple[float, float]
+
+
+class EarthquakeMapCache:
+    """디코딩한 OSM 타일과 최근 지도 이미지를 메모리에 두고 타일 세션을 재사용한다.
+
+    메모리 LRU에 없는 타일만 디스크 캐시와 네트워크를 거치며, 같은 타일을 동시에
+    요청하면 한 번만 받아 온다.
+    """
+
+    def __init__(
+        self,
+        *,
+        load_tile: LoadTile | None = None,
+        max_tiles: int = OSM_TILE_MEMORY_CACHE_SIZE,
+        max_renders: int = EARTHQUAKE_MAP_RENDER_CACHE_SIZE,
+    ) -> None:
+        self._load_tile = load_tile
+        self._max_tiles = max_tiles
+        self._max_renders = max_renders
+        self._tiles: OrderedDict[TileKey, Image.Image] = OrderedDict()
+        self._renders: OrderedDict[RenderKey, bytes] = OrderedDict()
+        self._inflight: dict[TileKey, asyncio.Task] = {}
+        self._session: aiohttp.ClientSession | None = None
+        self._active_renders = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def tile(self, zoom: int, tile_x: int, tile_y: int) -> Image.Image:
+        key = (zoom, tile_x, tile_y)
+        cached = self._tiles.get(key)
+        if cached is not None:
+            self._tiles.move_to_end(key)
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key))
+            self._inflight[key] = task
+        # 한 요청이 취소돼도 같은 타일을 기다리는 다른 요청은 계속 받아야 한다
+        return await asyncio.shield(task)
+
+    async def render(
+        self,
+        latitude: float,
+        longitude: float,
+    ) -> bytes:
+        key = (round(float(latitude), 4), round(float(longitude), 4))
+        cached = self._renders.get(key)
+        if cached is not None:
+            self._renders.move_to_end(key)
+            return cached
+
+        self._active_renders += 1
+        self._idle.clear()
+        try:
+            requests = _tile_requests(
+                latitude,
+                longitude,
+                zoom=EARTHQUAKE_MAP_ZOOM,
+                width=EARTHQUAKE_MAP_WIDTH,
+                height=EARTHQUAKE_MAP_HEIGHT,
+            )
+            tiles = await asyncio.gather(
+                *(
+                    self.tile(EARTHQUAKE_MAP_ZOOM, normalized_x, tile_y)
+                    for _, tile_y, normalized_x in requests
+                )
+            )
+            image_bytes = await asyncio.to_thread(
+                _render_map,
+                latitude,
+                longitude,
+                requests,
+                tiles,
+            )
+        finally:
+            self._active_renders -= 1
+            if not self._active_renders:
+                self._idle.set()
+
+        self._renders[key] = image_bytes
+        while len(self._renders) > self._max_renders:
+            self._renders.popitem(last=False)
+        return image_bytes
+
+    async def prewarm(
+        self,
+        bounds: tuple[float, float, float, float] = JAPAN_MAP_BOUNDS,
+        *,
+        zoom: int = EARTHQUAKE_MAP_ZOOM,
+    ) -> int:
+        """영역 안의 지도가 쓸 타일을 미리 받아 둔다. 지도 생성 중에는 잠시 멈춘다."""
+        loaded = 0
+        for key in _bounds_tile_keys(bounds, zoom=zoom):
+            if key in self._tiles:
+                continue
+            await self._idle.wait()
+            try:
+                await self.tile(*key)
+            except (
+                aiohttp.ClientError,
+                asyncio.TimeoutError,
+                OSError,
+                ValueError,
+            ):
+                logger.warning("지진 지도 타일 미리 받기 실패: tile=%s", key, exc_info=True)
+                continue
+            loaded += 1
+        return loaded
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15, connect=5),
+                headers={"User-Agent": OSM_USER_AGENT},
+                connector=aiohttp.TCPConnector(
+                    limit=OSM_TILE_CONNECTION_LIMIT,
+                    keepalive_timeout=OSM_TILE_KEEPALIVE_SECONDS,
+                ),
+            )
+        return self._session
+
+    async def _load(self, key: TileKey) -> Image.Image:
+        try:
+            if self._load_tile is None:
+                content = await _load_osm_tile(self._get_session(), *key)
+            else:
+                content = await self._load_tile(*key)
+            tile = await asyncio.to_thread(_decode_tile, content)
+        finally:
+            self._inflight.pop(key, None)
+
+        self._tiles[key] = tile
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self._max_tiles:
+            self._tiles.popitem(last=False)
+        return tile
+
+
+_default_cache: EarthquakeMapCache | None = None
+
+
+def get_earthquake_map_cache() -> EarthquakeMapCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = EarthquakeMapCache()
+    return _default_cache
+
+
+async def prewarm_japan_map_tiles() -> int:
+    return await get_earthquake_map_cache().prewarm()
+
+
+async def close_earthquake_map_cache() -> None:
+    if _default_cache is not None:
+        await _default_cache.close()
 
 
 async def build_jma_eew_map_file(
     event: JmaEewEvent,
     *,
     load_tile: LoadTile | None = None,
+    cache: EarthquakeMapCache | None = None,
 ) -> discord.File | None:
     if event.latitude is None or event.longitude is None:
         return None
 
-    try:
-        requests = _tile_requests(
-            event.latitude,
-            event.longitude,
-            zoom=EARTHQUAKE_MAP_ZOOM,
-            width=EARTHQUAKE_MAP_WIDTH,
-            height=EARTHQUAKE_MAP_HEIGHT,
-        )
-        if load_tile is None:
-            tile_bytes = await _load_default_tiles(requests)
-        else:
-            tile_bytes = await asyncio.gather(
-                *(
-                    load_tile(EARTHQUAKE_MAP_ZOOM, normalized_x, tile_y)
-                    for _, tile_y, normalized_x in requests
-                )
-            )
-        image_bytes = await asyncio.to_thread(
-            _render_map,
-            event.latitude,
-            event.longitude,
-            requests,
-            tile_bytes,
+    if cache is None:
+        cache = (
+            get_earthquake_map_cache()
+            if load_tile is None
+            else EarthquakeMapCache(load_tile=load_tile)
         )
+    try:
+        image_bytes = await cache.render(event.latitude, event.longitude)
     except (
         aiohttp.ClientError,
         asyncio.TimeoutError,
@@ -97,27 +254,6 @@ def build_openstreetmap_url(event: JmaEewEvent) -> str | None:
     )
 
 
-async def _load_default_tiles(
-    requests: list[tuple[int, int, int]],
-) -> list[bytes]:
-    timeout = aiohttp.ClientTimeout(total=15, connect=5)
-    async with aiohttp.ClientSession(
-        timeout=timeout,
-        headers={"User-Agent": OSM_USER_AGENT},
-    ) as session:
-        return await asyncio.gather(
-            *(
-                _load_osm_tile(
-                    session,
-                    EARTHQUAKE_MAP_ZOOM,
-                    normalized_x,
-                    tile_y,
-                )
-                for _, tile_y, normalized_x in requests
-            )
-        )
-
-
 async def _load_osm_tile(
     session: aiohttp.ClientSession,
     zoom: int,
@@ -168,6 +304,34 @@ async def _read_cached_tile(
     return tile_bytes, is_fresh
 
 
+def _decode_tile(content: bytes) -> Image.Image:
+    tile = Image.open(io.BytesIO(content))
+    # 지연 디코딩을 여기서 끝내 두어야 렌더링 스레드에서 다시 읽지 않는다
+    tile.load()
+    return tile
+
+
+def _bounds_tile_keys(
+    bounds: tuple[float, float, float, float],
+    *,
+    zoom: int,
+) -> list[TileKey]:
+    south, west, north, east = bounds
+    left, top = _world_pixel(north, west, zoom)
+    right, bottom = _world_pixel(south, east, zoom)
+    # 영역 가장자리가 지도 중심이어도 필요한 타일까지 포함한다
+    first_x = math.floor((left - EARTHQUAKE_MAP_WIDTH / 2) / OSM_TILE_SIZE)
+    last_x = math.floor((right + EARTHQUAKE_MAP_WIDTH / 2) / OSM_TILE_SIZE)
+    first_y = math.floor((top - EARTHQUAKE_MAP_HEIGHT / 2) / OSM_TILE_SIZE)
+    last_y = math.floor((bottom + EARTHQUAKE_MAP_HEIGHT / 2) / OSM_TILE_SIZE)
+    tile_count = 2**zoom
+    return [
+        (zoom, tile_x % tile_count, tile_y)
+        for tile_y in range(max(first_y, 0), min(last_y, tile_count - 1) + 1)
+        for tile_x in range(first_x, last_x + 1)
+    ]
+
+
 def _tile_requests(
     latitude: float,
     longitude: float,
@@ -198,7 +362,7 @@ def _render_map(
     latitude: float,
     longitude: float,
     requests: list[tuple[int, int, int]],
-    tile_bytes: list[bytes],
+    tiles: list[Image.Image],
 ) -> bytes:
     center_x, center_y = _world_pixel(
         latitude,
@@ -213,19 +377,18 @@ def _render_map(
         "white",
     )
 
-    for (raw_x, tile_y, _), content in zip(
+    for (raw_x, tile_y, _), tile in zip(
         requests,
-        tile_bytes,
+        tiles,
         strict=True,
     ):
-        with Image.open(io.BytesIO(content)) as tile:
-            canvas.paste(
-                tile.convert("RGB"),
-                (
-                    round(raw_x * OSM_TILE_SIZE - left),
-                    round(tile_y * OSM_TILE_SIZE - top),
-                ),
-            )
+        canvas.paste(
+            tile.convert("RGB"),
+            (
+                round(raw_x * OSM_TILE_SIZE - left),
+                round(tile_y * OSM_TILE_SIZE - top),
+            ),
+        )
 
     draw = ImageDraw.Draw(canvas, "RGBA")
     marker_x = EARTHQUAKE_MAP_WIDTH // 2
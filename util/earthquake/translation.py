@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import html
+import json
 import logging
 import re
 import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable, Iterable
 
 import aiohttp
 
+from util.db import execute_query, fetch_one
 from util.earthquake.jma_eew import JmaEewEvent
 
 
@@ -16,6 +19,9 @@ GOOGLE_TRANSLATE_URL = (
     "https://translate.googleapis.com/translate_a/single"
 )
 TRANSLATION_RETRY_SECONDS = 10 * 60
+# 진원·지역 이름은 종류가 한정적이라 이 정도면 사실상 전부 담긴다
+TRANSLATION_CACHE_SIZE = 1024
+TRANSLATION_CACHE_SETTING_KEY = "earthquakeTranslationCache"
 JAPANESE_TEXT_PATTERN = re.compile(
     r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff]"
 )
@@ -26,9 +32,13 @@ TranslateTexts = Callable[
     Awaitable[dict[str, str]],
 ]
 
-_translation_cache: dict[str, str] = {}
+_translation_cache: OrderedDict[str, str] = OrderedDict()
+_translation_cache_loaded = False
 _translation_lock = asyncio.Lock()
 _translation_retry_at = 0.0
+_translation_load_retry_at = 0.0
+_translation_save_task: asyncio.Task | None = None
+_translation_save_pending = False
 
 
 async def translate_jma_eew_terms(
@@ -69,6 +79,8 @@ async def translate_japanese_texts(
         return _cached_translations(requested)
 
     async with _translation_lock:
+        if not _translation_cache_loaded:
+            await _load_translation_cache()
         uncached = tuple(
             text for text in requested if text not in _translation_cache
         )
@@ -94,11 +106,112 @@ async def translate_japanese_texts(
             )
             return _cached_translations(requested)
 
-        _translation_cache.update(translated)
+        _remember_translations(translated)
         _translation_retry_at = 0.0
+        if translated:
+            _schedule_translation_cache_save()
         return _cached_translations(requested)
 
 
+async def load_earthquake_translation_cache() -> int:
+    """저장된 번역을 미리 읽어 재시작 후 첫 속보도 번역 요청 없이 보내게 한다."""
+    async with _translation_lock:
+        if not _translation_cache_loaded:
+            await _load_translation_cache()
+        return len(_translation_cache)
+
+
+async def _load_translation_cache() -> None:
+    global _translation_cache_loaded, _translation_load_retry_at
+
+    # DB 장애 중에는 속보마다 연결 시간 초과를 기다리며 잠금을 쥐고 있지 않도록 미룬다
+    if time.monotonic() < _translation_load_retry_at:
+        return
+    try:
+        row = await fetch_one(
+            "SELECT setting_value FROM setting_data WHERE setting_key = %s",
+            (TRANSLATION_CACHE_SETTING_KEY,),
+        )
+    except Exception:
+        # DB를 못 읽어도 번역은 네트워크로 계속하고 재시도 간격 뒤에 다시 읽는다
+        _translation_load_retry_at = time.monotonic() + TRANSLATION_RETRY_SECONDS
+        logger.warning("지진 번역 캐시 불러오기 실패", exc_info=True)
+        return
+
+    _translation_cache_loaded = True
+    persisted = _decode_translation_entries(row.get("setting_value") if row else None)
+    # 메모리에 이미 있는 번역이 더 최근이므로 저장본을 앞에 둔다
+    merged = OrderedDict(persisted)
+    merged.update(_translation_cache)
+    _translation_cache.clear()
+    _translation_cache.update(merged)
+    _trim_translation_cache()
+
+
+def _decode_translation_entries(value: object) -> list[tuple[str, str]]:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(value, dict):
+        return []
+    raw_entries = value.get("entries")
+    if not isinstance(raw_entries, list):
+        return []
+    return [
+        (item[0], item[1])
+        for item in raw_entries
+        if isinstance(item, list)
+        and len(item) == 2
+        and isinstance(item[0], str)
+        and isinstance(item[1], str)
+    ]
+
+
+def _remember_translations(translated: dict[str, str]) -> None:
+    for source, value in translated.items():
+        _translation_cache[source] = value
+        _translation_cache.move_to_end(source)
+    _trim_translation_cache()
+
+
+def _trim_translation_cache() -> None:
+    while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+        _translation_cache.popitem(last=False)
+
+
+def _schedule_translation_cache_save() -> None:
+    global _translation_save_pending, _translation_save_task
+
+    # 속보 전송을 DB 저장으로 늦추지 않도록 뒤에서 저장하고, 겹친 요청은 한 번으로 합친다
+    _translation_save_pending = True
+    if _translation_save_task is None or _translation_save_task.done():
+        _translation_save_task = asyncio.create_task(_save_translation_cache())
+
+
+async def _save_translation_cache() -> None:
+    global _translation_save_pending
+
+    while _translation_save_pending:
+        _translation_save_pending = False
+        # MySQL JSON 객체는 키 순서를 보존하지 않아 LRU 순서를 목록으로 저장한다
+        payload = {
+            "entries": [[source, value] for source, value in _translation_cache.items()]
+        }
+        try:
+            await execute_query(
+                "INSERT INTO setting_data (setting_key, setting_value) VALUES (%s, %s) "
+                "ON DUPLICATE KEY UPDATE setting_value = VALUES(setting_value)",
+                (
+                    TRANSLATION_CACHE_SETTING_KEY,
+                    json.dumps(payload, ensure_ascii=False),
+                ),
+            )
+        except Exception:
+            logger.warning("지진 번역 캐시 저장 실패", exc_info=True)
+
+
 async def _request_google_translations(
     texts: tuple[str, ...],
 ) -> dict[str, str]:
@@ -177,11 +290,12 @@ def _unique_japanese_texts(texts: Iterable[str]) -> tuple[str, ...]:
 def _cached_translations(
     texts: tuple[str, ...],
 ) -> dict[str, str]:
-    return {
-        text: _translation_cache[text]
-        for text in texts
-        if text in _translation_cache
-    }
+    cached: dict[str, str] = {}
+    for text in texts:
+        if text in _translation_cache:
+            _translation_cache.move_to_end(text)
+            cached[text] = _translation_cache[text]
+    return cached
 
 
 class GoogleTranslationError(RuntimeError):
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from util.loop.task_lifecycle import LoopTask
+
+
+@dataclass
+class BotHealthCounters:
+    """/health와 presence가 매번 전체를 순회하지 않도록 이벤트에서 갱신하는 카운터."""
+
+    guild_members: dict[int, int] = field(default_factory=dict)
+    member_count: int = 0
+    loop_tasks: dict[str, LoopTask] = field(default_factory=dict)
+
+    @property
+    def guild_count(self) -> int:
+        return len(self.guild_members)
+
+    def sync_guilds(self, guilds: Iterable[Any]) -> None:
+        """연결(재연결) 직후 길드 목록으로 카운터를 다시 맞춘다."""
+        self.guild_members = {
+            guild.id: int(getattr(guild, "member_count", None) or 0) for guild in guilds
+        }
+        self.member_count = sum(self.guild_members.values())
+
+    def guild_joined(self, guild: Any) -> None:
+        self.guild_left(guild.id)
+        count = int(getattr(guild, "member_count", None) or 0)
+        self.guild_members[guild.id] = count
+        self.member_count += count
+
+    def guild_left(self, guild_id: int) -> None:
+        self.member_count -= self.guild_members.pop(guild_id, 0)
+
+    def member_joined(self, guild_id: int) -> None:
+        if guild_id not in self.guild_members:
+            return
+        self.guild_members[guild_id] += 1
+        self.member_count += 1
+
+    def member_left(self, guild_id: int) -> None:
+        if not self.guild_members.get(guild_id):
+            return
+        self.guild_members[guild_id] -= 1
+        self.member_count -= 1
+
+    def register_loop_tasks(self, owner: object, task_names: Iterable[str]) -> None:
+        for task_name in task_names:
+            self.loop_tasks[task_name] = getattr(owner, task_name)
+
+    def unregister_loop_tasks(self, task_names: Iterable[str]) -> None:
+        for task_name in task_names:
+            self.loop_tasks.pop(task_name, None)
+
+    def loop_task_status(self) -> dict[str, bool]:
+        return {name: task.is_running() for name, task in self.loop_tasks.items()}
+
+
+def get_health_counters(bot: Any) -> BotHealthCounters:
+    counters = getattr(bot, "HEALTH_COUNTERS", None)
+    if not isinstance(counters, BotHealthCounters):
+        counters = BotHealthCounters()
+        bot.HEALTH_COUNTERS = counters
+    return counters
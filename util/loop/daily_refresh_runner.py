@@ -94,7 +94,7 @@ async def run_daily_refreshes(
         if sunday_maple_success_count:
             log(f"[{now}] 썬데이메이플 공지 {sunday_maple_success_count}개 채널 전송 완료.")
 
-    bot.USER_MESSAGES = {}
+    bot.USER_MESSAGES.clear()
     await reload_recent_messages()
     log(f"[{now}] user_messages 초기화 완료.")
 
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import sys
+from collections import deque
+from collections.abc import Iterator
+from itertools import islice
+from dataclasses import dataclass, field
+
+
+MAX_CACHED_MESSAGES_PER_AUTHOR = 100
+# 컨테이너 메모리 한도(500MB) 안에서 다른 캐시와 함께 쓰도록 메시지 캐시 전체 예산을 둔다.
+MESSAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+# 슬롯 객체, deque 슬롯 두 개(작성자/타임라인)에 드는 대략적인 고정 비용
+_RECORD_OVERHEAD_BYTES = 160
+# 타임라인에 남은 삭제 표시 항목이 이 수를 넘고 살아있는 항목보다 많으면 압축한다.
+_TIMELINE_COMPACT_MIN_STALE = 256
+
+
+@dataclass(slots=True, eq=False)
+class CachedMessage:
+    """캐시에 보관하는 메시지 한 건. 시각은 epoch 초로 저장한다."""
+
+    guild_id: int
+    channel_id: int | None
+    author: str
+    role: str
+    text: str
+    image_urls: tuple[str, ...]
+    timestamp: float
+    size: int = field(default=0, repr=False)
+    evicted: bool = field(default=False, repr=False)
+
+
+def _estimate_record_bytes(text: str, image_urls: tuple[str, ...]) -> int:
+    return (
+        _RECORD_OVERHEAD_BYTES
+        + sys.getsizeof(text)
+        + sum(sys.getsizeof(url) for url in image_urls)
+    )
+
+
+def _timestamp_key(record: CachedMessage) -> float:
+    return record.timestamp
+
+
+def _insert_in_time_order(records: deque[CachedMessage], record: CachedMessage) -> None:
+    if not records or records[-1].timestamp <= record.timestamp:
+        records.append(record)
+        return
+    # 시작 시 history 적재가 실시간 메시지보다 늦게 들어오는 경우만 이 경로를 탄다.
+    index = bisect.bisect_right(records, record.timestamp, key=_timestamp_key)
+    records.insert(index, record)
+
+
+@dataclass(slots=True)
+class _GuildMessages:
+    authors: dict[str, deque[CachedMessage]] = field(default_factory=dict)
+    # 길드 전체를 시간순으로 잇는 색인. 작성자 상한으로 빠진 항목은 evicted 표시 후 지연 삭제한다.
+    timeline: deque[CachedMessage] = field(default_factory=deque)
+    live_count: int = 0
+    stale_count: int = 0
+
+    def oldest(self) -> CachedMessage | None:
+        while self.timeline and self.timeline[0].evicted:
+            self.timeline.popleft()
+            self.stale_count -= 1
+        return self.timeline[0] if self.timeline else None
+
+    def compact_if_needed(self) -> None:
+        if (
+            self.stale_count > _TIMELINE_COMPACT_MIN_STALE
+            and self.stale_count > self.live_count
+        ):
+            self.timeline = deque(
+                record for record in self.timeline if not record.evicted
+            )
+            self.stale_count = 0
+
+
+class MessageCache:
+    """길드 -> 작성자별 최근 메시지 캐시.
+
+    작성자별 상한(MAX_CACHED_MESSAGES_PER_AUTHOR)과 전체 메모리 예산을 함께 지키며,
+    예산을 넘으면 모든 길드를 통틀어 가장 오래된 메시지부터 버린다.
+    """
+
+    def __init__(
+        self,
+        *,
+        per_author_limit: int = MAX_CACHED_MESSAGES_PER_AUTHOR,
+        max_bytes: int = MESSAGE_CACHE_MAX_BYTES,
+    ) -> None:
+        self.per_author_limit = per_author_limit
+        self.max_bytes = max_bytes
+        self._guilds: dict[int, _GuildMessages] = {}
+        self._message_count = 0
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return self._message_count
+
+    @property
+    def message_count(self) -> int:
+        return self._message_count
+
+    @property
+    def approx_bytes(self) -> int:
+        return self._bytes
+
+    def guild_ids(self) -> list[int]:
+        return [guild_id for guild_id, guild in self._guilds.items() if guild.live_count]
+
+    def guild_message_count(self, guild_id: int) -> int:
+        guild = self._guilds.get(guild_id)
+        return guild.live_count if guild is not None else 0
+
+    def authors(self, guild_id: int) -> list[str]:
+        guild = self._guilds.get(guild_id)
+        return list(guild.authors) if guild is not None else []
+
+    def author_messages(self, guild_id: int, author: str) -> list[CachedMessage]:
+        guild = self._guilds.get(guild_id)
+        if guild is None:
+            return []
+        return list(guild.authors.get(author, ()))
+
+    def iter_guild_messages(self, guild_id: int) -> Iterator[CachedMessage]:
+        """길드 메시지를 오래된 순으로 돌려준다."""
+        guild = self._guilds.get(guild_id)
+        if guild is None:
+            return
+        for record in guild.timeline:
+            if not record.evicted:
+                yield record
+
+    def recent(
+        self,
+        guild_id: int,
+        limit: int,
+        *,
+        channel_id: int | None = None,
+    ) -> list[CachedMessage]:
+        """최근 limit개를 오래된→최신 순으로 돌려준다.
+
+        작성자별 deque는 이미 시간순이므로 뒤에서부터 k-way 병합해 필요한 만큼만 읽는다.
+        """
+        guild = self._guilds.get(guild_id)
+        if guild is None or limit <= 0:
+            return []
+        newest_first = heapq.merge(
+            *(reversed(records) for records in guild.authors.values()),
+            key=_timestamp_key,
+            reverse=True,
+        )
+        if channel_id is not None:
+            newest_first = (
+                record for record in newest_first if record.channel_id == channel_id
+            )
+        recent = list(islice(newest_first, limit))
+        recent.reverse()
+        return recent
+
+    def add(
+        self,
+        guild_id: int,
+        *,
+        author: str,
+        role: str,
+        text: str,
+        timestamp: float,
+        channel_id: int | None = None,
+        image_urls: tuple[str, ...] = (),
+    ) -> CachedMessage:
+        record = CachedMessage(
+            guild_id=guild_id,
+            channel_id=channel_id,
+            author=author,
+            role=role,
+            text=text,
+            image_urls=image_urls,
+            timestamp=timestamp,
+            size=_estimate_record_bytes(text, image_urls),
+        )
+        guild = self._guilds.setdefault(guild_id, _GuildMessages())
+        author_records = guild.authors.setdefault(author, deque())
+        _insert_in_time_order(author_records, record)
+        _insert_in_time_order(guild.timeline, record)
+        guild.live_count += 1
+        self._message_count += 1
+        self._bytes += record.size
+
+        if self.per_author_limit > 0:
+            while len(author_records) > self.per_author_limit:
+                self._evict(guild, author_records.popleft())
+            guild.compact_if_needed()
+        self._enforce_budget()
+        return record
+
+    def clear(self) -> None:
+        self._guilds.clear()
+        self._message_count = 0
+        self._bytes = 0
+
+    def _evict(self, guild: _GuildMessages, record: CachedMessage) -> None:
+        record.evicted = True
+        guild.live_count -= 1
+        guild.stale_count += 1
+        self._message_count -= 1
+        self._bytes -= record.size
+
+    def _enforce_budget(self) -> None:
+        while self._bytes > self.max_bytes and self._message_count > 0:
+            oldest_guild: _GuildMessages | None = None
+            oldest_record: CachedMessage | None = None
+            for guild in self._guilds.values():
+                candidate = guild.oldest()
+                if candidate is not None and (
+                    oldest_record is None or candidate.timestamp < oldest_record.timestamp
+                ):
+                    oldest_guild, oldest_record = guild, candidate
+            if oldest_guild is None or oldest_record is None:
+                return
+
+            # 길드에서 가장 오래된 메시지는 보통 해당 작성자 목록의 맨 앞에 있다.
+            author_records = oldest_guild.authors[oldest_record.author]
+            if author_records[0] is oldest_record:
+                author_records.popleft()
+            else:
+                author_records.remove(oldest_record)
+            if not author_records:
+                del oldest_guild.authors[oldest_record.author]
+            self._evict(oldest_guild, oldest_record)
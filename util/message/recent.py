@@ -1,80 +1,54 @@
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+from util.message.cache import CachedMessage, MessageCache
 
 
 logger = logging.getLogger(__name__)
 
+SEOUL_TZ = timezone(timedelta(hours=9))
 
-def get_recent_messages(client, guild_id: int, limit: int = 20):
-    def _format_content(c):
-        if isinstance(c, str):
-            return c.strip()
-        if isinstance(c, list):
-            texts, images = [], []
-            for part in c:
-                if not isinstance(part, dict):
-                    continue
-                # type 분기
-                ptype = part.get("type")
-                if ptype == "input_text":
-                    txt = part.get("text", "")
-                    if isinstance(txt, str) and txt.strip():
-                        texts.append(txt.strip())
-                elif ptype == "input_image":
-                    url = part.get("image_url")
-                    if isinstance(url, str) and url.strip():
-                        images.append(url.strip())
-            text_part = " ".join(texts) if texts else ""
-            if images:
-                img_part = (
-                    f"(image: {images[0]})"
-                    if len(images) == 1
-                    else f"(images: {len(images)}개)"
-                )
-                return f"{text_part} {img_part}".strip()
-            return text_part
-        return str(c)
 
-    def _parse_time(m):
-        t = m.get("time", "")
-        try:
-            return datetime.strptime(t, "%Y-%m-%d %H:%M:%S")
-        except (TypeError, ValueError):
-            return datetime(1970, 1, 1)
+def _format_content(record: CachedMessage) -> str:
+    text_part = record.text.strip()
+    images = [url.strip() for url in record.image_urls if url and url.strip()]
+    if images:
+        img_part = (
+            f"(image: {images[0]})"
+            if len(images) == 1
+            else f"(images: {len(images)}개)"
+        )
+        return f"{text_part} {img_part}".strip()
+    return text_part
 
-    # 길드별 저장 구조: USER_MESSAGES[guild_id][author] = [msg,...]
-    root = getattr(client, "USER_MESSAGES", {})
-    if not isinstance(root, dict):
-        logger.warning("get_recent_messages: USER_MESSAGES 타입 오류 -> %s", type(root))
-        return ""
-    guild_map = root.get(guild_id) or {}
-    if not isinstance(guild_map, dict):
-        logger.warning("get_recent_messages: 길드 맵이 dict가 아님 -> %s", type(guild_map))
-        return ""
 
-    # 길드 내 모든 유저 메시지 평탄화(+ author 주입)
-    all_msgs = []
-    for author, msgs in guild_map.items():
-        if isinstance(msgs, list):
-            for m in msgs:
-                all_msgs.append({**m, "author": author})
+def _format_time(record: CachedMessage) -> str:
+    return datetime.fromtimestamp(record.timestamp, SEOUL_TZ).strftime("%Y-%m-%d %H:%M:%S")
 
-    logger.debug("get_recent_messages[guild=%s]: 집계된 메시지 수 = %s", guild_id, len(all_msgs))
 
-    if not all_msgs:
+def get_recent_messages(
+    client,
+    guild_id: int,
+    limit: int = 20,
+    *,
+    channel_id: int | None = None,
+):
+    cache = getattr(client, "USER_MESSAGES", None)
+    if not isinstance(cache, MessageCache):
+        logger.warning("get_recent_messages: USER_MESSAGES 타입 오류 -> %s", type(cache))
         return ""
 
-    # 최신순 정렬 → 최근 limit개 → 보기 좋게 오래된→최신으로
-    all_msgs.sort(key=_parse_time, reverse=True)
-    recent = list(reversed(all_msgs[:limit]))
+    # 작성자별 시간순 목록을 최신 쪽부터 병합해 limit개만 꺼낸다
+    records = cache.recent(guild_id, limit, channel_id=channel_id)
+    logger.debug("get_recent_messages[guild=%s]: 집계된 메시지 수 = %s", guild_id, len(records))
+
+    if not records:
+        return ""
 
-    lines = []
-    for m in recent:
-        author = m.get("author", "unknown")
-        role = m.get("role", "user")
-        content = _format_content(m.get("content", ""))
-        t = m.get("time", "")
-        lines.append(f"[{t}] {author}({role}): {content}")
+    lines = [
+        f"[{_format_time(record)}] {record.author}({record.role}): {_format_content(record)}"
+        for record in records
+    ]
 
     logger.debug("최근 메시지 데이터 요청됨 (guild=%s): %s", guild_id, lines)
     return "\n".join(lines)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+SEOUL_TZ = timezone(timedelta(hours=9))
+# 채널 하나당 최대로 살펴볼 메시지 수. 오늘 이전 메시지를 만나면 그 전에 멈춘다.
+RECENT_MESSAGE_HISTORY_LIMIT = 100
+# history 라우트는 채널별 버킷이라 동시에 여러 채널을 읽어도 한도에 걸리지 않는다.
+RECENT_MESSAGE_LOAD_CONCURRENCY = 8
+RECENT_MESSAGE_PROGRESS_EVERY = 25
+
+ChannelMessagesHandler = Callable[[Any, list[Any]], None]
+
+
+@dataclass
+class RecentMessageLoadStats:
+    """시작 시 최근 메시지 적재 진행률과 소요 시간."""
+
+    channels_total: int = 0
+    channels_done: int = 0
+    channels_failed: int = 0
+    messages: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: float | None = None
+
+    @property
+    def duration_s(self) -> float:
+        end = self.finished_at if self.finished_at is not None else time.monotonic()
+        return end - self.started_at
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "channels_total": self.channels_total,
+            "channels_done": self.channels_done,
+            "channels_failed": self.channels_failed,
+            "messages": self.messages,
+            "finished": self.finished_at is not None,
+            "duration_s": round(self.duration_s, 3),
+        }
+
+
+def kst_day_start(now: datetime | None = None) -> datetime:
+    """KST 기준 오늘 0시를 돌려준다."""
+    current = (now or datetime.now(SEOUL_TZ)).astimezone(SEOUL_TZ)
+    return current.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+async def fetch_channel_messages_since(
+    channel: Any,
+    *,
+    since: datetime,
+    limit: int = RECENT_MESSAGE_HISTORY_LIMIT,
+) -> list[Any]:
+    """`since` 이후 메시지를 최신순으로 모은다. 더 오래된 메시지가 나오면 페이지 요청을 멈춘다."""
+    messages: list[Any] = []
+    async for message in channel.history(limit=limit):
+        if message.created_at < since:
+            break
+        messages.append(message)
+    return messages
+
+
+async def warm_up_channel_history(
+    channels: Iterable[Any],
+    *,
+    since: datetime,
+    handle_messages: ChannelMessagesHandler,
+    concurrency: int = RECENT_MESSAGE_LOAD_CONCURRENCY,
+    limit: int = RECENT_MESSAGE_HISTORY_LIMIT,
+    progress_every: int = RECENT_MESSAGE_PROGRESS_EVERY,
+    stats: RecentMessageLoadStats | None = None,
+) -> RecentMessageLoadStats:
+    """여러 채널의 history를 제한된 동시성으로 읽고 채널별 결과를 handle_messages에 넘긴다."""
+    channel_list = list(channels)
+    stats = stats or RecentMessageLoadStats()
+    stats.channels_total += len(channel_list)
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _load(channel: Any) -> None:
+        async with semaphore:
+            try:
+                messages = await fetch_channel_messages_since(
+                    channel,
+                    since=since,
+                    limit=limit,
+                )
+            except Exception:
+                # 채널 접근 권한 없음 등은 건너뛴다
+                stats.channels_failed += 1
+                logger.debug(
+                    "recent message load skipped channel: channel_id=%s",
+                    getattr(channel, "id", None),
+                    exc_info=True,
+                )
+                messages = []
+
+        if messages:
+            handle_messages(channel, messages)
+        stats.messages += len(messages)
+        stats.channels_done += 1
+        if progress_every > 0 and stats.channels_done % progress_every == 0:
+            logger.info(
+                "recent message warm-up progress: channels=%s/%s messages=%s elapsed=%.2fs",
+                stats.channels_done,
+                stats.channels_total,
+                stats.messages,
+                stats.duration_s,
+            )
+
+    await asyncio.gather(*(_load(channel) for channel in channel_list))
+    stats.finished_at = time.monotonic()
+    logger.info(
+        "recent message warm-up finished: channels=%s failed=%s messages=%s duration=%.2fs",
+        stats.channels_total,
+        stats.channels_failed,
+        stats.messages,
+        stats.duration_s,
+    )
+    return stats
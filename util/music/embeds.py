@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from collections.abc import Iterable
 from datetime import datetime
 from typing import Any, Protocol
@@ -95,3 +96,10 @@ def make_playing_music_embed(
         icon_url=requester_icon,
     )
     return embed
+
+
+def music_embed_fingerprint(embed: Any) -> str:
+    """렌더링된 임베드를 비교용 문자열로 직렬화한다."""
+    to_dict = getattr(embed, "to_dict", None)
+    payload = to_dict() if callable(to_dict) else embed
+    return json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import re
 from collections.abc import Sequence
 from typing import Any
+from urllib.parse import parse_qs, urlparse
 
 
 MusicFormat = dict[str, Any]
 MusicInfo = dict[str, Any]
 
+_YOUTUBE_VIDEO_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+_EXPIRE_PATH_PATTERN = re.compile(r"/expire/(\d+)")
+
 
 def _rate_key(fmt: MusicFormat) -> tuple[int | float, int | float, int | float]:
     return (fmt.get("abr") or 0, fmt.get("asr") or 0, fmt.get("tbr") or 0)
@@ -59,3 +64,38 @@ def select_yt_dlp_entry(data: MusicInfo) -> MusicInfo:
     if not entries:
         return data
     return next((entry for entry in entries if entry.get("formats")), entries[0])
+
+
+def extract_youtube_video_id(url: str | None) -> str | None:
+    if not url:
+        return None
+    parsed = urlparse(url)
+    host = parsed.netloc.lower().split(":", 1)[0]
+    path = parsed.path or ""
+    if host == "youtu.be":
+        candidate = path.lstrip("/").split("/", 1)[0]
+    elif host.endswith("youtube.com"):
+        if path == "/watch":
+            candidate = (parse_qs(parsed.query).get("v") or [""])[0]
+        elif path.startswith(("/shorts/", "/live/", "/embed/")):
+            candidate = path.split("/")[2]
+        else:
+            return None
+    else:
+        return None
+    return candidate if _YOUTUBE_VIDEO_ID_PATTERN.match(candidate) else None
+
+
+def parse_stream_url_expiry(url: str | None) -> float | None:
+    """googlevideo 서명 URL의 expire 값(epoch 초)을 읽는다."""
+    if not url:
+        return None
+    values = parse_qs(urlparse(url).query).get("expire")
+    raw = values[0] if values else None
+    if raw is None:
+        match = _EXPIRE_PATH_PATTERN.search(url)
+        raw = match.group(1) if match else None
+    try:
+        return float(raw) if raw is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+
+PANEL_REFRESH_PLAYING_SECONDS = 5.0
+# 일시정지 중이거나 듣는 사람이 없으면 진행 바를 자주 갱신할 이유가 없다.
+PANEL_REFRESH_IDLE_SECONDS = 30.0
+# 채널별 메시지 수정 버킷(5회/5초)을 다른 패널 수정과 나눠 쓰도록 최소 간격을 둔다.
+PANEL_MIN_EDIT_GAP_SECONDS = 2.0
+PANEL_MAX_EDITS_PER_TICK = 5
+# 배치 사이 간격. 전역 REST 한도(초당 50회)보다 충분히 낮게 유지한다.
+PANEL_BATCH_GAP_SECONDS = 0.5
+
+
+def resolve_panel_refresh_interval(*, is_paused: bool, has_listeners: bool) -> float:
+    if is_paused or not has_listeners:
+        return PANEL_REFRESH_IDLE_SECONDS
+    return PANEL_REFRESH_PLAYING_SECONDS
+
+
+def has_active_listeners(members: Iterable[Any]) -> bool:
+    """봇이 아니고 헤드셋을 끄지 않은 멤버가 있는지 확인한다."""
+    for member in members:
+        if getattr(member, "bot", False):
+            continue
+        voice = getattr(member, "voice", None)
+        if voice is not None and (
+            getattr(voice, "self_deaf", False) or getattr(voice, "deaf", False)
+        ):
+            continue
+        return True
+    return False
+
+
+@dataclass
+class PanelRefreshScheduler:
+    """길드별 패널 갱신 시각을 한 곳에서 관리하는 스케줄러."""
+
+    due_at: dict[int, float] = field(default_factory=dict)
+    last_fingerprints: dict[int, str] = field(default_factory=dict)
+    last_sent_at: dict[int, float] = field(default_factory=dict)
+    _heap: list[tuple[float, int]] = field(default_factory=list)
+
+    def schedule(self, guild_id: int, *, now: float, delay: float = 0.0) -> None:
+        due = now + max(0.0, delay)
+        self.due_at[guild_id] = due
+        heapq.heappush(self._heap, (due, guild_id))
+
+    def unschedule(self, guild_id: int) -> None:
+        self.due_at.pop(guild_id, None)
+
+    def forget(self, guild_id: int) -> None:
+        self.unschedule(guild_id)
+        self.last_fingerprints.pop(guild_id, None)
+        self.last_sent_at.pop(guild_id, None)
+
+    def pop_due(
+        self,
+        *,
+        now: float,
+        limit: int = PANEL_MAX_EDITS_PER_TICK,
+    ) -> list[int]:
+        due_guilds: list[int] = []
+        deferred: list[int] = []
+        while self._heap and len(due_guilds) < limit:
+            due, guild_id = self._heap[0]
+            if due > now:
+                break
+            heapq.heappop(self._heap)
+            if self.due_at.get(guild_id) != due:
+                continue
+            last_sent = self.last_sent_at.get(guild_id)
+            if last_sent is not None and now - last_sent < PANEL_MIN_EDIT_GAP_SECONDS:
+                deferred.append(guild_id)
+                continue
+            del self.due_at[guild_id]
+            due_guilds.append(guild_id)
+        for guild_id in deferred:
+            self.schedule(
+                guild_id,
+                now=self.last_sent_at[guild_id],
+                delay=PANEL_MIN_EDIT_GAP_SECONDS,
+            )
+        return due_guilds
+
+    def next_wakeup(self, *, now: float) -> float | None:
+        while self._heap:
+            due, guild_id = self._heap[0]
+            if self.due_at.get(guild_id) == due:
+                return max(0.0, due - now)
+            heapq.heappop(self._heap)
+        return None
+
+    def should_send(self, guild_id: int, fingerprint: str) -> bool:
+        return self.last_fingerprints.get(guild_id) != fingerprint
+
+    def mark_sent(self, guild_id: int, fingerprint: str, *, now: float) -> None:
+        self.last_fingerprints[guild_id] = fingerprint
+        self.last_sent_at[guild_id] = now
@@ -109,9 +109,12 @@ async def prepare_replay_source(
     ffmpeg_options: dict[str, Any],
     ffmpeg_executable: str,
     loop: Any,
+    is_audio_url_fresh: Callable[[str | None], bool] | None = None,
 ) -> MusicReplaySourceResult:
     audio_url = getattr(player, "audio_url", None) or player.data.get("url")
     try:
+        if is_audio_url_fresh is not None and not is_audio_url_fresh(audio_url):
+            raise ValueError("stream url expired")
         return MusicReplaySourceResult(
             source=ffmpeg_source_factory(
                 audio_url,
@@ -120,6 +123,7 @@ async def prepare_replay_source(
             )
         )
     except Exception:
+        # 만료됐거나 소스 생성에 실패하면 캐시를 거쳐 다시 해석한다.
         refreshed = await prepare_music_player(
             source_factory,
             player.webpage_url,
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from util.music.playback import prepare_music_player
+from util.music.queue import QueuedTrack
+
+
+# 서명된 스트림 URL은 수 시간 유효하지만, 일시정지 등으로 오래 묵은 결과는 다시 해석한다.
+PREFETCH_MAX_AGE_SECONDS = 1800.0
+
+
+@dataclass
+class MusicPrefetch:
+    """대기열 맨 앞 곡을 백그라운드에서 미리 해석하는 작업."""
+
+    track: QueuedTrack
+    task: asyncio.Future
+    started_at: float = field(default_factory=lambda: time.time())
+
+
+def cancel_music_prefetch(state: Any) -> None:
+    prefetch = getattr(state, "prefetch", None)
+    state.prefetch = None
+    if prefetch is not None and not prefetch.task.done():
+        prefetch.task.cancel()
+
+
+def plan_music_prefetch(state: Any) -> QueuedTrack | None:
+    """새로 미리 해석해야 할 곡을 돌려준다. 대기열 맨 앞이 바뀌었으면 기존 작업은 취소한다."""
+    next_track = state.queue[0] if state.queue else None
+    if next_track is None or state.player is None:
+        cancel_music_prefetch(state)
+        return None
+    if state.prefetch is not None and state.prefetch.track is next_track:
+        return None
+    cancel_music_prefetch(state)
+    return next_track
+
+
+def take_music_prefetch(
+    state: Any,
+    track: QueuedTrack,
+    *,
+    now: float,
+    max_age: float = PREFETCH_MAX_AGE_SECONDS,
+) -> MusicPrefetch | None:
+    prefetch = state.prefetch
+    state.prefetch = None
+    if prefetch is None:
+        return None
+    if (
+        prefetch.track is not track
+        or prefetch.task.cancelled()
+        or now - prefetch.started_at > max_age
+    ):
+        if not prefetch.task.done():
+            prefetch.task.cancel()
+        return None
+    return prefetch
+
+
+async def prepare_queued_track_player(
+    track: QueuedTrack,
+    *,
+    prefetch: MusicPrefetch | None,
+    source_factory: Callable[..., Awaitable[Any]],
+    resolved_player_factory: Callable[..., Any],
+    loop: Any,
+) -> Any:
+    """미리 해석된 스트림이 있으면 FFmpeg 소스만 만들고, 없으면 평소처럼 추출한다."""
+    resolved = await prefetch.task if prefetch is not None else None
+    if resolved is None:
+        return await prepare_music_player(
+            source_factory,
+            track.url,
+            loop=loop,
+            requester=track.requester,
+        )
+
+    async def _from_resolved(url: str, *, loop: Any, requester: Any) -> Any:
+        return resolved_player_factory(resolved, requester=requester)
+
+    return await prepare_music_player(
+        _from_resolved,
+        track.url,
+        loop=loop,
+        requester=track.requester,
+    )
@@ -3,9 +3,15 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import queue
 import re
-from collections.abc import Mapping
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Literal
 
@@ -15,6 +21,8 @@ import yt_dlp as youtube_dl
 
 from common.http import EXTERNAL_HTTP_TIMEOUT
 from util.music.extractor import (
+    extract_youtube_video_id,
+    parse_stream_url_expiry,
     resolve_search_result_url,
     select_best_audio_format,
     select_yt_dlp_entry,
@@ -38,7 +46,29 @@ ffmpeg_options = {
     "options": "-threads 2 -vn -ac 2 -ar 48000 -acodec libopus -compression_level 5 -application audio -hide_banner -nostats -loglevel error",
 }
 
-YTDL_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ytdl")
+YTDL_EXECUTOR_WORKERS = 2
+YTDL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=YTDL_EXECUTOR_WORKERS,
+    thread_name_prefix="ytdl",
+)
+
+STREAM_CACHE_MAX_ENTRIES = 128
+STREAM_CACHE_METADATA_TTL_SECONDS = 6 * 60 * 60
+# expire 파라미터가 없는 URL은 보수적으로 짧게만 재사용한다.
+STREAM_URL_DEFAULT_TTL_SECONDS = 30 * 60
+# 재생 도중 만료되지 않도록 만료 직전 URL은 재사용하지 않는다.
+STREAM_URL_EXPIRY_MARGIN_SECONDS = 10 * 60
+# 캐시에는 재생/표시에 필요 없는 큰 필드를 빼고 보관한다.
+_STREAM_CACHE_DROPPED_INFO_KEYS = (
+    "formats",
+    "requested_formats",
+    "thumbnails",
+    "subtitles",
+    "automatic_captions",
+    "heatmap",
+    "chapters",
+    "fragments",
+)
 
 
 def dbg(msg: str) -> None:
@@ -49,6 +79,135 @@ def dbg(msg: str) -> None:
         logger.debug("music source debug 출력 실패", exc_info=True)
 
 
+@dataclass(frozen=True)
+class CachedStreamInfo:
+    info: dict[str, Any]
+    audio_format: dict[str, Any] | None
+    audio_url: str | None
+    expires_at: float | None
+    cached_at: float
+
+
+class StreamInfoCache:
+    """영상 ID별 yt-dlp 추출 결과와 서명 스트림 URL을 보관하는 프로세스 공용 LRU."""
+
+    def __init__(
+        self,
+        max_entries: int = STREAM_CACHE_MAX_ENTRIES,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, CachedStreamInfo] = OrderedDict()
+        # fill_queue_track_metadata 추출기는 executor 스레드에서 호출된다.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stream(self, video_id: str) -> CachedStreamInfo | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None or not entry.audio_url:
+                return None
+            if entry.expires_at - STREAM_URL_EXPIRY_MARGIN_SECONDS <= now:
+                return None
+            self._entries.move_to_end(video_id)
+            return entry
+
+    def get_metadata(self, video_id: str) -> dict[str, Any] | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None:
+                return None
+            if now - entry.cached_at > STREAM_CACHE_METADATA_TTL_SECONDS:
+                del self._entries[video_id]
+                return None
+            self._entries.move_to_end(video_id)
+            return entry.info
+
+    def put_stream(
+        self,
+        video_id: str,
+        info: Mapping[str, Any],
+        *,
+        audio_format: Mapping[str, Any] | None,
+        audio_url: str,
+    ) -> CachedStreamInfo:
+        now = self._clock()
+        expires_at = parse_stream_url_expiry(audio_url) or (
+            now + STREAM_URL_DEFAULT_TTL_SECONDS
+        )
+        entry = CachedStreamInfo(
+            info=_slim_stream_info(info),
+            audio_format=dict(audio_format) if audio_format else None,
+            audio_url=audio_url,
+            expires_at=expires_at,
+            cached_at=now,
+        )
+        self._store(video_id, entry)
+        return entry
+
+    def put_metadata(self, video_id: str, info: Mapping[str, Any]) -> None:
+        """스트림 URL 없이 메타데이터만 보관한다. 유효한 스트림 항목은 덮어쓰지 않는다."""
+        if self.get_stream(video_id) is not None:
+            return
+        self._store(
+            video_id,
+            CachedStreamInfo(
+                info=_slim_stream_info(info),
+                audio_format=None,
+                audio_url=None,
+                expires_at=None,
+                cached_at=self._clock(),
+            ),
+        )
+
+    def invalidate(self, video_id: str) -> None:
+        with self._lock:
+            self._entries.pop(video_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _store(self, video_id: str, entry: CachedStreamInfo) -> None:
+        with self._lock:
+            self._entries[video_id] = entry
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+def _slim_stream_info(info: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        key: value
+        for key, value in info.items()
+        if key not in _STREAM_CACHE_DROPPED_INFO_KEYS
+    }
+
+
+STREAM_CACHE = StreamInfoCache()
+
+
+def is_stream_url_fresh(
+    audio_url: str | None,
+    *,
+    now: float | None = None,
+) -> bool:
+    """만료 여유 시간을 남기고 아직 재사용할 수 있는 스트림 URL인지 확인한다."""
+    if not audio_url:
+        return False
+    expires_at = parse_stream_url_expiry(audio_url)
+    if expires_at is None:
+        return True
+    current = time.time() if now is None else now
+    return expires_at - STREAM_URL_EXPIRY_MARGIN_SECONDS > current
+
+
 class _SilentYTDLLogger:
     def debug(self, msg: str) -> None:
         return
@@ -115,6 +274,24 @@ info_ytdl = youtube_dl.YoutubeDL(
 )
 
 
+def extract_queue_metadata_cached(url: str) -> dict[str, Any] | None:
+    """대기열 표시용 메타데이터를 캐시에서 찾고, 없으면 info_ytdl로 추출해 보관한다."""
+    video_id = extract_youtube_video_id(url)
+    if video_id:
+        cached = STREAM_CACHE.get_metadata(video_id)
+        if cached is not None:
+            dbg(f"extract_queue_metadata_cached: cache hit video_id={video_id}")
+            return cached
+    info = info_ytdl.extract_info(url, download=False)
+    if not isinstance(info, dict):
+        return info
+    info = select_yt_dlp_entry(info)
+    video_id = info.get("id") or video_id
+    if video_id:
+        STREAM_CACHE.put_metadata(str(video_id), info)
+    return info
+
+
 def build_ffmpeg_options(
     *,
     base_options: Mapping[str, str] | None = None,
@@ -163,7 +340,7 @@ async def fetch_stream_url(page_url: str) -> str:
 
 
 def _make_ydl_opts(**overrides: Any) -> dict[str, Any]:
-    cookies_path = os.path.join(os.getcwd(), "cookies.txt")
+    cookies_path = _cookies_path()
     base = {
         "noplaylist": True,
         "skip_download": True,
@@ -197,25 +374,125 @@ def _summarize_ydl_opts(opts: Mapping[str, Any]) -> str:
     return " ".join(parts)
 
 
+def _cookies_path() -> str:
+    return os.path.join(os.getcwd(), "cookies.txt")
+
+
+def _cookies_signature() -> float | None:
+    try:
+        return os.path.getmtime(_cookies_path())
+    except OSError:
+        return None
+
+
+class YoutubeDLPool:
+    """같은 옵션으로 만든 YoutubeDL 인스턴스를 스레드 간에 돌려 쓰는 풀.
+
+    YoutubeDL은 동시 호출에 안전하지 않으므로 한 인스턴스는 한 번에 한 스레드만 빌린다.
+    cookies.txt가 바뀌면 기존 인스턴스를 버리고 새 옵션으로 다시 만든다.
+    """
+
+    def __init__(
+        self,
+        opts_factory: Callable[[], dict[str, Any]],
+        size: int = YTDL_EXECUTOR_WORKERS,
+        *,
+        ydl_factory: Callable[[dict[str, Any]], Any] = youtube_dl.YoutubeDL,
+        signature: Callable[[], Any] = _cookies_signature,
+    ) -> None:
+        self._opts_factory = opts_factory
+        self._size = size
+        self._ydl_factory = ydl_factory
+        self._signature = signature
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._generation = 0
+        self._current_signature = signature()
+        self.opts = opts_factory()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _refresh_if_stale(self) -> None:
+        current = self._signature()
+        with self._lock:
+            if current == self._current_signature:
+                return
+            self._current_signature = current
+            self._generation += 1
+            self.opts = self._opts_factory()
+            while True:
+                try:
+                    self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                self._created -= 1
+
+    def _borrow(self) -> tuple[Any, int]:
+        self._refresh_if_stale()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_create = self._created < self._size
+            if can_create:
+                self._created += 1
+            generation = self._generation
+            opts = self.opts
+        if can_create:
+            try:
+                return self._ydl_factory(opts), generation
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        return self._idle.get()
+
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        ydl, generation = self._borrow()
+        try:
+            yield ydl
+        finally:
+            with self._lock:
+                if generation == self._generation:
+                    self._idle.put((ydl, generation))
+                    ydl = None
+                else:
+                    self._created = max(0, self._created - 1)
+            if ydl is not None:
+                dbg("YoutubeDLPool: discarded stale instance")
+
+
+_YTDL_FALLBACK_PROFILES: tuple[dict[str, Any], ...] = (
+    {
+        "extractor_args": {"youtube": {"player_client": ["android", "web"]}},
+        "http_headers": HEADERS,
+    },
+    {"http_headers": HEADERS},
+    {
+        "extractor_args": {"youtube": {"player_client": ["android", "web", "ios"]}},
+        "http_headers": HEADERS,
+    },
+    {},
+)
+
+YTDL_POOLS: tuple[YoutubeDLPool, ...] = tuple(
+    YoutubeDLPool(lambda overrides=overrides: _make_ydl_opts(**overrides))
+    for overrides in _YTDL_FALLBACK_PROFILES
+)
+
+
 def _extract_info_with_fallback(url: str) -> dict[str, Any]:
     dbg(f"_extract_info_with_fallback: url={url}")
-    attempts = [
-        _make_ydl_opts(
-            extractor_args={"youtube": {"player_client": ["android", "web"]}},
-            http_headers=HEADERS,
-        ),
-        _make_ydl_opts(http_headers=HEADERS),
-        _make_ydl_opts(
-            extractor_args={"youtube": {"player_client": ["android", "web", "ios"]}},
-            http_headers=HEADERS,
-        ),
-        _make_ydl_opts(),
-    ]
     last_err: BaseException | None = None
-    for opts in attempts:
+    for pool in YTDL_POOLS:
         try:
-            with youtube_dl.YoutubeDL(opts) as ydl:
-                dbg(f"_extract_info_with_fallback: using {_summarize_ydl_opts(opts)}")
+            with pool.acquire() as ydl:
+                dbg(f"_extract_info_with_fallback: using {_summarize_ydl_opts(pool.opts)}")
                 info = ydl.extract_info(url, download=False)
                 if not info:
                     raise ValueError("yt-dlp returned None")
@@ -251,6 +528,134 @@ async def fetch_stream_info(page_url: str) -> tuple[str, dict[str, Any]]:
     return audio_url, data
 
 
+@dataclass(frozen=True)
+class ResolvedAudioStream:
+    """FFmpegOpusAudio를 만들기 직전까지 해석해 둔 스트림 정보."""
+
+    data: dict[str, Any]
+    audio_url: str
+    ffmpeg_options: dict[str, str]
+    ffmpeg_executable: str
+
+    def create_source(self) -> discord.FFmpegOpusAudio:
+        return discord.FFmpegOpusAudio(
+            self.audio_url,
+            **self.ffmpeg_options,
+            executable=self.ffmpeg_executable,
+        )
+
+
+async def resolve_audio_stream(
+    url: str,
+    *,
+    loop: asyncio.AbstractEventLoop | None = None,
+    start_time: int = 0,
+) -> ResolvedAudioStream:
+    """yt-dlp 추출과 포맷 선택까지만 수행하고 FFmpeg 프로세스는 띄우지 않는다."""
+    dbg(f"resolve_audio_stream: start url={url} start_time={start_time}")
+    loop = loop or asyncio.get_event_loop()
+
+    if not re.match(r"^https?://", url or ""):
+        dbg("resolve_audio_stream: keyword search path")
+        search = f"ytsearch5:{url}"
+        info = await loop.run_in_executor(
+            YTDL_EXECUTOR, lambda: _extract_info_with_fallback(search)
+        )
+        url = resolve_search_result_url(info)
+        dbg(f"resolve_audio_stream: selected url={url}")
+
+    video_id = extract_youtube_video_id(url)
+    cached = STREAM_CACHE.get_stream(video_id) if video_id else None
+    if cached is not None:
+        dbg(f"resolve_audio_stream: cache hit video_id={video_id}")
+        return ResolvedAudioStream(
+            data=dict(cached.info),
+            audio_url=cached.audio_url,
+            ffmpeg_options=build_ffmpeg_options(
+                base_options=ffmpeg_options,
+                headers=HEADERS,
+                start_time=start_time,
+                header_target="before_options",
+            ),
+            ffmpeg_executable=_detect_ffmpeg_executable(),
+        )
+
+    try:
+        data = await loop.run_in_executor(
+            YTDL_EXECUTOR, lambda: _extract_info_with_fallback(url)
+        )
+    except Exception as exc:
+        dbg(
+            f"resolve_audio_stream: yt-dlp failed -> HTML fallback: {type(exc)} {exc}"
+        )
+        audio_url, data = await fetch_stream_info(url)
+        return ResolvedAudioStream(
+            data=data,
+            audio_url=audio_url,
+            ffmpeg_options=build_ffmpeg_options(
+                base_options=ffmpeg_options,
+                headers=HEADERS,
+                start_time=start_time,
+                header_target="options",
+            ),
+            ffmpeg_executable=_detect_ffmpeg_executable(),
+        )
+
+    if isinstance(data, dict):
+        dbg(f"resolve_audio_stream: meta keys={list(data.keys())}")
+    else:
+        dbg(f"resolve_audio_stream: meta type={type(data)}")
+    if data and "entries" in data:
+        data = select_yt_dlp_entry(data)
+    if not data:
+        raise ValueError("메타데이터를 가져오지 못했습니다.")
+
+    formats = data.get("formats", []) or []
+    dbg(f"resolve_audio_stream: formats_count={len(formats)}")
+    best = select_best_audio_format(formats)
+    if best:
+        try:
+            dbg(
+                f"resolve_audio_stream: best abr={best.get('abr')} tbr={best.get('tbr')} acodec={best.get('acodec')} vcodec={best.get('vcodec')}"
+            )
+        except (AttributeError, TypeError):
+            logger.debug("yt-dlp best format debug 출력 실패", exc_info=True)
+
+    audio_url = None
+    if best and best.get("url"):
+        audio_url = best["url"]
+    elif data.get("url"):
+        audio_url = data["url"]
+    else:
+        try:
+            page_url = data.get("webpage_url") or url
+            audio_url = await fetch_stream_url(page_url)
+        except Exception as exc:
+            dbg(f"resolve_audio_stream: fetch_stream_url 실패: {type(exc)} {exc}")
+            raise
+    dbg(f"resolve_audio_stream: audio_url selected={bool(audio_url)}")
+    video_id = data.get("id") or video_id
+    if video_id and audio_url:
+        STREAM_CACHE.put_stream(
+            str(video_id),
+            data,
+            audio_format=best,
+            audio_url=audio_url,
+        )
+
+    return ResolvedAudioStream(
+        data=data,
+        audio_url=audio_url,
+        ffmpeg_options=build_ffmpeg_options(
+            base_options=ffmpeg_options,
+            headers=HEADERS,
+            start_time=start_time,
+            header_target="before_options",
+        ),
+        ffmpeg_executable=_detect_ffmpeg_executable(),
+    )
+
+
 class YTDLSource:
     def __init__(
         self,
@@ -267,6 +672,23 @@ class YTDLSource:
         self.requester = requester
         self.audio_url = audio_url
 
+    @classmethod
+    def from_resolved(
+        cls,
+        resolved: ResolvedAudioStream,
+        *,
+        requester: discord.User | None = None,
+    ) -> "YTDLSource":
+        dbg(
+            f"YTDLSource.from_resolved: creating FFmpegOpusAudio exec={resolved.ffmpeg_executable}"
+        )
+        return cls(
+            source=resolved.create_source(),
+            data=resolved.data,
+            requester=requester,
+            audio_url=resolved.audio_url,
+        )
+
     @classmethod
     async def from_url(
         cls,
@@ -279,85 +701,5 @@ class YTDLSource:
         dbg(
             f"YTDLSource.from_url: start url={url} start_time={start_time} requester={getattr(requester, 'id', None)}"
         )
-        loop = loop or asyncio.get_event_loop()
-
-        if not re.match(r"^https?://", url or ""):
-            dbg("YTDLSource.from_url: keyword search path")
-            search = f"ytsearch5:{url}"
-            info = await loop.run_in_executor(
-                YTDL_EXECUTOR, lambda: _extract_info_with_fallback(search)
-            )
-            url = resolve_search_result_url(info)
-            dbg(f"YTDLSource.from_url: selected url={url}")
-
-        try:
-            data = await loop.run_in_executor(
-                YTDL_EXECUTOR, lambda: _extract_info_with_fallback(url)
-            )
-        except Exception as exc:
-            dbg(
-                f"YTDLSource.from_url: yt-dlp failed -> HTML fallback: {type(exc)} {exc}"
-            )
-            audio_url, data = await fetch_stream_info(url)
-            opts = build_ffmpeg_options(
-                base_options=ffmpeg_options,
-                headers=HEADERS,
-                start_time=start_time,
-                header_target="options",
-            )
-            ffmpeg_exec = _detect_ffmpeg_executable()
-            dbg(
-                f"YTDLSource.from_url: [fallback] creating FFmpegOpusAudio exec={ffmpeg_exec}"
-            )
-            source = discord.FFmpegOpusAudio(audio_url, **opts, executable=ffmpeg_exec)
-            return cls(
-                source=source,
-                data=data,
-                requester=requester,
-                audio_url=audio_url,
-            )
-
-        if isinstance(data, dict):
-            dbg(f"YTDLSource.from_url: meta keys={list(data.keys())}")
-        else:
-            dbg(f"YTDLSource.from_url: meta type={type(data)}")
-        if data and "entries" in data:
-            data = select_yt_dlp_entry(data)
-        if not data:
-            raise ValueError("메타데이터를 가져오지 못했습니다.")
-
-        formats = data.get("formats", []) or []
-        dbg(f"YTDLSource.from_url: formats_count={len(formats)}")
-        best = select_best_audio_format(formats)
-        if best:
-            try:
-                dbg(
-                    f"YTDLSource.from_url: best abr={best.get('abr')} tbr={best.get('tbr')} acodec={best.get('acodec')} vcodec={best.get('vcodec')}"
-                )
-            except (AttributeError, TypeError):
-                logger.debug("yt-dlp best format debug 출력 실패", exc_info=True)
-
-        audio_url = None
-        if best and best.get("url"):
-            audio_url = best["url"]
-        elif data.get("url"):
-            audio_url = data["url"]
-        else:
-            try:
-                page_url = data.get("webpage_url") or url
-                audio_url = await fetch_stream_url(page_url)
-            except Exception as exc:
-                dbg(f"YTDLSource.from_url: fetch_stream_url 실패: {type(exc)} {exc}")
-                raise
-        dbg(f"YTDLSource.from_url: audio_url selected={bool(audio_url)}")
-
-        opts = build_ffmpeg_options(
-            base_options=ffmpeg_options,
-            headers=HEADERS,
-            start_time=start_time,
-            header_target="before_options",
-        )
-        ffmpeg_exec = _detect_ffmpeg_executable()
-        dbg(f"YTDLSource.from_url: creating FFmpegOpusAudio exec={ffmpeg_exec}")
-        source = discord.FFmpegOpusAudio(audio_url, **opts, executable=ffmpeg_exec)
-        return cls(source=source, data=data, requester=requester, audio_url=audio_url)
+        resolved = await resolve_audio_stream(url, loop=loop, start_time=start_time)
+        return cls.from_resolved(resolved, requester=requester)
@@ -4,6 +4,7 @@ import collections
 from dataclasses import dataclass, field
 from typing import Any, Deque
 
+from util.music.prefetch import MusicPrefetch, cancel_music_prefetch
 from util.music.queue import QueuedTrack
 
 
@@ -16,8 +17,9 @@ class GuildMusicState:
     control_channel: object | None = None
     control_msg: object | None = None
     control_view: object | None = None
-    updater_task: object | None = None
+    panel_refresh_active: bool = False
     idle_disconnect_task: object | None = None
+    prefetch: MusicPrefetch | None = None
     is_loop: bool = False
     is_seeking: bool = False
     is_skipping: bool = False
@@ -29,9 +31,8 @@ def reset_music_playback_state(state: GuildMusicState) -> None:
     state.queue.clear()
     state.is_loop = False
     state.is_skipping = False
-    if state.updater_task:
-        state.updater_task.cancel()
-        state.updater_task = None
+    cancel_music_prefetch(state)
+    state.panel_refresh_active = False
 
 
 def reset_music_idle_state(state: GuildMusicState) -> None:
@@ -41,6 +42,8 @@ def reset_music_idle_state(state: GuildMusicState) -> None:
     state.is_loop = False
     state.is_skipping = False
     state.is_stopping = False
+    state.panel_refresh_active = False
+    cancel_music_prefetch(state)
 
 
 def start_music_playback_state(
@@ -61,7 +64,6 @@ def finish_music_track_state(
     *,
     ended_at: float,
 ) -> None:
-    if state.updater_task:
-        state.updater_task.cancel()
+    state.panel_refresh_active = False
     state.paused_at = None
     state.start_ts = ended_at
@@ -0,0 +1 @@
+"""Scheduled message helper package."""
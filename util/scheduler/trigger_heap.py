@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections.abc import Callable, Iterable
+from datetime import datetime, tzinfo
+
+
+class ScheduledTriggerHeap:
+    """다가오는 예약 시각을 최소 힙으로 들고 있다가 가장 이른 시각까지만 잠든다.
+
+    DB 행이 기준이고 힙은 언제 깨어날지만 정하므로, 이미 지워진 예약이 남아
+    있어도 깨어나서 조회 결과가 비어 있을 뿐이다.
+    """
+
+    def __init__(
+        self,
+        *,
+        timezone: tzinfo,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._timezone = timezone
+        self._clock = clock or (lambda: datetime.now(timezone))
+        self._heap: list[tuple[datetime, str]] = []
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, schedule_id: str, trigger_time: datetime) -> None:
+        heapq.heappush(self._heap, (self._aware(trigger_time), str(schedule_id)))
+        self._changed.set()
+
+    def replace(self, entries: Iterable[tuple[str, datetime]]) -> None:
+        self._heap = [
+            (self._aware(trigger_time), str(schedule_id))
+            for schedule_id, trigger_time in entries
+        ]
+        heapq.heapify(self._heap)
+        self._changed.set()
+
+    def next_time(self) -> datetime | None:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: datetime | None = None) -> list[str]:
+        current = self._aware(now or self._clock())
+        due: list[str] = []
+        while self._heap and self._heap[0][0] <= current:
+            due.append(heapq.heappop(self._heap)[1])
+        return due
+
+    async def wait(self, *, max_seconds: float) -> bool:
+        """다음 예약 시각이나 최대 대기 시간까지 잠든다. 힙이 바뀌면 바로 깨어난다.
+
+        가장 이른 예약이 지났으면 True를 돌려준다.
+        """
+        next_time = self.next_time()
+        if next_time is not None:
+            delay = (next_time - self._clock()).total_seconds()
+            if delay <= 0:
+                return True
+            max_seconds = min(max_seconds, delay)
+
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=max_seconds)
+        except asyncio.TimeoutError:
+            pass
+        next_time = self.next_time()
+        return next_time is not None and next_time <= self._clock()
+
+    def _aware(self, value: datetime) -> datetime:
+        # DB DATETIME 값은 시간대 없이 서울 시각으로 저장된다
+        if value.tzinfo is None:
+            return value.replace(tzinfo=self._timezone)
+        return value.astimezone(self._timezone)
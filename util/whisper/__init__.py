@@ -0,0 +1 @@
+"""Whisper 음성 인식 모델 공유 패키지."""
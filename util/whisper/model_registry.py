@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from faster_whisper import WhisperModel
+
+
+logger = logging.getLogger(__name__)
+
+# 마지막 사용자가 반납한 뒤 이 시간 동안 다시 쓰이지 않으면 모델을 내려 메모리를 돌려준다
+WHISPER_IDLE_UNLOAD_SECONDS = 600.0
+
+ModelFactory = Callable[..., object]
+
+
+class WhisperModelSpec(NamedTuple):
+    model: str
+    device: str
+    compute_type: str
+
+
+@dataclass(slots=True)
+class _LoadedModel:
+    model: object
+    options: dict[str, object]
+    refs: int = 0
+    unload_handle: asyncio.TimerHandle | None = None
+
+
+class WhisperModelRegistry:
+    """프로세스 전체가 같은 Whisper 모델을 나눠 쓰도록 참조 수로 관리한다.
+
+    모델은 처음 빌릴 때 스레드에서 한 번만 읽고, 참조가 0이 된 뒤 유휴 시간이
+    지나면 내린다. 같은 spec을 빌리는 기능은 같은 로드 옵션을 넘겨야 하며, 이미
+    올라간 모델과 옵션이 다르면 경고만 남기고 올라간 모델을 그대로 준다.
+    """
+
+    def __init__(
+        self,
+        *,
+        factory: ModelFactory = WhisperModel,
+        idle_seconds: float = WHISPER_IDLE_UNLOAD_SECONDS,
+    ) -> None:
+        self._factory = factory
+        self._idle_seconds = idle_seconds
+        self._models: dict[WhisperModelSpec, _LoadedModel] = {}
+        self._load_locks: dict[WhisperModelSpec, asyncio.Lock] = {}
+
+    def is_loaded(self, spec: WhisperModelSpec) -> bool:
+        return spec in self._models
+
+    def ref_count(self, spec: WhisperModelSpec) -> int:
+        entry = self._models.get(spec)
+        return entry.refs if entry else 0
+
+    async def acquire(self, spec: WhisperModelSpec, **options: object) -> object:
+        """모델을 빌린다. 다 쓰면 같은 spec으로 ``release``를 호출해야 한다."""
+        entry = self._models.get(spec)
+        if entry is None:
+            lock = self._load_locks.setdefault(spec, asyncio.Lock())
+            async with lock:
+                entry = self._models.get(spec)
+                if entry is None:
+                    model = await asyncio.to_thread(
+                        self._factory,
+                        spec.model,
+                        device=spec.device,
+                        compute_type=spec.compute_type,
+                        **options,
+                    )
+                    entry = _LoadedModel(model, dict(options))
+                    self._models[spec] = entry
+                    logger.info(
+                        "Whisper 모델 로드: model=%s device=%s compute_type=%s",
+                        spec.model,
+                        spec.device,
+                        spec.compute_type,
+                    )
+
+                    entry.refs += 1
+                    self._cancel_unload(entry)
+                    return entry.model
+
+        if entry.options != options:
+            logger.warning(
+                "이미 올라간 Whisper 모델과 로드 옵션이 다릅니다: model=%s "
+                "loaded=%s requested=%s",
+                spec.model,
+                entry.options,
+                options,
+            )
+        entry.refs += 1
+        self._cancel_unload(entry)
+        return entry.model
+
+    def _cancel_unload(self, entry: _LoadedModel) -> None:
+        if entry.unload_handle is not None:
+            entry.unload_handle.cancel()
+            entry.unload_handle = None
+
+    def release(self, spec: WhisperModelSpec) -> None:
+        entry = self._models.get(spec)
+        if entry is None or entry.refs == 0:
+            logger.warning("빌리지 않은 Whisper 모델 반납: model=%s", spec.model)
+            return
+        entry.refs -= 1
+        if entry.refs == 0:
+            entry.unload_handle = asyncio.get_running_loop().call_later(
+                self._idle_seconds,
+                self._unload_if_idle,
+                spec,
+            )
+
+    @asynccontextmanager
+    async def lease(
+        self,
+        spec: WhisperModelSpec,
+        **options: object,
+    ) -> AsyncIterator[object]:
+        model = await self.acquire(spec, **options)
+        try:
+            yield model
+        finally:
+            self.release(spec)
+
+    def close(self) -> None:
+        for entry in self._models.values():
+            if entry.unload_handle is not None:
+                entry.unload_handle.cancel()
+        self._models.clear()
+
+    def _unload_if_idle(self, spec: WhisperModelSpec) -> None:
+        entry = self._models.get(spec)
+        if entry is None or entry.refs:
+            return
+        # 참조를 끊으면 CTranslate2가 가중치 메모리를 해제한다
+        del self._models[spec]
+        logger.info(
+            "유휴 Whisper 모델 해제: model=%s device=%s",
+            spec.model,
+            spec.device,
+        )
+
+
+_default_registry: WhisperModelRegistry | None = None
+
+
+def get_whisper_model_registry() -> WhisperModelRegistry:
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = WhisperModelRegistry()
+    return _default_registry
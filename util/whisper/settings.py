@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Mapping
+
+from util.whisper.model_registry import WhisperModelSpec
+
+
+CPU_WHISPER_MODEL = "tiny"
+CPU_WHISPER_COMPUTE_TYPE = "int8"
+CUDA_WHISPER_MODEL = "deepdml/faster-whisper-large-v3-turbo-ct2"
+CUDA_WHISPER_COMPUTE_TYPE = "float16"
+SUPPORTED_WHISPER_DEVICES = frozenset({"cpu", "cuda"})
+# 동시에 전사할 작업자 수. 모델 하나를 공유하며 CTranslate2 num_workers와 맞춘다
+DEFAULT_WHISPER_WORKERS = 2
+MAX_WHISPER_WORKERS = 8
+# 작업자 하나가 쓸 CTranslate2 스레드 상한. 지정하지 않았을 때의 기본값(4)과 같다
+MAX_WHISPER_CPU_THREADS = 4
+
+
+@dataclass(frozen=True)
+class WhisperSettings:
+    model: str
+    device: str
+    compute_type: str
+    workers: int = 1
+
+    @property
+    def spec(self) -> WhisperModelSpec:
+        return WhisperModelSpec(self.model, self.device, self.compute_type)
+
+
+def resolve_whisper_settings(
+    environ: Mapping[str, str] | None = None,
+) -> WhisperSettings:
+    """Resolve voice STT settings with a lightweight CPU-safe default."""
+    source = os.environ if environ is None else environ
+    device = source.get("VOICE_CHAT_WHISPER_DEVICE", "cpu").strip().lower()
+    if device not in SUPPORTED_WHISPER_DEVICES:
+        device = "cpu"
+
+    default_model = CPU_WHISPER_MODEL if device == "cpu" else CUDA_WHISPER_MODEL
+    default_compute_type = (
+        CPU_WHISPER_COMPUTE_TYPE
+        if device == "cpu"
+        else CUDA_WHISPER_COMPUTE_TYPE
+    )
+    model = source.get("VOICE_CHAT_WHISPER_MODEL", "").strip() or default_model
+    compute_type = (
+        source.get("VOICE_CHAT_WHISPER_COMPUTE_TYPE", "").strip()
+        or default_compute_type
+    )
+    return WhisperSettings(
+        model=model,
+        device=device,
+        compute_type=compute_type,
+        workers=_resolve_workers(source.get("VOICE_CHAT_WHISPER_WORKERS", "")),
+    )
+
+
+def _resolve_workers(raw_value: str) -> int:
+    try:
+        workers = int(raw_value.strip())
+    except ValueError:
+        return DEFAULT_WHISPER_WORKERS
+    return min(max(workers, 1), MAX_WHISPER_WORKERS)
+
+
+def whisper_model_options(settings: WhisperSettings) -> dict[str, int]:
+    """Return WhisperModel options that let ``workers`` threads transcribe at once."""
+    options = {"num_workers": settings.workers}
+    if settings.device == "cpu":
+        # 작업자끼리 코어를 나눠 써서 동시에 돌 때 스레드가 넘치지 않게 한다
+        options["cpu_threads"] = min(
+            MAX_WHISPER_CPU_THREADS,
+            max(1, _available_cpu_count() // settings.workers),
+        )
+    return options
+
+
+def _available_cpu_count() -> int:
+    # 호스트 전체 코어가 아니라 이 프로세스가 실제로 쓸 수 있는 코어 수를 센다
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def cpu_fallback_settings(workers: int = 1) -> WhisperSettings:
+    return WhisperSettings(
+        model=CPU_WHISPER_MODEL,
+        device="cpu",
+        compute_type=CPU_WHISPER_COMPUTE_TYPE,
+        workers=workers,
+    )
@@ -50,17 +50,47 @@ async def poll_youtube_community_posts(
     ),
     log_warning: LogWarning = logger.warning,
 ) -> YouTubeSubscription:
-    if not subscription.community_alert_enabled:
-        return subscription
+    updated = await poll_youtube_channel_community_posts(
+        bot,
+        [subscription],
+        fetch_posts=fetch_posts,
+        process_notifications=process_notifications,
+        log_warning=log_warning,
+    )
+    return updated[0]
+
+
+async def poll_youtube_channel_community_posts(
+    bot,
+    subscriptions: Sequence[YouTubeSubscription],
+    *,
+    fetch_posts: FetchCommunityPosts = fetch_latest_youtube_community_posts,
+    process_notifications: ProcessCommunityNotifications = (
+        process_youtube_community_notifications
+    ),
+    log_warning: LogWarning = logger.warning,
+) -> list[YouTubeSubscription]:
+    """같은 채널 구독들의 커뮤니티 페이지를 한 번만 받아 구독마다 알림을 처리한다."""
+    enabled = [
+        subscription
+        for subscription in subscriptions
+        if subscription.community_alert_enabled
+    ]
+    if not enabled:
+        return list(subscriptions)
 
+    channel_id = enabled[0].channel_id
     try:
-        posts = await fetch_posts(subscription.channel_id, limit=10)
+        posts = await fetch_posts(channel_id, limit=10)
     except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
         log_warning(
             "YouTube 커뮤니티 게시물 조회 실패: channel=%s",
-            subscription.channel_id,
+            channel_id,
             exc_info=True,
         )
-        return subscription
+        return list(subscriptions)
 
-    return await process_notifications(bot, subscription, posts)
+    updated = {subscription.id: subscription for subscription in subscriptions}
+    for subscription in enabled:
+        updated[subscription.id] = await process_notifications(bot, subscription, posts)
+    return [updated[subscription.id] for subscription in subscriptions]
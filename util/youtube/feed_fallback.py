@@ -2,18 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 
 import aiohttp
 
-from util.youtube.subscriptions import (
-    YouTubeSubscription,
-    get_youtube_subscription,
-)
+from common.http import EXTERNAL_HTTP_TIMEOUT
+from util.youtube.subscriptions import YouTubeSubscription
+from util.youtube.video_candidate_runner import YouTubeVideoCandidateResult
 from util.youtube.websub import (
     YouTubeAtomEntry,
+    YouTubeVideoLiveStatus,
     build_youtube_feed_topic_url,
     parse_youtube_atom_entries,
     should_process_youtube_feed_update,
@@ -22,19 +22,51 @@ from util.youtube.websub import (
 
 logger = logging.getLogger(__name__)
 
-ProcessVideoCandidate = Callable[[YouTubeSubscription, str], Awaitable[str]]
-FetchFeedEntries = Callable[
-    [aiohttp.ClientSession, YouTubeSubscription],
-    Awaitable[list[YouTubeAtomEntry]],
+ResolveVideoCandidate = Callable[..., Awaitable[YouTubeVideoCandidateResult]]
+FetchVideoStatuses = Callable[
+    [Sequence[str]],
+    Awaitable[Mapping[str, YouTubeVideoLiveStatus]],
 ]
-GetSubscription = Callable[[int], Awaitable[YouTubeSubscription | None]]
+FetchFeedEntries = Callable[..., Awaitable[list[YouTubeAtomEntry]]]
 LogMessage = Callable[[str], None]
 
+# 피드 확인 주기(60초 루프)보다 길게 잡아 다음 확인 때 연결을 재사용한다
+YOUTUBE_FEED_KEEPALIVE_SECONDS = 90
+YOUTUBE_FEED_CONNECTION_LIMIT = 8
+
+
+@dataclass(slots=True)
+class YouTubeFeedValidators:
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def request_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
 
 @dataclass(slots=True)
 class YouTubeFeedFallbackState:
     checked_at: dict[int, datetime] = field(default_factory=dict)
     seen_updates: dict[int, dict[str, str]] = field(default_factory=dict)
+    # 채널 id별 마지막 응답의 ETag/Last-Modified
+    validators: dict[str, YouTubeFeedValidators] = field(default_factory=dict)
+
+
+def create_youtube_feed_session() -> aiohttp.ClientSession:
+    """모든 채널 피드 조회가 함께 쓰는 keep-alive 세션을 만든다."""
+    return aiohttp.ClientSession(
+        timeout=EXTERNAL_HTTP_TIMEOUT,
+        trust_env=False,
+        connector=aiohttp.TCPConnector(
+            limit=YOUTUBE_FEED_CONNECTION_LIMIT,
+            keepalive_timeout=YOUTUBE_FEED_KEEPALIVE_SECONDS,
+        ),
+    )
 
 
 def should_poll_youtube_feed(
@@ -87,10 +119,16 @@ async def fetch_youtube_feed_entries(
     session: aiohttp.ClientSession,
     subscription: YouTubeSubscription,
     *,
+    validators: dict[str, YouTubeFeedValidators] | None = None,
     log: LogMessage = print,
 ) -> list[YouTubeAtomEntry]:
+    """채널 Atom 피드를 조회한다. 304 응답이면 파싱 없이 빈 목록을 돌려준다."""
     topic_url = build_youtube_feed_topic_url(subscription.channel_id)
-    async with session.get(topic_url) as response:
+    cached = validators.get(subscription.channel_id) if validators is not None else None
+    headers = cached.request_headers() if cached else None
+    async with session.get(topic_url, headers=headers) as response:
+        if response.status == 304:
+            return []
         if response.status < 200 or response.status >= 300:
             body = await response.text()
             log(
@@ -100,58 +138,154 @@ async def fetch_youtube_feed_entries(
             )
             return []
         atom_xml = await response.text()
-    return parse_youtube_atom_entries(atom_xml)
+        response_headers = response.headers
 
+    entries = parse_youtube_atom_entries(atom_xml)
+    # 파싱까지 성공한 응답의 검증자만 저장해야 다음 조회에서 304로 건너뛰어도 안전하다
+    if validators is not None:
+        _remember_feed_validators(validators, subscription.channel_id, response_headers)
+    return entries
 
-async def poll_youtube_feed_fallback(
-    process_video_candidate: ProcessVideoCandidate,
+
+def _remember_feed_validators(
+    validators: dict[str, YouTubeFeedValidators],
+    channel_id: str,
+    headers: Mapping[str, str],
+) -> None:
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if etag or last_modified:
+        validators[channel_id] = YouTubeFeedValidators(etag, last_modified)
+    else:
+        validators.pop(channel_id, None)
+
+
+async def poll_youtube_channel_feed_fallback(
+    resolve_video_candidate: ResolveVideoCandidate,
     state: YouTubeFeedFallbackState,
-    subscription: YouTubeSubscription,
+    subscriptions: Sequence[YouTubeSubscription],
     session: aiohttp.ClientSession,
     *,
     fetch_entries: FetchFeedEntries = fetch_youtube_feed_entries,
-    get_subscription: GetSubscription = get_youtube_subscription,
+    fetch_video_statuses: FetchVideoStatuses | None = None,
     now: datetime | None = None,
     interval_seconds: int = 300,
     max_entries: int = 5,
-) -> YouTubeSubscription | None:
-    if not should_poll_youtube_feed(
-        state,
-        subscription.id,
-        now=now,
-        interval_seconds=interval_seconds,
-    ):
-        return subscription
+) -> list[YouTubeSubscription]:
+    """같은 채널을 구독한 길드들의 피드를 한 번만 받아 구독마다 처리한다."""
+    if not subscriptions:
+        return []
+
+    # 검증자는 채널 단위라 구독마다 따로 확인하면 먼저 받은 구독이 304를 만들어
+    # 다른 구독이 새 항목을 놓친다. 하나라도 확인할 때가 되면 모두 같이 확인한다
+    due_flags = [
+        should_poll_youtube_feed(
+            state,
+            subscription.id,
+            now=now,
+            interval_seconds=interval_seconds,
+        )
+        for subscription in subscriptions
+    ]
+    if not any(due_flags):
+        return list(subscriptions)
+    checked_at = _current_utc(now)
+    for subscription in subscriptions:
+        state.checked_at[subscription.id] = checked_at
+    due = list(subscriptions)
+
+    channel_id = due[0].channel_id
+    # 처음 확인하는 구독이 있으면 304로 기존 항목을 놓치지 않도록 전체 피드를 받는다
+    if any(subscription.id not in state.seen_updates for subscription in due):
+        state.validators.pop(channel_id, None)
 
     try:
-        entries = await fetch_entries(session, subscription)
+        entries = await fetch_entries(
+            session,
+            due[0],
+            validators=state.validators,
+        )
     except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
         logger.warning(
             "YouTube Atom feed 처리 오류: channel=%s",
-            subscription.channel_id,
+            channel_id,
             exc_info=True,
         )
-        return subscription
+        return list(subscriptions)
 
-    for entry in entries[:max_entries]:
-        if entry.channel_id != subscription.channel_id:
-            continue
+    updated = {subscription.id: subscription for subscription in subscriptions}
+    try:
+        plans = [
+            (
+                subscription,
+                _feed_entries_to_process(state, subscription, entries[:max_entries]),
+            )
+            for subscription in due
+        ]
+        known_statuses = None
+        video_ids = list(
+            dict.fromkeys(entry.video_id for _, planned in plans for entry in planned)
+        )
+        if fetch_video_statuses is not None and video_ids:
+            # 여러 길드가 같은 영상을 확인해도 videos.list는 채널당 한 번만 호출한다
+            known_statuses = await fetch_video_statuses(video_ids)
+
+        for subscription, planned in plans:
+            updated[subscription.id] = await _process_feed_entries(
+                resolve_video_candidate,
+                state,
+                subscription,
+                planned,
+                known_statuses=known_statuses,
+            )
+    except Exception:
+        # 처리 도중 실패하면 다음 확인에서 304 대신 전체 피드를 다시 받도록 검증자를 지운다
+        state.validators.pop(channel_id, None)
+        logger.debug("YouTube Atom feed 검증자 초기화: channel=%s", channel_id)
+        raise
+
+    return [updated[subscription.id] for subscription in subscriptions]
+
+
+def _feed_entries_to_process(
+    state: YouTubeFeedFallbackState,
+    subscription: YouTubeSubscription,
+    entries: Sequence[YouTubeAtomEntry],
+) -> list[YouTubeAtomEntry]:
+    state.seen_updates.setdefault(subscription.id, {})
+    return [
+        entry
+        for entry in entries
+        if entry.channel_id == subscription.channel_id
+        and should_process_youtube_feed_entry(state, subscription, entry)
+    ]
 
+
+async def _process_feed_entries(
+    resolve_video_candidate: ResolveVideoCandidate,
+    state: YouTubeFeedFallbackState,
+    subscription: YouTubeSubscription,
+    entries: Sequence[YouTubeAtomEntry],
+    *,
+    known_statuses: Mapping[str, YouTubeVideoLiveStatus] | None,
+) -> YouTubeSubscription:
+    for entry in entries:
+        # 앞선 후보 처리로 알림 완료된 영상은 다시 보내지 않는다
         if not should_process_youtube_feed_entry(state, subscription, entry):
             continue
 
-        await process_video_candidate(subscription, entry.video_id)
+        result = await resolve_video_candidate(
+            subscription,
+            entry.video_id,
+            known_statuses=known_statuses,
+        )
         remember_youtube_feed_entry_seen(
             state,
             subscription.id,
             entry.video_id,
             entry.updated or entry.published,
         )
-        refreshed = await get_subscription(subscription.id)
-        if refreshed is None:
-            return None
-        subscription = refreshed
-
+        subscription = result.subscription
     return subscription
 
 
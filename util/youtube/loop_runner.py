@@ -1,26 +1,38 @@
 from __future__ import annotations
 
-from typing import Protocol
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
+from typing import Any, Protocol
 
 import aiohttp
+from googleapiclient.errors import HttpError
 
-from common.http import EXTERNAL_HTTP_TIMEOUT
 from util.youtube.notification_state import touch_pending_youtube_video_check
 from util.youtube.subscriptions import (
     YouTubeSubscription,
-    get_youtube_subscription,
     list_all_youtube_subscriptions,
 )
+from util.youtube.video_candidate_runner import YouTubeVideoCandidateResult
+from util.youtube.websub import YouTubeVideoLiveStatus
+
+
+logger = logging.getLogger(__name__)
+
+# 동시에 처리할 채널 수. 한 채널의 구독들은 항상 같은 작업에서 순서대로 처리된다
+YOUTUBE_NOTIFICATION_CONCURRENCY = 4
 
 
 class YouTubeNotificationOwner(Protocol):
     async def _delete_legacy_youtube_live_checker_setting_once(self) -> None: ...
 
-    async def _poll_youtube_feed_fallback(
+    def _get_youtube_feed_session(self) -> aiohttp.ClientSession: ...
+
+    async def _poll_youtube_channel_feed_fallback(
         self,
-        subscription: YouTubeSubscription,
+        subscriptions: Sequence[YouTubeSubscription],
         session: aiohttp.ClientSession,
-    ) -> YouTubeSubscription | None: ...
+    ) -> list[YouTubeSubscription]: ...
 
     async def _remove_pending_youtube_video(
         self,
@@ -30,69 +42,173 @@ class YouTubeNotificationOwner(Protocol):
 
     def _should_check_pending_youtube_video(self, pending_entry: dict) -> bool: ...
 
-    async def _process_youtube_video_candidate(
+    async def _fetch_youtube_video_statuses(
+        self,
+        video_ids: Iterable[str],
+    ) -> Mapping[str, YouTubeVideoLiveStatus]: ...
+
+    async def _resolve_youtube_video_candidate(
         self,
         subscription: YouTubeSubscription,
         video_id: str,
-    ) -> str: ...
+        *,
+        known_statuses: Mapping[str, YouTubeVideoLiveStatus] | None = None,
+    ) -> YouTubeVideoCandidateResult: ...
 
 
 class YouTubeCommunityOwner(Protocol):
-    async def _poll_youtube_community_posts(
+    async def _poll_youtube_channel_community_posts(
         self,
-        subscription: YouTubeSubscription,
-    ) -> YouTubeSubscription: ...
+        subscriptions: Sequence[YouTubeSubscription],
+    ) -> list[YouTubeSubscription]: ...
 
 
-async def run_youtube_notification_candidates(owner: YouTubeNotificationOwner) -> None:
-    await owner._delete_legacy_youtube_live_checker_setting_once()
-    subscriptions = await list_all_youtube_subscriptions()
-    async with aiohttp.ClientSession(
-        timeout=EXTERNAL_HTTP_TIMEOUT,
-        trust_env=False,
-    ) as session:
-        for subscription in subscriptions:
-            subscription = await owner._poll_youtube_feed_fallback(
+DuePendingVideos = list[tuple[YouTubeSubscription, list[str]]]
+
+
+def group_subscriptions_by_channel(
+    subscriptions: Iterable[YouTubeSubscription],
+) -> dict[str, list[YouTubeSubscription]]:
+    groups: dict[str, list[YouTubeSubscription]] = {}
+    for subscription in subscriptions:
+        groups.setdefault(subscription.channel_id, []).append(subscription)
+    return groups
+
+
+async def _run_per_channel(
+    work: Mapping[str, Any],
+    handle: Callable[[Any], Awaitable[Any]],
+    *,
+    concurrency: int,
+    label: str,
+) -> dict[str, Any]:
+    """채널마다 작업 하나를 만들어 동시에 concurrency개까지 돌린다.
+
+    한 채널의 구독들은 같은 작업 안에서 순서대로 처리되어 상태 갱신이 겹치지 않고,
+    느린 채널 하나가 다른 채널의 알림을 막지 않는다. 실패한 채널은 결과에서 빠진다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    results: dict[str, Any] = {}
+
+    async def _run(channel_id: str, item: Any) -> None:
+        async with semaphore:
+            try:
+                results[channel_id] = await handle(item)
+            except Exception:
+                logger.exception("%s 처리 오류: channel=%s", label, channel_id)
+
+    await asyncio.gather(*(_run(channel_id, item) for channel_id, item in work.items()))
+    return results
+
+
+async def _collect_due_pending_videos(
+    owner: YouTubeNotificationOwner,
+    subscription: YouTubeSubscription,
+) -> tuple[YouTubeSubscription, list[str]]:
+    """확인할 시점이 된 대기 영상을 고르고, 조회 전에 확인 시각을 먼저 기록한다."""
+    due: list[str] = []
+    for video_id, pending_entry in list(subscription.pending_videos.items()):
+        if not isinstance(pending_entry, dict):
+            subscription = await owner._remove_pending_youtube_video(
                 subscription,
-                session,
+                str(video_id),
             )
-            if subscription is None:
-                continue
-
-            pending = dict(subscription.pending_videos)
-            if not pending:
+            continue
+        if not owner._should_check_pending_youtube_video(pending_entry):
+            continue
+        subscription = await touch_pending_youtube_video_check(
+            subscription,
+            str(video_id),
+            pending_entry,
+        )
+        due.append(str(video_id))
+    return subscription, due
+
+
+async def run_youtube_notification_candidates(
+    owner: YouTubeNotificationOwner,
+    *,
+    concurrency: int = YOUTUBE_NOTIFICATION_CONCURRENCY,
+) -> None:
+    await owner._delete_legacy_youtube_live_checker_setting_once()
+    groups = group_subscriptions_by_channel(await list_all_youtube_subscriptions())
+    if not groups:
+        return
+
+    # 피드 세션은 루프 주기를 넘어 유지되어 채널 간·주기 간 연결을 재사용한다
+    session = owner._get_youtube_feed_session()
+
+    async def _poll_channel(subscriptions: list[YouTubeSubscription]) -> DuePendingVideos:
+        subscriptions = await owner._poll_youtube_channel_feed_fallback(
+            subscriptions,
+            session,
+        )
+        due_subscriptions: DuePendingVideos = []
+        for subscription in subscriptions:
+            if not subscription.pending_videos:
                 continue
-
-            for video_id, pending_entry in list(pending.items()):
-                if not isinstance(pending_entry, dict):
-                    subscription = await owner._remove_pending_youtube_video(
-                        subscription,
-                        str(video_id),
-                    )
-                    pending = dict(subscription.pending_videos)
+            subscription, due = await _collect_due_pending_videos(owner, subscription)
+            if due:
+                due_subscriptions.append((subscription, due))
+        return due_subscriptions
+
+    collected = await _run_per_channel(
+        groups,
+        _poll_channel,
+        concurrency=concurrency,
+        label="YouTube 알림 후보 수집",
+    )
+    due_by_channel = {channel_id: due for channel_id, due in collected.items() if due}
+    if not due_by_channel:
+        return
+
+    # 모든 채널의 확인 대상 영상을 모아 videos.list 호출 한 번(50개 단위)으로 조회한다
+    video_ids = [
+        video_id
+        for due_subscriptions in due_by_channel.values()
+        for _, due in due_subscriptions
+        for video_id in due
+    ]
+    try:
+        statuses = await owner._fetch_youtube_video_statuses(video_ids)
+    except HttpError:
+        logger.exception("YouTube videos.list 일괄 조회 에러: video_count=%s", len(video_ids))
+        return
+
+    async def _resolve_channel(due_subscriptions: DuePendingVideos) -> None:
+        for subscription, due in due_subscriptions:
+            for video_id in due:
+                if video_id not in subscription.pending_videos:
                     continue
-                if not owner._should_check_pending_youtube_video(pending_entry):
-                    continue
-
-                subscription = await touch_pending_youtube_video_check(
-                    subscription,
-                    str(video_id),
-                    pending_entry,
-                )
-                await owner._process_youtube_video_candidate(
+                result = await owner._resolve_youtube_video_candidate(
                     subscription,
-                    str(video_id),
+                    video_id,
+                    known_statuses=statuses,
                 )
-                refreshed = await get_youtube_subscription(subscription.id)
-                if refreshed is None:
-                    break
-                subscription = refreshed
-                pending = dict(subscription.pending_videos)
+                subscription = result.subscription
 
+    await _run_per_channel(
+        due_by_channel,
+        _resolve_channel,
+        concurrency=concurrency,
+        label="YouTube 알림 후보 처리",
+    )
 
-async def run_youtube_community_posts(owner: YouTubeCommunityOwner) -> None:
+
+async def run_youtube_community_posts(
+    owner: YouTubeCommunityOwner,
+    *,
+    concurrency: int = YOUTUBE_NOTIFICATION_CONCURRENCY,
+) -> None:
     subscriptions = await list_all_youtube_subscriptions()
-    for subscription in subscriptions:
-        if not subscription.community_alert_enabled:
-            continue
-        await owner._poll_youtube_community_posts(subscription)
+    groups = group_subscriptions_by_channel(
+        subscription
+        for subscription in subscriptions
+        if subscription.community_alert_enabled
+    )
+    await _run_per_channel(
+        groups,
+        owner._poll_youtube_channel_community_posts,
+        concurrency=concurrency,
+        label="YouTube 커뮤니티 알림",
+    )
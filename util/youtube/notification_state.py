@@ -8,8 +8,11 @@ from typing import Any
 
 from util.youtube.subscriptions import (
     YouTubeSubscription,
-    update_youtube_subscription_state,
-    update_youtube_upload_notification_state,
+    append_youtube_notified_upload_video_id,
+    append_youtube_notified_video_id,
+    remove_youtube_pending_video,
+    set_youtube_pending_video,
+    set_youtube_pending_video_checked_at,
 )
 from util.youtube.websub import YouTubeVideoLiveStatus
 
@@ -19,8 +22,11 @@ DEFAULT_PENDING_EARLY_WINDOW = timedelta(minutes=15)
 DEFAULT_PENDING_EXPIRE_WINDOW = timedelta(hours=24)
 DEFAULT_NOTIFIED_ID_LIMIT = 30
 
-UpdateSubscriptionState = Callable[..., Awaitable[None]]
-UpdateUploadNotificationState = Callable[..., Awaitable[None]]
+# 상태 저장은 바뀐 항목만 JSON_SET/JSON_REMOVE/JSON_ARRAY_APPEND로 갱신한다
+AppendNotifiedId = Callable[..., Awaitable[None]]
+StorePendingVideo = Callable[[int, str, Mapping[str, Any]], Awaitable[None]]
+StorePendingCheck = Callable[[int, str, str], Awaitable[None]]
+RemovePendingVideo = Callable[[int, str], Awaitable[None]]
 
 
 def notified_id_set(values: Iterable[object] | None) -> set[str]:
@@ -74,15 +80,12 @@ async def mark_youtube_video_notified(
     subscription: YouTubeSubscription,
     video_id: str,
     *,
-    update_state: UpdateSubscriptionState = update_youtube_subscription_state,
+    limit: int = DEFAULT_NOTIFIED_ID_LIMIT,
+    append_notified: AppendNotifiedId = append_youtube_notified_video_id,
 ) -> YouTubeSubscription:
-    notified_ids = append_recent_id(subscription.notified_video_ids, video_id)
+    notified_ids = append_recent_id(subscription.notified_video_ids, video_id, limit=limit)
     pending = remove_pending_video(subscription.pending_videos, video_id)
-    await update_state(
-        subscription.id,
-        pending_videos=pending,
-        notified_video_ids=notified_ids,
-    )
+    await append_notified(subscription.id, video_id, limit=limit)
     return replace(
         subscription,
         pending_videos=pending,
@@ -94,15 +97,15 @@ async def mark_youtube_upload_video_notified(
     subscription: YouTubeSubscription,
     video_id: str,
     *,
-    update_upload_state: UpdateUploadNotificationState = (
-        update_youtube_upload_notification_state
-    ),
+    limit: int = DEFAULT_NOTIFIED_ID_LIMIT,
+    append_notified: AppendNotifiedId = append_youtube_notified_upload_video_id,
 ) -> YouTubeSubscription:
-    notified_ids = append_recent_id(subscription.notified_upload_video_ids, video_id)
-    await update_upload_state(
-        subscription.id,
-        notified_upload_video_ids=notified_ids,
+    notified_ids = append_recent_id(
+        subscription.notified_upload_video_ids,
+        video_id,
+        limit=limit,
     )
+    await append_notified(subscription.id, video_id, limit=limit)
     return replace(subscription, notified_upload_video_ids=notified_ids)
 
 
@@ -111,15 +114,12 @@ async def remember_pending_youtube_video(
     status: YouTubeVideoLiveStatus,
     *,
     now: datetime | None = None,
-    update_state: UpdateSubscriptionState = update_youtube_subscription_state,
+    store_pending: StorePendingVideo = set_youtube_pending_video,
 ) -> YouTubeSubscription:
+    entry = build_pending_video_entry(status, now=now)
     pending = dict(subscription.pending_videos)
-    pending[status.video_id] = build_pending_video_entry(status, now=now)
-    await update_state(
-        subscription.id,
-        pending_videos=pending,
-        notified_video_ids=subscription.notified_video_ids,
-    )
+    pending[status.video_id] = entry
+    await store_pending(subscription.id, status.video_id, entry)
     return replace(subscription, pending_videos=pending)
 
 
@@ -127,14 +127,10 @@ async def remove_pending_youtube_video(
     subscription: YouTubeSubscription,
     video_id: str,
     *,
-    update_state: UpdateSubscriptionState = update_youtube_subscription_state,
+    remove_pending: RemovePendingVideo = remove_youtube_pending_video,
 ) -> YouTubeSubscription:
     pending = remove_pending_video(subscription.pending_videos, video_id)
-    await update_state(
-        subscription.id,
-        pending_videos=pending,
-        notified_video_ids=subscription.notified_video_ids,
-    )
+    await remove_pending(subscription.id, video_id)
     return replace(subscription, pending_videos=pending)
 
 
@@ -144,18 +140,15 @@ async def touch_pending_youtube_video_check(
     pending_entry: Mapping[str, Any],
     *,
     now: datetime | None = None,
-    update_state: UpdateSubscriptionState = update_youtube_subscription_state,
+    store_check: StorePendingCheck = set_youtube_pending_video_checked_at,
 ) -> YouTubeSubscription:
+    checked_at = _current_utc(now).isoformat()
     pending = dict(subscription.pending_videos)
     pending[str(video_id)] = {
         **dict(pending_entry),
-        "lastCheckedAt": _current_utc(now).isoformat(),
+        "lastCheckedAt": checked_at,
     }
-    await update_state(
-        subscription.id,
-        pending_videos=pending,
-        notified_video_ids=subscription.notified_video_ids,
-    )
+    await store_check(subscription.id, str(video_id), checked_at)
     return replace(subscription, pending_videos=pending)
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -198,47 +199,102 @@ async def delete_youtube_subscription(
     return subscription
 
 
-async def update_youtube_subscription_state(
+async def set_youtube_pending_video(
     subscription_id: int,
-    *,
-    pending_videos: dict[str, Any],
-    notified_video_ids: list[str],
+    video_id: str,
+    entry: Mapping[str, Any],
 ) -> None:
     query = """
         UPDATE youtube_subscriptions
-        SET pending_videos = %s,
-            notified_video_ids = %s
+        SET pending_videos = JSON_SET(
+            COALESCE(pending_videos, JSON_OBJECT()),
+            %s,
+            CAST(%s AS JSON)
+        )
         WHERE id = %s
     """
     await execute_query(
         query,
         (
-            json.dumps(pending_videos, ensure_ascii=False),
-            json.dumps(notified_video_ids, ensure_ascii=False),
+            _json_key_path(video_id),
+            json.dumps(dict(entry), ensure_ascii=False),
             int(subscription_id),
         ),
     )
 
 
-async def update_youtube_upload_notification_state(
+async def set_youtube_pending_video_checked_at(
     subscription_id: int,
-    *,
-    notified_upload_video_ids: list[str],
+    video_id: str,
+    checked_at: str,
 ) -> None:
+    # 대기 항목이 이미 지워졌다면 JSON_SET은 부모 경로가 없어 아무것도 만들지 않는다
     query = """
         UPDATE youtube_subscriptions
-        SET notified_upload_video_ids = %s
+        SET pending_videos = JSON_SET(pending_videos, %s, %s)
+        WHERE id = %s AND JSON_CONTAINS_PATH(pending_videos, 'one', %s)
+    """
+    path = _json_key_path(video_id)
+    await execute_query(
+        query,
+        (f"{path}.lastCheckedAt", checked_at, int(subscription_id), path),
+    )
+
+
+async def remove_youtube_pending_video(subscription_id: int, video_id: str) -> None:
+    query = """
+        UPDATE youtube_subscriptions
+        SET pending_videos = JSON_REMOVE(pending_videos, %s)
+        WHERE id = %s AND JSON_CONTAINS_PATH(pending_videos, 'one', %s)
+    """
+    path = _json_key_path(video_id)
+    await execute_query(query, (path, int(subscription_id), path))
+
+
+async def append_youtube_notified_video_id(
+    subscription_id: int,
+    video_id: str,
+    *,
+    limit: int,
+) -> None:
+    """라이브 알림 완료 id를 덧붙이고 같은 영상의 대기 항목을 한 번에 지운다."""
+    query = f"""
+        UPDATE youtube_subscriptions
+        SET notified_video_ids = {_append_recent_json_id_sql("notified_video_ids")},
+            pending_videos = JSON_REMOVE(
+                COALESCE(pending_videos, JSON_OBJECT()),
+                %s
+            )
         WHERE id = %s
     """
     await execute_query(
         query,
         (
-            json.dumps(notified_upload_video_ids, ensure_ascii=False),
+            *_append_recent_json_id_args(video_id, limit),
+            _json_key_path(video_id),
             int(subscription_id),
         ),
     )
 
 
+async def append_youtube_notified_upload_video_id(
+    subscription_id: int,
+    video_id: str,
+    *,
+    limit: int,
+) -> None:
+    column = "notified_upload_video_ids"
+    query = f"""
+        UPDATE youtube_subscriptions
+        SET {column} = {_append_recent_json_id_sql(column)}
+        WHERE id = %s
+    """
+    await execute_query(
+        query,
+        (*_append_recent_json_id_args(video_id, limit), int(subscription_id)),
+    )
+
+
 async def update_youtube_community_notification_state(
     subscription_id: int,
     *,
@@ -380,6 +436,28 @@ def _parse_db_datetime(value: str | None) -> datetime | None:
     return parsed
 
 
+def _json_key_path(key: str) -> str:
+    return "$." + json.dumps(str(key), ensure_ascii=False)
+
+
+def _append_recent_json_id_sql(column: str) -> str:
+    """이미 있으면 그대로 두고, 가득 찼으면 가장 오래된 id를 밀어내며 덧붙인다."""
+    current = f"COALESCE({column}, JSON_ARRAY())"
+    return f"""IF(
+            JSON_CONTAINS({current}, JSON_QUOTE(%s)),
+            {current},
+            IF(
+                JSON_LENGTH({current}) >= %s,
+                JSON_ARRAY_APPEND(JSON_REMOVE({current}, '$[0]'), '$', %s),
+                JSON_ARRAY_APPEND({current}, '$', %s)
+            )
+        )"""
+
+
+def _append_recent_json_id_args(item_id: str, limit: int) -> tuple[Any, ...]:
+    return (str(item_id), max(1, int(limit)), str(item_id), str(item_id))
+
+
 def _json_dict(value: Any) -> dict[str, Any]:
     if value is None:
         return {}
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
 from typing import Protocol
 
 from googleapiclient.errors import HttpError
@@ -66,67 +68,108 @@ class YouTubeVideoCandidateOwner(Protocol):
     ) -> YouTubeSubscription: ...
 
 
+@dataclass(frozen=True, slots=True)
+class YouTubeVideoCandidateResult:
+    outcome: str
+    subscription: YouTubeSubscription
+
+
 async def process_youtube_video_candidate(
     owner: YouTubeVideoCandidateOwner,
     subscription: YouTubeSubscription,
     video_id: str,
+    *,
+    known_statuses: Mapping[str, YouTubeVideoLiveStatus] | None = None,
 ) -> str:
-    try:
-        status = await owner._fetch_youtube_video_status(video_id)
-    except HttpError:
-        logger.exception("YouTube videos.list 에러: video_id=%s", video_id)
-        return "error"
+    """known_statuses가 있으면 일괄 조회 결과를 쓰고, 없으면 영상 하나를 조회한다."""
+    result = await resolve_youtube_video_candidate(
+        owner,
+        subscription,
+        video_id,
+        known_statuses=known_statuses,
+    )
+    return result.outcome
+
+
+async def resolve_youtube_video_candidate(
+    owner: YouTubeVideoCandidateOwner,
+    subscription: YouTubeSubscription,
+    video_id: str,
+    *,
+    known_statuses: Mapping[str, YouTubeVideoLiveStatus] | None = None,
+) -> YouTubeVideoCandidateResult:
+    """후보를 처리하고 갱신된 구독 상태를 함께 돌려줘 호출자가 DB를 다시 읽지 않게 한다."""
+    if known_statuses is not None:
+        status = known_statuses.get(video_id)
+    else:
+        try:
+            status = await owner._fetch_youtube_video_status(video_id)
+        except HttpError:
+            logger.exception("YouTube videos.list 에러: video_id=%s", video_id)
+            return YouTubeVideoCandidateResult("error", subscription)
+
+    def _result(outcome: str) -> YouTubeVideoCandidateResult:
+        return YouTubeVideoCandidateResult(outcome, subscription)
 
     if status is None:
-        await owner._remove_pending_youtube_video(subscription, video_id)
-        return "missing"
+        subscription = await owner._remove_pending_youtube_video(subscription, video_id)
+        return _result("missing")
 
     if status.channel_id and status.channel_id != subscription.channel_id:
-        await owner._remove_pending_youtube_video(subscription, video_id)
-        return "channel_mismatch"
+        subscription = await owner._remove_pending_youtube_video(subscription, video_id)
+        return _result("channel_mismatch")
 
     if status.status == YouTubeVideoStatus.LIVE:
         if not subscription.live_alert_enabled:
-            await owner._remove_pending_youtube_video(subscription, video_id)
-            return "live_disabled"
+            subscription = await owner._remove_pending_youtube_video(
+                subscription,
+                video_id,
+            )
+            return _result("live_disabled")
         if status.video_id in owner._get_notified_video_ids(subscription):
-            return "duplicate"
+            return _result("duplicate")
         sent = await owner._send_youtube_live_notification(subscription, status)
         if sent:
-            await owner._mark_youtube_video_notified(subscription, status.video_id)
-            return "notified"
-        await owner._remember_pending_youtube_video(subscription, status)
-        return "live_pending"
+            subscription = await owner._mark_youtube_video_notified(
+                subscription,
+                status.video_id,
+            )
+            return _result("notified")
+        subscription = await owner._remember_pending_youtube_video(subscription, status)
+        return _result("live_pending")
 
     if status.status == YouTubeVideoStatus.UPCOMING:
         if not subscription.live_alert_enabled:
-            await owner._remove_pending_youtube_video(subscription, video_id)
-            return "upcoming_disabled"
-        await owner._remember_pending_youtube_video(subscription, status)
-        return "upcoming"
+            subscription = await owner._remove_pending_youtube_video(
+                subscription,
+                video_id,
+            )
+            return _result("upcoming_disabled")
+        subscription = await owner._remember_pending_youtube_video(subscription, status)
+        return _result("upcoming")
 
     if status.status == YouTubeVideoStatus.UPLOAD:
-        await owner._remove_pending_youtube_video(subscription, video_id)
+        subscription = await owner._remove_pending_youtube_video(subscription, video_id)
         if status.video_id in owner._get_notified_upload_video_ids(subscription):
-            return "duplicate_upload"
+            return _result("duplicate_upload")
         if not should_send_youtube_upload_alert(
             upload_alert_enabled=subscription.upload_alert_enabled,
             upload_alert_enabled_at=subscription.upload_alert_enabled_at,
             published_at=status.published_at,
         ):
-            return "upload_disabled"
+            return _result("upload_disabled")
         sent = await owner._send_youtube_upload_notification(subscription, status)
         if sent:
-            await owner._mark_youtube_upload_video_notified(
+            subscription = await owner._mark_youtube_upload_video_notified(
                 subscription,
                 status.video_id,
             )
-            return "upload_notified"
-        return "upload_send_failed"
+            return _result("upload_notified")
+        return _result("upload_send_failed")
 
     if status.status == YouTubeVideoStatus.SHORTS:
-        await owner._remove_pending_youtube_video(subscription, video_id)
-        return "shorts_skipped"
+        subscription = await owner._remove_pending_youtube_video(subscription, video_id)
+        return _result("shorts_skipped")
 
-    await owner._remove_pending_youtube_video(subscription, video_id)
-    return "not_live"
+    subscription = await owner._remove_pending_youtube_video(subscription, video_id)
+    return _result("not_live")
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+from collections.abc import Iterable
 from typing import Any, Protocol
 
+import httplib2
+from googleapiclient.http import build_http
+
 from util.youtube.websub import YouTubeVideoLiveStatus, classify_video_item
 
 
+# videos.list 한 번에 조회할 수 있는 최대 id 수
+YOUTUBE_VIDEOS_LIST_MAX_IDS = 50
+YOUTUBE_VIDEO_STATUS_PARTS = "snippet,liveStreamingDetails,status,contentDetails"
+
+# 공유 client의 httplib2 연결은 스레드 안전하지 않으므로 요청은 스레드별 연결로 보낸다
+_thread_http = threading.local()
+
+
 class YouTubeVideosListRequest(Protocol):
-    def execute(self) -> dict[str, Any]: ...
+    def execute(self, http: httplib2.Http | None = None) -> dict[str, Any]: ...
 
 
 class YouTubeVideosResource(Protocol):
@@ -18,6 +31,15 @@ class YouTubeClient(Protocol):
     def videos(self) -> YouTubeVideosResource: ...
 
 
+def thread_youtube_http() -> httplib2.Http:
+    """현재 작업 스레드 전용 HTTP 연결을 돌려준다. 처음 쓰는 스레드에서 만든다."""
+    http = getattr(_thread_http, "http", None)
+    if http is None:
+        http = build_http()
+        _thread_http.http = http
+    return http
+
+
 async def fetch_youtube_video_status(
     youtube: YouTubeClient,
     video_id: str,
@@ -26,14 +48,48 @@ async def fetch_youtube_video_status(
         response = (
             youtube.videos()
             .list(
-                part="snippet,liveStreamingDetails,status,contentDetails",
+                part=YOUTUBE_VIDEO_STATUS_PARTS,
                 id=video_id,
                 maxResults=1,
             )
-            .execute()
+            .execute(http=thread_youtube_http())
         )
         items = response.get("items", [])
         return items[0] if items else None
 
     item = await asyncio.to_thread(_fetch_video_item)
     return classify_video_item(item) if item else None
+
+
+async def fetch_youtube_video_statuses(
+    youtube: YouTubeClient,
+    video_ids: Iterable[str],
+) -> dict[str, YouTubeVideoLiveStatus]:
+    """여러 영상 상태를 50개씩 묶어 조회한다. 찾을 수 없는 영상은 결과에 없다."""
+    unique_ids = list(dict.fromkeys(str(video_id) for video_id in video_ids if video_id))
+    if not unique_ids:
+        return {}
+
+    def _fetch_video_items() -> list[dict[str, Any]]:
+        items: list[dict[str, Any]] = []
+        for start in range(0, len(unique_ids), YOUTUBE_VIDEOS_LIST_MAX_IDS):
+            chunk = unique_ids[start : start + YOUTUBE_VIDEOS_LIST_MAX_IDS]
+            response = (
+                youtube.videos()
+                .list(
+                    part=YOUTUBE_VIDEO_STATUS_PARTS,
+                    id=",".join(chunk),
+                    maxResults=len(chunk),
+                )
+                .execute(http=thread_youtube_http())
+            )
+            items.extend(response.get("items", []))
+        return items
+
+    items = await asyncio.to_thread(_fetch_video_items)
+    statuses: dict[str, YouTubeVideoLiveStatus] = {}
+    for item in items:
+        status = classify_video_item(item)
+        if status.video_id:
+            statuses[status.video_id] = status
+    return statuses
@@ -1,49 +1,73 @@
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable, Sequence
+import logging
+from collections.abc import Awaitable, Callable, Mapping, Sequence
 from typing import Any
 
+from googleapiclient.errors import HttpError
+
 from util.youtube.subscriptions import (
     YouTubeSubscription,
     find_youtube_subscriptions_by_channel_id,
 )
-from util.youtube.websub import parse_youtube_atom_entries
+from util.youtube.websub import YouTubeAtomEntry, YouTubeVideoLiveStatus
 
 
 FindSubscriptions = Callable[[str], Awaitable[Sequence[YouTubeSubscription]]]
-ProcessVideoCandidate = Callable[[YouTubeSubscription, str], Awaitable[str]]
+ProcessVideoCandidate = Callable[..., Awaitable[str]]
+FetchVideoStatuses = Callable[
+    [Sequence[str]],
+    Awaitable[Mapping[str, YouTubeVideoLiveStatus]],
+]
+
+logger = logging.getLogger(__name__)
 
 
-async def handle_youtube_websub_notification(
-    atom_xml: str,
+async def handle_youtube_websub_entry(
+    entry: YouTubeAtomEntry,
     *,
     process_video_candidate: ProcessVideoCandidate,
     find_subscriptions: FindSubscriptions = find_youtube_subscriptions_by_channel_id,
-) -> dict[str, Any]:
-    entries = parse_youtube_atom_entries(atom_xml)
+    fetch_video_statuses: FetchVideoStatuses | None = None,
+) -> list[dict[str, Any]] | None:
+    """Atom 항목 하나를 구독별로 처리한다. 구독이 없으면 None을 돌려준다."""
+    subscriptions = await find_subscriptions(entry.channel_id)
+    if not subscriptions:
+        return None
 
-    result: dict[str, Any] = {
-        "received": len(entries),
-        "processed": 0,
-        "ignored": 0,
-        "results": [],
-    }
-    for entry in entries:
-        subscriptions = await find_subscriptions(entry.channel_id)
-        if not subscriptions:
-            result["ignored"] += 1
-            continue
-
-        for subscription in subscriptions:
-            outcome = await process_video_candidate(subscription, entry.video_id)
-            result["processed"] += 1
-            result["results"].append(
-                {
-                    "guild_id": subscription.guild_id,
-                    "subscription_id": subscription.id,
-                    "video_id": entry.video_id,
-                    "status": outcome,
-                }
+    # 같은 채널을 구독한 길드가 여럿이면 영상 상태를 한 번만 조회해 나눠 쓴다
+    candidate_kwargs: dict[str, Any] = {}
+    if fetch_video_statuses is not None and len(subscriptions) > 1:
+        try:
+            candidate_kwargs["known_statuses"] = await fetch_video_statuses(
+                [entry.video_id]
             )
+        except HttpError:
+            logger.exception("YouTube videos.list 에러: video_id=%s", entry.video_id)
+            return [
+                _entry_result(subscription, entry.video_id, "error")
+                for subscription in subscriptions
+            ]
 
-    return result
+    results: list[dict[str, Any]] = []
+    for subscription in subscriptions:
+        outcome = await process_video_candidate(
+            subscription,
+            entry.video_id,
+            **candidate_kwargs,
+        )
+        results.append(_entry_result(subscription, entry.video_id, outcome))
+    return results
+
+
+def _entry_result(
+    subscription: YouTubeSubscription,
+    video_id: str,
+    outcome: str,
+) -> dict[str, Any]:
+    return {
+        "guild_id": subscription.guild_id,
+        "subscription_id": subscription.id,
+        "video_id": video_id,
+        "status": outcome,
+    }
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from util.youtube.websub import YouTubeAtomEntry, parse_youtube_atom_entries
+
+
+logger = logging.getLogger(__name__)
+
+YOUTUBE_WEBSUB_QUEUE_MAX_SIZE = 256
+YOUTUBE_WEBSUB_WORKER_COUNT = 2
+
+HandleWebSubEntry = Callable[[YouTubeAtomEntry], Awaitable[Any]]
+
+
+class YouTubeWebSubQueue:
+    """WebSub 알림을 즉시 받아두고 워커가 나중에 처리하는 제한 크기 큐.
+
+    대기 중이거나 처리 중인 같은 영상 알림은 하나로 합친다. 워커는 처리 시점의
+    영상 상태를 새로 조회하므로 알림 하나만 남겨도 충분하고, 처리 중인 영상을
+    다시 받지 않아야 두 워커가 같은 영상을 중복 알리지 않는다.
+    """
+
+    def __init__(
+        self,
+        handle_entry: HandleWebSubEntry,
+        *,
+        maxsize: int = YOUTUBE_WEBSUB_QUEUE_MAX_SIZE,
+        workers: int = YOUTUBE_WEBSUB_WORKER_COUNT,
+    ) -> None:
+        self._handle_entry = handle_entry
+        self._maxsize = maxsize
+        self._worker_count = max(1, workers)
+        self._queue: asyncio.Queue[YouTubeAtomEntry] | None = None
+        self._queued_video_ids: set[str] = set()
+        self._in_flight_video_ids: set[str] = set()
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def pending_count(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def enqueue(self, atom_xml: str) -> dict[str, Any]:
+        """Atom 본문을 파싱해 큐에 넣는다. XML 오류는 ElementTree.ParseError로 올라간다."""
+        entries = parse_youtube_atom_entries(atom_xml)
+        queue = self._ensure_workers()
+
+        result: dict[str, Any] = {
+            "received": len(entries),
+            "queued": 0,
+            "duplicates": 0,
+            "dropped": 0,
+        }
+        for entry in entries:
+            if (
+                entry.video_id in self._queued_video_ids
+                or entry.video_id in self._in_flight_video_ids
+            ):
+                result["duplicates"] += 1
+                continue
+            try:
+                queue.put_nowait(entry)
+            except asyncio.QueueFull:
+                result["dropped"] += 1
+                logger.warning(
+                    "YouTube WebSub 큐가 가득 차 알림을 버립니다: video_id=%s channel_id=%s",
+                    entry.video_id,
+                    entry.channel_id,
+                )
+                continue
+            self._queued_video_ids.add(entry.video_id)
+            result["queued"] += 1
+        return result
+
+    def _ensure_workers(self) -> asyncio.Queue[YouTubeAtomEntry]:
+        # 이벤트 루프 안에서 처음 호출될 때 큐와 워커를 만든다
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self._worker_count:
+            self._workers.append(asyncio.create_task(self._worker(self._queue)))
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue[YouTubeAtomEntry]) -> None:
+        while True:
+            entry = await queue.get()
+            self._queued_video_ids.discard(entry.video_id)
+            self._in_flight_video_ids.add(entry.video_id)
+            try:
+                await self._handle_entry(entry)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(
+                    "YouTube WebSub 알림 처리 실패: video_id=%s channel_id=%s",
+                    entry.video_id,
+                    entry.channel_id,
+                )
+            finally:
+                self._in_flight_video_ids.discard(entry.video_id)
+                queue.task_done()
+
+    async def join(self) -> None:
+        if self._queue is not None:
+            await self._queue.join()
+
+    def cancel(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        self._workers = []